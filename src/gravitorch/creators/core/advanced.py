@@ -1,27 +1,28 @@
-__all__ = ["AdvancedCoreCreator"]
+from __future__ import annotations
 
-from typing import Optional, Union
+__all__ = ["AdvancedCoreCreator"]
 
-from torch.nn import Module
-from torch.optim import Optimizer
+from typing import TYPE_CHECKING, Optional, Union
 
 from gravitorch.creators.core.base import BaseCoreCreator
-from gravitorch.creators.datasource.base import (
-    BaseDataSourceCreator,
-    setup_data_source_creator,
-)
-from gravitorch.creators.lr_scheduler import (
-    BaseLRSchedulerCreator,
-    setup_lr_scheduler_creator,
-)
-from gravitorch.creators.model import BaseModelCreator, setup_model_creator
-from gravitorch.creators.optimizer.base import BaseOptimizerCreator
+from gravitorch.creators.datasource.base import setup_data_source_creator
+from gravitorch.creators.lr_scheduler import setup_lr_scheduler_creator
+from gravitorch.creators.model import setup_model_creator
 from gravitorch.creators.optimizer.utils import setup_optimizer_creator
-from gravitorch.datasources.base import BaseDataSource
-from gravitorch.engines.base import BaseEngine
-from gravitorch.lr_schedulers.base import LRSchedulerType
 from gravitorch.utils.format import str_indent
 
+if TYPE_CHECKING:
+    from torch.nn import Module
+    from torch.optim import Optimizer
+
+    from gravitorch.creators.datasource.base import BaseDataSourceCreator
+    from gravitorch.creators.lr_scheduler import BaseLRSchedulerCreator
+    from gravitorch.creators.model import BaseModelCreator
+    from gravitorch.creators.optimizer.base import BaseOptimizerCreator
+    from gravitorch.datasources.base import BaseDataSource
+    from gravitorch.engines.base import BaseEngine
+    from gravitorch.lr_schedulers.base import LRSchedulerType
+
 
 class AdvancedCoreCreator(BaseCoreCreator):
     r"""Implements an advanced core engine moules creator.
@@ -40,6 +41,13 @@ class AdvancedCoreCreator(BaseCoreCreator):
             configuration. Default: ``None``
     """
 
+    __slots__ = (
+        "_data_source_creator",
+        "_model_creator",
+        "_optimizer_creator",
+        "_lr_scheduler_creator",
+    )
+
     def __init__(
         self,
         data_source_creator: Union[BaseDataSourceCreator, dict],
@@ -53,14 +61,13 @@ class AdvancedCoreCreator(BaseCoreCreator):
         self._lr_scheduler_creator = setup_lr_scheduler_creator(lr_scheduler_creator)
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__qualname__}(\n"
-            f"  data_source_creator={str_indent(self._data_source_creator)},\n"
-            f"  model_creator={str_indent(self._model_creator)},\n"
-            f"  optimizer_creator={str_indent(self._optimizer_creator)},\n"
-            f"  lr_scheduler_creator={str_indent(self._lr_scheduler_creator)},\n"
-            ")"
+        lines = (
+            f"  data_source_creator={str_indent(self._data_source_creator)}",
+            f"  model_creator={str_indent(self._model_creator)}",
+            f"  optimizer_creator={str_indent(self._optimizer_creator)}",
+            f"  lr_scheduler_creator={str_indent(self._lr_scheduler_creator)}",
         )
+        return f"{self.__class__.__qualname__}(\n" + ",\n".join(lines) + ",\n)"
 
     def create(
         self, engine: BaseEngine
@@ -34,6 +34,8 @@ class BaseCoreCreator(ABC, metaclass=AbstractFactory):
     this class.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def create(
         self, engine: BaseEngine
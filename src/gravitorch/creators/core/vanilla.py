@@ -1,20 +1,25 @@
-__all__ = ["VanillaCoreCreator"]
+from __future__ import annotations
 
-from typing import Optional, Union
+__all__ = ["VanillaCoreCreator"]
 
-from torch import nn
-from torch.optim import Optimizer
+from typing import TYPE_CHECKING, Optional, Union
 
 from gravitorch import constants as ct
 from gravitorch.creators.core.base import BaseCoreCreator
-from gravitorch.datasources.base import BaseDataSource
 from gravitorch.datasources.utils import setup_data_source
-from gravitorch.engines.base import BaseEngine
-from gravitorch.lr_schedulers.base import LRSchedulerType, setup_lr_scheduler
+from gravitorch.lr_schedulers.base import setup_lr_scheduler
 from gravitorch.models.utils import setup_model
 from gravitorch.optimizers.factory import setup_optimizer
 from gravitorch.utils.format import str_indent
 
+if TYPE_CHECKING:
+    from torch import nn
+    from torch.optim import Optimizer
+
+    from gravitorch.datasources.base import BaseDataSource
+    from gravitorch.engines.base import BaseEngine
+    from gravitorch.lr_schedulers.base import LRSchedulerType
+
 
 class VanillaCoreCreator(BaseCoreCreator):
     r"""Implements a simple core engine moules creator.
@@ -38,6 +43,8 @@ class VanillaCoreCreator(BaseCoreCreator):
             Default: ``None``
     """
 
+    __slots__ = ("_data_source", "_model", "_optimizer", "_lr_scheduler")
+
     def __init__(
         self,
         data_source: Union[BaseDataSource, dict],
@@ -53,14 +60,13 @@ class VanillaCoreCreator(BaseCoreCreator):
         )
 
     def __repr__(self) -> str:
-        return (
-            f"{self.__class__.__qualname__}(\n"
-            f"  data_source={str_indent(self._data_source)},\n"
-            f"  model={str_indent(self._model)},\n"
-            f"  optimizer={str_indent(self._optimizer)},\n"
-            f"  lr_scheduler={str_indent(self._lr_scheduler)},\n"
-            ")"
+        lines = (
+            f"  data_source={str_indent(self._data_source)}",
+            f"  model={str_indent(self._model)}",
+            f"  optimizer={str_indent(self._optimizer)}",
+            f"  lr_scheduler={str_indent(self._lr_scheduler)}",
         )
+        return f"{self.__class__.__qualname__}(\n" + ",\n".join(lines) + ",\n)"
 
     def create(
         self, engine: BaseEngine
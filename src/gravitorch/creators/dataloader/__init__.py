@@ -5,6 +5,7 @@ __all__ = [
     "BaseDataLoaderCreator",
     "DistributedDataLoaderCreator",
     "VanillaDataLoaderCreator",
+    "WarmupDataLoaderCreator",
     "setup_data_loader_creator",
 ]
 
@@ -15,3 +16,4 @@ from gravitorch.creators.dataloader.pytorch import (
     VanillaDataLoaderCreator,
 )
 from gravitorch.creators.dataloader.utils import setup_data_loader_creator
+from gravitorch.creators.dataloader.warmup import WarmupDataLoaderCreator
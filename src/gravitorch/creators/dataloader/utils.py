@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 def setup_data_loader_creator(
-    creator: Union[BaseDataLoaderCreator, dict, None]
+    creator: Union[BaseDataLoaderCreator, dict, None], prefetch_init: bool = False
 ) -> BaseDataLoaderCreator:
     r"""Sets up a data loader creator.
 
@@ -23,6 +23,10 @@ def setup_data_loader_creator(
             Specifies the data loader creator or its configuration.
             If ``None``, a data loader creator will be created
             automatically.
+        prefetch_init (bool, optional): If ``True``, the data loader
+            creator is wrapped in a ``WarmupDataLoaderCreator`` to
+            start the data loader workers when the data loader is
+            created. Default: ``False``
 
     Returns:
     -------
@@ -36,4 +40,9 @@ def setup_data_loader_creator(
             f"{str_target_object(creator)}"
         )
         creator = BaseDataLoaderCreator.factory(**creator)
+    if prefetch_init:
+        # Import is here to avoid cyclic import
+        from gravitorch.creators.dataloader.warmup import WarmupDataLoaderCreator
+
+        creator = WarmupDataLoaderCreator(creator)
     return creator
@@ -0,0 +1,95 @@
+r"""This module implements a data loader creator that starts the data
+loader workers when the data loader is created."""
+
+__all__ = ["WarmupDataLoaderCreator"]
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Optional, TypeVar, Union
+
+from torch.utils.data import DataLoader, Dataset
+
+from gravitorch.creators.dataloader.base import BaseDataLoaderCreator
+from gravitorch.creators.dataloader.utils import setup_data_loader_creator
+from gravitorch.engines.base import BaseEngine
+from gravitorch.utils.format import str_indent
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WarmupDataLoaderCreator(BaseDataLoaderCreator[T]):
+    r"""Implements a data loader creator that starts the workers of the data
+    loader when it is created.
+
+    The workers of a PyTorch data loader are started when the first
+    iterator is created. The heavy initialization of the workers
+    (e.g. loading buffers) then blocks the first iteration. This data
+    loader creator creates an iterator as soon as the data loader is
+    created, so the workers start to load the data in the background
+    while the main process continues. The data loader is wrapped so
+    the first iteration reuses this iterator and its prefetched
+    batches. The next iterations create new iterators as usual.
+
+    The sampler and the worker seeds are drawn when the data loader is
+    created instead of when the first iteration starts. The batch order
+    of the first iteration does not change if the data loader uses its
+    own random number generator, or if the global random number
+    generator is not used between the creation and the first
+    iteration. The warm-up is skipped for the data loaders without
+    workers.
+
+    Args:
+    ----
+        data_loader_creator (``BaseDataLoaderCreator`` or dict):
+            Specifies the data loader creator or its configuration.
+    """
+
+    def __init__(self, data_loader_creator: Union[BaseDataLoaderCreator[T], dict]) -> None:
+        self._data_loader_creator = setup_data_loader_creator(data_loader_creator)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(\n"
+            f"  data_loader_creator={str_indent(str(self._data_loader_creator))},\n"
+            ")"
+        )
+
+    def create(self, dataset: Dataset, engine: Optional[BaseEngine] = None) -> Iterable[T]:
+        data_loader = self._data_loader_creator.create(dataset=dataset, engine=engine)
+        if not isinstance(data_loader, DataLoader) or data_loader.num_workers == 0:
+            logger.warning(
+                "The data loader workers are not started in advance because the data loader "
+                "does not use workers"
+            )
+            return data_loader
+        logger.info("Starting the data loader workers...")
+        return _WarmDataLoader(data_loader)
+
+
+class _WarmDataLoader(Iterable[T]):
+    r"""Implements a wrapper that reuses the first iterator of a data loader.
+
+    Args:
+    ----
+        data_loader (``torch.utils.data.DataLoader``): Specifies the
+            data loader. Its first iterator is created when the
+            wrapper is created.
+    """
+
+    def __init__(self, data_loader: DataLoader[T]) -> None:
+        self._data_loader = data_loader
+        self._iterator: Optional[Iterator[T]] = iter(data_loader)
+
+    def __iter__(self) -> Iterator[T]:
+        if self._iterator is None:
+            return iter(self._data_loader)
+        iterator, self._iterator = self._iterator, None
+        return iterator
+
+    def __len__(self) -> int:
+        return len(self._data_loader)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(data_loader={self._data_loader})"
@@ -3,6 +3,7 @@ __all__ = ["VanillaModelCreator"]
 import logging
 from typing import Union
 
+import torch
 from torch import nn
 
 from gravitorch import constants as ct
@@ -38,6 +39,10 @@ class VanillaModelCreator(BaseModelCreator):
             placement module. This module moves the model on a target
             device. If ``None``, an ``AutoDevicePlacement`` object is
             instantiated. Default: ``None``
+        channels_last (bool, optional): If ``True``, the model is
+            converted to the channels last memory format after it is
+            sent to the target device. Only the 4D parameters and
+            buffers are converted. Default: ``False``
     """
 
     def __init__(
@@ -46,11 +51,13 @@ class VanillaModelCreator(BaseModelCreator):
         attach_model_to_engine: bool = True,
         add_module_to_engine: bool = True,
         device_placement: Union[BaseDevicePlacement, dict, None] = None,
+        channels_last: bool = False,
     ) -> None:
         self._model_config = model_config
         self._attach_model_to_engine = bool(attach_model_to_engine)
         self._add_module_to_engine = bool(add_module_to_engine)
         self._device_placement = setup_device_placement(device_placement or AutoDevicePlacement())
+        self._channels_last = bool(channels_last)
 
     def __repr__(self) -> str:
         return (
@@ -58,6 +65,7 @@ class VanillaModelCreator(BaseModelCreator):
             f"  attach_model_to_engine={self._attach_model_to_engine},\n"
             f"  add_module_to_engine={self._add_module_to_engine},\n"
             f"  device_placement={str_indent(self._device_placement)},\n"
+            f"  channels_last={self._channels_last},\n"
             ")"
         )
 
@@ -68,6 +76,8 @@ class VanillaModelCreator(BaseModelCreator):
         else:
             model = setup_model(model=self._model_config)
         model = self._device_placement.send(model)
+        if self._channels_last:
+            model = model.to(memory_format=torch.channels_last)
         if self._add_module_to_engine:
             logger.info(f"Adding a model to the engine state (key: {ct.MODEL})...")
             engine.add_module(ct.MODEL, model)
@@ -17,6 +17,8 @@ T = TypeVar("T")
 class BaseDataCreator(ABC, Generic[T], metaclass=AbstractFactory):
     r"""Defines the base class to implement a data creator."""
 
+    __slots__ = ()
+
     @abstractmethod
     def create(self, engine: Optional[BaseEngine] = None) -> T:
         r"""Creates data.
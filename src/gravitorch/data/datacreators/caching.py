@@ -1,9 +1,14 @@
 __all__ = ["OneCacheDataCreator"]
 
 import copy
+import functools
 import logging
+import pickle
 from typing import Any, Optional, TypeVar, Union
 
+import numpy as np
+import torch
+
 from gravitorch.data.datacreators import BaseDataCreator, setup_data_creator
 from gravitorch.engines.base import BaseEngine
 from gravitorch.utils.format import str_indent
@@ -27,17 +32,29 @@ class OneCacheDataCreator(BaseDataCreator[T]):
             the data pipeline does not contain any in-place operations
             over the data to prevent data inconsistency if the
             ``create`` method is called multiple times.
+        readonly (bool, optional): If ``True``, the cached data are
+            frozen when the cache is created: the NumPy arrays are
+            marked as non-writeable and the tensors are detached
+            from the computational graph. The cached data are then
+            returned without copy. Note that PyTorch does not support
+            read-only tensors, so the in-place operations on tensors
+            are not detected. Default: ``False``
     """
 
+    __slots__ = ("_data_creator", "_deepcopy", "_readonly", "_is_cache_created", "_cached_data")
+
     def __init__(
-        self, data_creator: Union[BaseDataCreator[T], dict], deepcopy: bool = False
+        self,
+        data_creator: Union[BaseDataCreator[T], dict],
+        deepcopy: bool = False,
+        readonly: bool = False,
     ) -> None:
         self._data_creator = setup_data_creator(data_creator)
         self._deepcopy = bool(deepcopy)
+        self._readonly = bool(readonly)
+        # The slot ``_cached_data`` is set only when the cache is created. Its type depends on
+        # the value returned by the function ``create`` of the data creator object.
         self._is_cache_created = False
-        # This variable is used to cache the data. The type depends on the value returned by
-        # the function ``create`` of the data creator object.
-        self._cached_data: Any = None
 
     def __repr__(self) -> str:
         return (
@@ -45,6 +62,7 @@ class OneCacheDataCreator(BaseDataCreator[T]):
             f"  data_creator={str_indent(self._data_creator)},\n"
             f"  is_cache_created={self._is_cache_created},\n"
             f"  deepcopy={self._deepcopy},\n"
+            f"  readonly={self._readonly},\n"
             ")"
         )
 
@@ -60,6 +78,11 @@ class OneCacheDataCreator(BaseDataCreator[T]):
         """
         return self._deepcopy
 
+    @property
+    def readonly(self) -> bool:
+        r"""bool: Indicates if the cached data are frozen."""
+        return self._readonly
+
     def create(self, engine: Optional[BaseEngine] = None) -> T:
         r"""Creates data.
 
@@ -76,14 +99,111 @@ class OneCacheDataCreator(BaseDataCreator[T]):
         if not self._is_cache_created:
             logger.info("Creating data and caching them...")
             self._cached_data = self._data_creator.create(engine)
+            if self._readonly:
+                self._cached_data = _freeze(self._cached_data)
             self._is_cache_created = True
         data = self._cached_data
         if self._deepcopy:
             try:
-                data = copy.deepcopy(data)
+                data = _fast_deepcopy(data)
             except TypeError:
                 logger.warning(
                     "The data can not be deepcopied. "
                     "Please be aware of in-place modification would affect source data"
                 )
         return data
+
+
+@functools.singledispatch
+def _fast_deepcopy(obj: Any) -> Any:
+    r"""Computes a deepcopy of an object.
+
+    The tensors and arrays are copied with their native copy function,
+    and the standard containers (``dict``, ``list`` and ``tuple``) are
+    copied recursively. The other objects are copied with a pickle
+    round-trip, which is usually faster than ``copy.deepcopy``. If the
+    object cannot be pickled, ``copy.deepcopy`` is used.
+
+    Note: unlike ``copy.deepcopy``, the references shared between
+    several tensors/arrays of a container are not preserved.
+
+    Args:
+    ----
+        obj: Specifies the object to copy.
+
+    Returns:
+    -------
+        A deepcopy of the object.
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        _log_pickle_fallback()
+        return copy.deepcopy(obj)
+
+
+@_fast_deepcopy.register
+def _(obj: dict) -> dict:
+    if type(obj) is not dict:
+        return _fast_deepcopy.dispatch(object)(obj)
+    return {key: _fast_deepcopy(value) for key, value in obj.items()}
+
+
+@_fast_deepcopy.register
+def _(obj: list) -> list:
+    if type(obj) is not list:
+        return _fast_deepcopy.dispatch(object)(obj)
+    return [_fast_deepcopy(value) for value in obj]
+
+
+@_fast_deepcopy.register
+def _(obj: tuple) -> tuple:
+    if type(obj) is not tuple:
+        # The subclasses of tuple (e.g. named tuples) use the generic path.
+        return _fast_deepcopy.dispatch(object)(obj)
+    return tuple(_fast_deepcopy(value) for value in obj)
+
+
+@_fast_deepcopy.register
+def _(obj: torch.Tensor) -> torch.Tensor:
+    return obj.detach().clone().requires_grad_(obj.requires_grad)
+
+
+@_fast_deepcopy.register
+def _(obj: np.ndarray) -> np.ndarray:
+    return obj.copy()
+
+
+def _freeze(obj: Any) -> Any:
+    r"""Freezes the tensors and arrays of an object.
+
+    The NumPy arrays are marked as non-writeable and the tensors are
+    detached from the computational graph. The standard containers
+    (``dict``, ``list`` and ``tuple``) are explored recursively. The
+    data are not copied.
+
+    Args:
+    ----
+        obj: Specifies the object to freeze.
+
+    Returns:
+    -------
+        The frozen object.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.detach()
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+        return obj
+    if type(obj) is dict:
+        return {key: _freeze(value) for key, value in obj.items()}
+    if type(obj) in (list, tuple):
+        return type(obj)(_freeze(value) for value in obj)
+    return obj
+
+
+@functools.lru_cache(maxsize=1)
+def _log_pickle_fallback() -> None:
+    r"""Logs a message the first time ``copy.deepcopy`` is used because
+    the data cannot be pickled."""
+    logger.info("The data cannot be pickled so copy.deepcopy is used to copy them")
@@ -126,10 +126,11 @@ class HypercubeVertexDataCreator(BaseDataCreator[dict]):
             0, self._num_classes, (self._num_examples,), generator=self._torch_rng
         )
         # Generate the features. Each class should be a vertex of the hyper-cube plus some noise.
+        # The operations are done in-place to avoid allocating other tensors of this size.
         features = torch.randn(
             self._num_examples, self._feature_size, generator=self._torch_rng
-        ).mul(self._noise_std)
+        ).mul_(self._noise_std)
         features.scatter_add_(
-            1, targets.view(self._num_examples, 1), torch.ones(self._num_examples, 1)
+            1, targets.view(self._num_examples, 1), torch.ones(1, 1).expand(self._num_examples, 1)
         )
         return {ct.TARGET: targets, ct.INPUT: features}
@@ -3,7 +3,9 @@ r"""This module implements PyTorch sampler functions for data loaders."""
 __all__ = ["ReproducibleBatchSampler", "PartialSequentialSampler", "PartialRandomSampler"]
 
 from collections.abc import Generator, Iterator, Sized
+from itertools import islice
 
+import numpy as np
 import torch
 from torch.utils.data import BatchSampler, Sampler
 
@@ -11,8 +13,11 @@ from torch.utils.data import BatchSampler, Sampler
 class ReproducibleBatchSampler(BatchSampler):
     r"""Implements a reproducible batch sampler.
 
-    This class is inspired from PyTorch Ignite. Internally, this class
-    iterates and stores indices of the input batch sampler.
+    This class is inspired from PyTorch Ignite. If the input batch
+    sampler is a ``torch.utils.data.BatchSampler``, the indices of the
+    skipped batches are dropped directly from its sampler, so the
+    skipped batches are never built. The other batch samplers are
+    iterated and their first batches are skipped.
 
     Args:
     ----
@@ -55,10 +60,18 @@ class ReproducibleBatchSampler(BatchSampler):
         self._start_iteration = start_iteration
 
     def __iter__(self) -> Generator:
-        yield from list(self.batch_sampler)[self._start_iteration :]
+        if type(self.batch_sampler) is not BatchSampler:
+            yield from islice(self.batch_sampler, self._start_iteration, None)
+            return
+        batch_size = self.batch_sampler.batch_size
+        indices = islice(self.batch_sampler.sampler, self._start_iteration * batch_size, None)
+        while batch := list(islice(indices, batch_size)):
+            if len(batch) < batch_size and self.batch_sampler.drop_last:
+                return
+            yield batch
 
     def __len__(self) -> int:
-        return len(self.batch_sampler)
+        return max(0, len(self.batch_sampler) - self._start_iteration)
 
 
 class PartialSequentialSampler(Sampler):
@@ -83,17 +96,40 @@ class PartialSequentialSampler(Sampler):
                 f"num_samples should be a positive integer value, but got {num_samples}"
             )
         self.num_samples = num_samples
+        # The dataset size is assumed to be static.
+        self._data_len = len(data_source)
+        self._n = min(self._data_len, num_samples)
 
     def __iter__(self) -> Iterator:
-        return iter(range(len(self)))
+        return iter(range(self._n))
 
     def __len__(self) -> int:
-        return min(len(self.data_source), self.num_samples)
+        return self._n
 
 
 class PartialRandomSampler(PartialSequentialSampler):
     r"""Implements a partial random sampler that samples randomly some items of
-    the dataset."""
+    the dataset.
+
+    If the number of samples to draw is small with respect to the
+    dataset size (less than 10%), the items are sampled without
+    computing a full permutation of the dataset. The random number
+    generator used in this case is seeded with the PyTorch random
+    number generator at each iteration, so the sampled items follow
+    the PyTorch random number generator state in both cases.
+
+    Args:
+    ----
+        data_source (``Sized``): Specifies the dataset to sample
+            from.
+        num_samples (int): Specifies the number of samples to draw.
+            If the number of samples is bigger than the number of
+            samples in the dataset, the number of samples to draw
+            is the dataset size.
+    """
 
     def __iter__(self) -> Iterator:
-        return iter(torch.randperm(len(self.data_source))[: self.num_samples].tolist())
+        if self._n * 10 < self._data_len:
+            rng = np.random.default_rng(torch.randint(0, 2**63 - 1, size=(1,)).item())
+            return iter(rng.choice(self._data_len, size=self._n, replace=False).tolist())
+        return iter(torch.randperm(self._data_len)[: self._n].tolist())
@@ -7,6 +7,8 @@ __all__ = [
     "Looper",
     "PathLister",
     "PickleSaver",
+    "PinMemory",
+    "Prefetcher",
     "PyTorchSaver",
     "SourceWrapper",
     "TensorDictShuffler",
@@ -31,6 +33,10 @@ from gravitorch.data.datapipes.iter.length import LooperIterDataPipe as Looper
 from gravitorch.data.datapipes.iter.path import DirFilterIterDataPipe as DirFilter
 from gravitorch.data.datapipes.iter.path import FileFilterIterDataPipe as FileFilter
 from gravitorch.data.datapipes.iter.path import PathListerIterDataPipe as PathLister
+from gravitorch.data.datapipes.iter.pinning import PinMemoryIterDataPipe as PinMemory
+from gravitorch.data.datapipes.iter.prefetching import (
+    PrefetcherIterDataPipe as Prefetcher,
+)
 from gravitorch.data.datapipes.iter.saving import PickleSaverIterDataPipe as PickleSaver
 from gravitorch.data.datapipes.iter.saving import (
     PyTorchSaverIterDataPipe as PyTorchSaver,
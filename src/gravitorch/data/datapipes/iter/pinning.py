@@ -0,0 +1,67 @@
+__all__ = ["PinMemoryIterDataPipe"]
+
+from collections.abc import Iterator
+from typing import Optional, TypeVar
+
+import torch
+from torch.utils.data import IterDataPipe
+from torch.utils.data._utils.pin_memory import pin_memory
+
+from gravitorch.utils.format import str_indent
+
+T = TypeVar("T")
+
+
+class PinMemoryIterDataPipe(IterDataPipe[T]):
+    r"""Implements a DataPipe that copies the tensors of each item into
+    page-locked (pinned) memory.
+
+    Pinned memory allows to use asynchronous host to device copies
+    i.e. ``tensor.to(device, non_blocking=True)``. The tensors are
+    found recursively in mappings, sequences and named tuples. The
+    custom types have to implement a ``pin_memory`` method, otherwise
+    they are returned unchanged. The items are returned unchanged if
+    CUDA is not available.
+
+    Args:
+    ----
+        datapipe (``torch.utils.data.IterDataPipe``): Specifies
+            the source iterable DataPipe.
+        device (str or ``None``, optional): Specifies the device
+            the memory is pinned for. If ``None``, the memory is
+            pinned for the current accelerator device.
+            Default: ``None``
+
+    Example usage:
+
+    .. code-block:: python
+
+        >>> import torch
+        >>> from gravitorch.data.datapipes.iter import PinMemory, SourceWrapper
+        >>> dp = PinMemory(SourceWrapper([torch.ones(2), torch.zeros(2)]))
+        >>> list(dp)
+        [tensor([1., 1.]), tensor([0., 0.])]
+    """
+
+    def __init__(self, datapipe: IterDataPipe[T], device: Optional[str] = None) -> None:
+        self._datapipe = datapipe
+        self._device = device
+
+    def __iter__(self) -> Iterator[T]:
+        if not torch.cuda.is_available():
+            # Same behavior as ``torch.utils.data.DataLoader``: the memory is
+            # pinned only if CUDA is available.
+            yield from self._datapipe
+            return
+        for item in self._datapipe:
+            yield pin_memory(item, device=self._device)
+
+    def __len__(self) -> int:
+        return len(self._datapipe)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(\n"
+            f"  device={self._device},\n"
+            f"  datapipe={str_indent(self._datapipe)},\n)"
+        )
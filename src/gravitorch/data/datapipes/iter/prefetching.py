@@ -0,0 +1,126 @@
+__all__ = ["PrefetcherIterDataPipe"]
+
+import queue
+import threading
+from collections.abc import Iterator
+from typing import TypeVar
+
+from torch.utils.data import IterDataPipe
+
+from gravitorch.utils.format import str_indent
+
+T = TypeVar("T")
+
+# Sentinel object used to indicate the end of the source DataPipe.
+_END = object()
+
+
+class PrefetcherIterDataPipe(IterDataPipe[T]):
+    r"""Implements a DataPipe that prefetches the items of the source
+    DataPipe in a background thread.
+
+    The items of the source DataPipe are computed in a background
+    thread and stored in a buffer, so the computation of the next
+    items overlaps with the processing of the current item. The
+    exceptions raised in the background thread are re-raised when
+    the corresponding item is requested.
+
+    Args:
+    ----
+        datapipe (``torch.utils.data.IterDataPipe``): Specifies
+            the source iterable DataPipe.
+        buffer_size (int, optional): Specifies the maximum number
+            of items stored in the buffer. Default: ``1``
+
+    Example usage:
+
+    .. code-block:: python
+
+        >>> from gravitorch.data.datapipes.iter import Prefetcher, SourceWrapper
+        >>> dp = Prefetcher(SourceWrapper([1, 2, 3, 4]), buffer_size=2)
+        >>> list(dp)
+        [1, 2, 3, 4]
+    """
+
+    def __init__(self, datapipe: IterDataPipe[T], buffer_size: int = 1) -> None:
+        self._datapipe = datapipe
+        if buffer_size < 1:
+            raise ValueError(
+                f"Incorrect buffer_size: {buffer_size}. The buffer size has to be greater or "
+                "equal to 1"
+            )
+        self._buffer_size = int(buffer_size)
+
+    def __iter__(self) -> Iterator[T]:
+        buffer = queue.Queue(maxsize=self._buffer_size)
+        stop_event = threading.Event()
+        thread = threading.Thread(target=self._prefetch, args=(buffer, stop_event), daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = buffer.get()
+                if item is _END:
+                    break
+                if isinstance(item, _ExceptionWrapper):
+                    raise item.exception
+                yield item
+        finally:
+            # Stops the background thread if the iteration is interrupted.
+            stop_event.set()
+            thread.join()
+
+    def __len__(self) -> int:
+        return len(self._datapipe)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(\n"
+            f"  buffer_size={self._buffer_size:,},\n"
+            f"  datapipe={str_indent(self._datapipe)},\n)"
+        )
+
+    def _prefetch(self, buffer: queue.Queue, stop_event: threading.Event) -> None:
+        r"""Iterates over the source DataPipe and stores the items in the
+        buffer.
+
+        Args:
+        ----
+            buffer (``queue.Queue``): Specifies the buffer used to
+                store the items.
+            stop_event (``threading.Event``): Specifies the event
+                used to stop the iteration.
+        """
+        try:
+            for item in self._datapipe:
+                if not self._put(buffer, item, stop_event):
+                    return
+        except BaseException as exc:  # noqa: BLE001
+            self._put(buffer, _ExceptionWrapper(exc), stop_event)
+        finally:
+            # The end sentinel is always added, so the consumer cannot wait forever for an
+            # item if the thread stops.
+            self._put(buffer, _END, stop_event)
+
+    @staticmethod
+    def _put(buffer: queue.Queue, item: object, stop_event: threading.Event) -> bool:
+        r"""Puts an item in the buffer unless the iteration is stopped.
+
+        Returns:
+        -------
+            bool: ``True`` if the item was added to the buffer,
+                ``False`` if the iteration was stopped.
+        """
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+class _ExceptionWrapper:
+    r"""Wraps an exception raised in the background thread."""
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
@@ -2,9 +2,13 @@ __all__ = ["SourceWrapperIterDataPipe"]
 
 import copy
 import logging
+import pickle
 from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Union
 
-from torch.utils.data import IterDataPipe
+import torch
+from torch.utils.data import IterDataPipe, get_worker_info
 
 from gravitorch.utils.format import str_indent
 from gravitorch.utils.summary import concise_summary
@@ -20,27 +24,65 @@ class SourceWrapperIterDataPipe(IterDataPipe):
     Args:
     ----
         source (``iterable``): Specifies the input iterable.
-        deepcopy (bool, optional): If ``True``, the input iterable
-            object is deep-copied before to iterate over the data.
-            It allows a deterministic behavior when in-place
-            operations are performed on the data. Default: ``False``
+        deepcopy (bool or str, optional): Specifies when the input
+            iterable object is deep-copied. The valid values are:
+
+                - ``'never'`` or ``False``: the input iterable is
+                    never deep-copied.
+                - ``'once'``: the input iterable is deep-copied only
+                    once when the DataPipe is created, then the
+                    DataPipe iterates over this copy. It protects
+                    the input iterable against the in-place
+                    operations, but the in-place operations performed
+                    during an iteration are visible in the next
+                    iterations.
+                - ``'always'`` or ``True``: the input iterable is
+                    deep-copied before each iteration over the data.
+                    It allows a deterministic behavior when in-place
+                    operations are performed on the data.
+
+            Default: ``False``
+        shard_by_worker (bool, optional): If ``True`` and the DataPipe
+            is iterated in a data loader worker, each worker only
+            iterates over its own shard of the input iterable i.e.
+            the items ``worker_id``, ``worker_id + num_workers``, etc.
+            The lists, tuples and tensors are sliced directly, the
+            other iterables skip the items of the other workers.
+            Do not use this option if the DataPipe graph already
+            contains a sharding DataPipe. Default: ``False``
     """
 
-    def __init__(self, source: Iterable, deepcopy: bool = False) -> None:
+    def __init__(
+        self, source: Iterable, deepcopy: Union[bool, str] = False, shard_by_worker: bool = False
+    ) -> None:
         self._source = source
-        self._deepcopy = bool(deepcopy)
+        self._shard_by_worker = bool(shard_by_worker)
+        self._deepcopy = _DEEPCOPY_MODES.get(deepcopy, deepcopy)
+        if self._deepcopy not in _DEEPCOPY_MODES.values():
+            raise ValueError(
+                f"Incorrect deepcopy value: {deepcopy}. The valid values are: "
+                f"{True}, {False}, 'never', 'once' and 'always'"
+            )
+        if self._deepcopy == "once":
+            self._source = _deepcopy_source(source)
 
     def __iter__(self) -> Iterator:
         source = self._source
-        if self._deepcopy:
-            try:
-                source = copy.deepcopy(source)
-            except TypeError:
-                logger.warning(
-                    "The input iterable can not be deepcopied, please be aware of in-place "
-                    "modification would affect source data."
-                )
-        yield from source
+        worker_info = get_worker_info() if self._shard_by_worker else None
+        if worker_info is None:
+            if self._deepcopy == "always":
+                source = _deepcopy_source(source)
+            yield from source
+        elif isinstance(source, (list, tuple, torch.Tensor)):
+            # The shard is extracted before the deepcopy to copy only the items of the worker.
+            source = source[worker_info.id :: worker_info.num_workers]
+            if self._deepcopy == "always":
+                source = _deepcopy_source(source)
+            yield from source
+        else:
+            if self._deepcopy == "always":
+                source = _deepcopy_source(source)
+            yield from islice(source, worker_info.id, None, worker_info.num_workers)
 
     def __len__(self) -> int:
         return len(self._source)
@@ -49,5 +91,48 @@ class SourceWrapperIterDataPipe(IterDataPipe):
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  deepcopy: {self._deepcopy},\n"
+            f"  shard_by_worker: {self._shard_by_worker},\n"
             f"  source:\n    {str_indent(concise_summary(self._source), num_spaces=4)}\n)"
         )
+
+
+_DEEPCOPY_MODES = {
+    False: "never",
+    True: "always",
+    "never": "never",
+    "once": "once",
+    "always": "always",
+}
+
+
+def _deepcopy_source(source: Iterable) -> Iterable:
+    r"""Deep-copies the source of a DataPipe.
+
+    The tensors are copied with ``clone``. The other sources are
+    copied with a pickle round-trip, which is usually faster than
+    ``copy.deepcopy``. If the source cannot be pickled,
+    ``copy.deepcopy`` is used.
+
+    Args:
+    ----
+        source (``iterable``): Specifies the source to copy.
+
+    Returns:
+    -------
+        ``iterable``: A deepcopy of the source or the source itself if
+            it cannot be deep-copied.
+    """
+    if isinstance(source, torch.Tensor):
+        return source.clone()
+    try:
+        return pickle.loads(pickle.dumps(source, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        pass
+    try:
+        return copy.deepcopy(source)
+    except TypeError:
+        logger.warning(
+            "The input iterable can not be deepcopied, please be aware of in-place "
+            "modification would affect source data."
+        )
+    return source
@@ -60,14 +60,40 @@ class DemoMultiClassClsDataset(Dataset):
 
         self._targets = data[ct.TARGET]
         self._features = data[ct.INPUT]
+        # The names are created once to avoid creating a new string for each example.
+        self._names = [str(i) for i in range(self.num_examples)]
 
     def __getitem__(self, item: int) -> dict:
         return {
             ct.INPUT: self._features[item],
             ct.TARGET: self._targets[item],
-            ct.NAME: f"{item}",
+            ct.NAME: self._names[item],
         }
 
+    def __getitems__(self, items: list[int]) -> list[dict]:
+        r"""Gets a batch of examples.
+
+        This method is used by the PyTorch data loader (``torch>=2.0``)
+        to fetch all the examples of a batch at once. The features
+        and targets of the examples are gathered with a single
+        indexing operation. Like ``__getitem__``, it returns a list of
+        examples that is then merged by the collate function.
+
+        Args:
+        ----
+            items (list): Specifies the indices of the examples.
+
+        Returns:
+        -------
+            list: The examples.
+        """
+        features = self._features[items].unbind(0)
+        targets = self._targets[items].unbind(0)
+        return [
+            {ct.INPUT: feature, ct.TARGET: target, ct.NAME: self._names[item]}
+            for item, feature, target in zip(items, features, targets)
+        ]
+
     def __len__(self) -> int:
         return self.num_examples
 
@@ -25,6 +25,8 @@ class BaseDataSource(ABC, Generic[T], metaclass=AbstractFactory):
     Note: it is an experimental class and the API may change.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def attach(self, engine: BaseEngine) -> None:
         r"""Attaches the current data source to the provided engine.
@@ -2,6 +2,7 @@ __all__ = ["IterDataPipeCreatorDataSource", "DataCreatorIterDataPipeCreatorDataS
 
 import logging
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, TypeVar, Union
 
 from torch.utils.data import IterDataPipe
@@ -11,6 +12,8 @@ from gravitorch.creators.datapipe import (
     setup_iter_datapipe_creator,
 )
 from gravitorch.data.datacreators import BaseDataCreator, setup_data_creator
+from gravitorch.data.datapipes.iter.pinning import PinMemoryIterDataPipe
+from gravitorch.data.datapipes.iter.prefetching import PrefetcherIterDataPipe
 from gravitorch.datasources.base import BaseDataSource, LoaderNotFoundError
 from gravitorch.engines.base import BaseEngine
 from gravitorch.utils.asset import AssetManager
@@ -35,6 +38,29 @@ class IterDataPipeCreatorDataSource(BaseDataSource):
             ``BaseIterDataPipeCreator`` object or its configuration.
             Each ``BaseIterDataPipeCreator`` object contains the
             recipe to create an ``IterDataPipe`` object.
+        cache_datapipes (bool, optional): If ``True``, the
+            ``IterDataPipe`` object of each loader is created only
+            once per epoch and reused when the same data loader is
+            requested again during the same epoch. Only the
+            ``IterDataPipe`` object of the last epoch is kept for
+            each loader. Do not use this option if the
+            ``IterDataPipe`` objects can be iterated only once (e.g.
+            a DataPipe over a generator). Default: ``False``
+        prefetch_buffer (int, optional): Specifies the number of
+            items prefetched in a background thread. If ``0``, the
+            items are not prefetched. Prefetching overlaps the
+            computation of the next batches with the processing of
+            the current batch. Default: ``0``
+        pin_memory (bool, optional): If ``True``, the tensors of
+            each item are copied into page-locked memory so they can
+            be transferred to the GPU with
+            ``tensor.to(device, non_blocking=True)``. The memory is
+            pinned only if CUDA is available. The custom types
+            have to implement a ``pin_memory`` method, otherwise they
+            are not pinned. Default: ``False``
+        pin_memory_device (str, optional): Specifies the device the
+            memory is pinned for. If empty, the memory is pinned for
+            the current CUDA device. Default: ``""``
 
     Example:
     -------
@@ -91,13 +117,40 @@ class IterDataPipeCreatorDataSource(BaseDataSource):
         # Note that both examples lead to the same result.
     """
 
-    def __init__(self, datapipe_creators: dict[str, Union[BaseIterDataPipeCreator, dict]]) -> None:
+    __slots__ = (
+        "_asset_manager",
+        "_cache_datapipes",
+        "_prefetch_buffer",
+        "_pin_memory",
+        "_pin_memory_device",
+        "_datapipe_cache",
+        "_logged_loader_ids",
+        "_datapipe_creators",
+    )
+
+    def __init__(
+        self,
+        datapipe_creators: dict[str, Union[BaseIterDataPipeCreator, dict]],
+        cache_datapipes: bool = False,
+        prefetch_buffer: int = 0,
+        pin_memory: bool = False,
+        pin_memory_device: str = "",
+    ) -> None:
         self._asset_manager = AssetManager()
+        self._cache_datapipes = bool(cache_datapipes)
+        self._prefetch_buffer = int(prefetch_buffer)
+        self._pin_memory = bool(pin_memory)
+        self._pin_memory_device = pin_memory_device
+        # Maps each loader ID to the epoch and the IterDataPipe object created for this epoch.
+        self._datapipe_cache: dict[str, tuple[Optional[int], IterDataPipe]] = {}
+        # IDs of the loaders whose DataPipe was already shown in the logs.
+        self._logged_loader_ids: set[str] = set()
         logger.info("Initializing the IterDataPipe creators...")
         self._datapipe_creators = {
             key: setup_iter_datapipe_creator(creator) for key, creator in datapipe_creators.items()
         }
-        logger.info(f"IterDataPipe creators:\n{to_torch_mapping_str(self._datapipe_creators)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"IterDataPipe creators:\n{to_torch_mapping_str(self._datapipe_creators)}")
 
     def __repr__(self) -> str:
         return (
@@ -211,9 +264,16 @@ class IterDataPipeCreatorDataSource(BaseDataSource):
             >>> my_engine = AlphaEngine()  # Work with any engine
             >>> data_loader = data_source.get_data_loader('train', my_engine)
         """
-        if not self.has_data_loader(loader_id):
+        if loader_id not in self._datapipe_creators:
             raise LoaderNotFoundError(f"{loader_id} does not exist")
-        return self._create_datapipe(loader_id=loader_id, engine=engine)
+        if not self._cache_datapipes:
+            return self._create_and_wrap_datapipe(loader_id=loader_id, engine=engine)
+        epoch = None if engine is None else engine.epoch
+        cached_epoch, datapipe = self._datapipe_cache.get(loader_id, (None, None))
+        if datapipe is None or cached_epoch != epoch:
+            datapipe = self._create_and_wrap_datapipe(loader_id=loader_id, engine=engine)
+            self._datapipe_cache[loader_id] = (epoch, datapipe)
+        return datapipe
 
     def has_data_loader(self, loader_id: str) -> bool:
         r"""Indicates if the data source has a data loader with the given ID.
@@ -242,6 +302,40 @@ class IterDataPipeCreatorDataSource(BaseDataSource):
         """
         return loader_id in self._datapipe_creators
 
+    def _create_and_wrap_datapipe(
+        self, loader_id: str, engine: Optional[BaseEngine] = None
+    ) -> IterDataPipe[T]:
+        r"""Creates an ``IterDataPipe`` object and wraps it with the
+        memory pinning and prefetching DataPipes if they are enabled.
+
+        The memory is pinned before the prefetching so the copies are
+        done in the background thread.
+
+        Args:
+        ----
+            loader_id (str): Specifies the ID of the data loader to
+                get.
+            engine (``BaseEngine`` or ``None``, optional): Specifies
+                an engine. Default: ``None``
+
+        Returns:
+        -------
+            ``IterDataPipe``: An ``IterDataPipe`` object.
+        """
+        logger.debug("Creating DataPipe for loader '%s'...", loader_id)
+        datapipe = self._create_datapipe(loader_id=loader_id, engine=engine)
+        if loader_id not in self._logged_loader_ids:
+            # The DataPipe is shown only the first time because its string representation
+            # can be expensive to compute and is usually the same for all the epochs.
+            self._logged_loader_ids.add(loader_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Created DataPipe for loader '{loader_id}':\n{datapipe}")
+        if self._pin_memory:
+            datapipe = PinMemoryIterDataPipe(datapipe, device=self._pin_memory_device or None)
+        if self._prefetch_buffer > 0:
+            datapipe = PrefetcherIterDataPipe(datapipe, buffer_size=self._prefetch_buffer)
+        return datapipe
+
     def _create_datapipe(
         self, loader_id: str, engine: Optional[BaseEngine] = None
     ) -> IterDataPipe[T]:
@@ -260,10 +354,7 @@ class IterDataPipeCreatorDataSource(BaseDataSource):
         -------
             ``IterDataPipe``: An ``IterDataPipe`` object.
         """
-        logger.info("Crating DataPipe...")
-        datapipe = self._datapipe_creators[loader_id].create(engine=engine)
-        logger.info(f"Created DataPipe:\n{datapipe}")
-        return datapipe
+        return self._datapipe_creators[loader_id].create(engine=engine)
 
 
 class DataCreatorIterDataPipeCreatorDataSource(IterDataPipeCreatorDataSource):
@@ -290,22 +381,71 @@ class DataCreatorIterDataPipeCreatorDataSource(IterDataPipeCreatorDataSource):
             For example if you want to create data for the ``'train'``
             loader, you need to map this key to a ``BaseDataCreator``
             object or its configuration.
+        cache_datapipes (bool, optional): If ``True``, the
+            ``IterDataPipe`` object of each loader is created only
+            once per epoch. See ``IterDataPipeCreatorDataSource``
+            for more information. Default: ``False``
+        prefetch_buffer (int, optional): Specifies the number of
+            items prefetched in a background thread. See
+            ``IterDataPipeCreatorDataSource`` for more information.
+            Default: ``0``
+        pin_memory (bool, optional): If ``True``, the tensors of
+            each item are copied into page-locked memory. See
+            ``IterDataPipeCreatorDataSource`` for more information.
+            Default: ``False``
+        pin_memory_device (str, optional): Specifies the device the
+            memory is pinned for. Default: ``""``
+        parallel_init (bool, optional): If ``True``, the data are
+            created in parallel with a pool of threads (up to 8).
+            It reduces the initialization time when the data
+            creators are I/O-bound (e.g. they read files). Do not use
+            this option if the data creators use a shared random
+            number generator because the order of the calls is not
+            deterministic. Default: ``False``
     """
 
+    __slots__ = ("_data_creators", "_data", "_source_inputs")
+
     def __init__(
         self,
         datapipe_creators: dict[str, Union[BaseIterDataPipeCreator, dict]],
         data_creators: dict[str, Union[BaseDataCreator, dict]],
+        cache_datapipes: bool = False,
+        prefetch_buffer: int = 0,
+        pin_memory: bool = False,
+        pin_memory_device: str = "",
+        parallel_init: bool = False,
     ) -> None:
-        super().__init__(datapipe_creators)
+        super().__init__(
+            datapipe_creators,
+            cache_datapipes=cache_datapipes,
+            prefetch_buffer=prefetch_buffer,
+            pin_memory=pin_memory,
+            pin_memory_device=pin_memory_device,
+        )
         logger.info("Initializing the data creators...")
         self._data_creators = {
             key: setup_data_creator(creator) for key, creator in data_creators.items()
         }
-        logger.info(f"Data creators:\n{to_torch_mapping_str(self._data_creators)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Data creators:\n{to_torch_mapping_str(self._data_creators)}")
         logger.info("Creating data...")
-        self._data = {key: creator.create() for key, creator in self._data_creators.items()}
-        logger.info(f"Data:\n{concise_summary(self._data)}")
+        if parallel_init and len(self._data_creators) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(self._data_creators))) as executor:
+                futures = {
+                    key: executor.submit(creator.create)
+                    for key, creator in self._data_creators.items()
+                }
+                self._data = {key: future.result() for key, future in futures.items()}
+        else:
+            self._data = {key: creator.create() for key, creator in self._data_creators.items()}
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Data:\n{concise_summary(self._data)}")
+        # The source inputs of the IterDataPipe creators are computed once because the data
+        # do not change after the initialization.
+        self._source_inputs = {
+            key: None if value is None else (value,) for key, value in self._data.items()
+        }
 
     def __repr__(self) -> str:
         return (
@@ -333,8 +473,6 @@ class DataCreatorIterDataPipeCreatorDataSource(IterDataPipeCreatorDataSource):
         -------
             ``IterDataPipe``: An ``IterDataPipe`` object.
         """
-        source_input = self._data.get(loader_id, None)
         return self._datapipe_creators[loader_id].create(
-            engine=engine,
-            source_inputs=source_input if source_input is None else (source_input,),
+            engine=engine, source_inputs=self._source_inputs.get(loader_id)
         )
@@ -27,6 +27,11 @@ from gravitorch.utils.format import to_pretty_dict_str
 
 logger = logging.getLogger(__name__)
 
+_TORCH_DISTRIBUTED_ENV_VARS_SET = frozenset(TORCH_DISTRIBUTED_ENV_VARS)
+_SLURM_DISTRIBUTED_ENV_VARS_SET = frozenset(SLURM_DISTRIBUTED_ENV_VARS)
+# Names of the environment variables shown by ``show_torch_distributed_env_vars``.
+_TORCH_DISTRIBUTED_ENV_NAMES = TORCH_DISTRIBUTED_ENV_VARS + (CUDA_VISIBLE_DEVICES,)
+
 
 def is_slurm_job() -> bool:
     r"""Indicates if the current process is connected to a SLURM job.
@@ -69,7 +74,7 @@ def has_torch_distributed_env_vars() -> bool:
         bool: ``True`` if all the environment variables are set,
             otherwise ``False``.
     """
-    return all(env_var in os.environ for env_var in TORCH_DISTRIBUTED_ENV_VARS)
+    return _TORCH_DISTRIBUTED_ENV_VARS_SET <= os.environ.keys()
 
 
 def has_slurm_distributed_env_vars() -> bool:
@@ -81,7 +86,7 @@ def has_slurm_distributed_env_vars() -> bool:
         bool: ``True`` if all the environment variables are set,
             otherwise ``False``.
     """
-    return all(env_var in os.environ for env_var in SLURM_DISTRIBUTED_ENV_VARS)
+    return _SLURM_DISTRIBUTED_ENV_VARS_SET <= os.environ.keys()
 
 
 def show_distributed_env_vars() -> None:
@@ -117,8 +122,11 @@ def show_torch_distributed_env_vars() -> None:
             documentation of ``torch.distributed.run``
             https://github.com/pytorch/pytorch/blob/master/torch/distributed/run.py
     """
-    names = TORCH_DISTRIBUTED_ENV_VARS + (CUDA_VISIBLE_DEVICES,)
-    env_vars = {env_var: os.environ.get(env_var, "<NOT SET>") for env_var in names}
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    env_vars = {
+        env_var: os.environ.get(env_var, "<NOT SET>") for env_var in _TORCH_DISTRIBUTED_ENV_NAMES
+    }
     logger.info(
         "PyTorch environment variables for distributed training:\n"
         f"{to_pretty_dict_str(env_vars, sorted_keys=True, indent=2)}\n"
@@ -127,7 +135,9 @@ def show_torch_distributed_env_vars() -> None:
 
 def show_all_slurm_env_vars() -> None:
     r"""Shows the value of the all the SLURM environment variables."""
-    env_vars = {key: value for key, value in os.environ.items() if key.startswith("SLURM_")}
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    env_vars = {key: os.environ[key] for key in os.environ if key.startswith("SLURM_")}
     logger.info(
         "All SLURM environment variables:\n"
         f"{to_pretty_dict_str(env_vars, sorted_keys=True, indent=2)}\n"
@@ -136,6 +146,8 @@ def show_all_slurm_env_vars() -> None:
 
 def show_slurm_env_vars() -> None:
     r"""Shows the value of some SLURM environment variables."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     env_vars = {
         env_var: os.environ.get(env_var, "<NOT SET>") for env_var in SLURM_DISTRIBUTED_ENV_VARS
     }
@@ -149,8 +161,11 @@ def show_distributed_context_info() -> None:
     r"""Shows some information about the distributed context.
 
     This information is useful to verify that each process is well
-    configured.
+    configured. The distributed context is not queried if the INFO
+    logs are disabled.
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     logger.info(
         f"Config of the distributed context:\n"
         f"  model_name         : {dist.model_name()}\n"
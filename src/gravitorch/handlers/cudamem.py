@@ -1,5 +1,8 @@
 __all__ = ["EpochCudaMemoryMonitor", "IterationCudaMemoryMonitor"]
 
+import logging
+from typing import Optional
+
 import torch
 
 from gravitorch.engines.base import BaseEngine
@@ -14,6 +17,14 @@ from gravitorch.utils.events import (
 )
 from gravitorch.utils.exp_trackers import EpochStep, IterationStep
 
+logger = logging.getLogger(__name__)
+
+# Names of the metrics logged by the CUDA memory monitors.
+_EPOCH_MAX_ALLOCATED = "epoch/max_cuda_memory_allocated"
+_EPOCH_MAX_ALLOCATED_PCT = "epoch/max_cuda_memory_allocated_pct"
+_ITERATION_MAX_ALLOCATED = "iteration/max_cuda_memory_allocated"
+_ITERATION_MAX_ALLOCATED_PCT = "iteration/max_cuda_memory_allocated_pct"
+
 
 class EpochCudaMemoryMonitor(BaseHandler):
     r"""Implements a handler to monitor the CUDA memory usage every ``freq``
@@ -26,18 +37,37 @@ class EpochCudaMemoryMonitor(BaseHandler):
             Default: ``'epoch_completed'``
         freq (int, optional): Specifies the epoch frequency used to
             monitor the CUDA memory usage. Default: ``1``
+        synchronize (bool, optional): If ``True``, the CUDA device
+            is synchronized before to read the max memory allocated.
+            It is not needed to get the max memory allocated because
+            the memory is allocated when the kernels are launched,
+            but it stalls the CUDA stream. Default: ``False``
     """
 
-    def __init__(self, event: str = EngineEvents.EPOCH_COMPLETED, freq: int = 1) -> None:
+    def __init__(
+        self, event: str = EngineEvents.EPOCH_COMPLETED, freq: int = 1, synchronize: bool = False
+    ) -> None:
         self._event = str(event)
         if freq < 1:
             raise ValueError(f"freq has to be greater than 0 (received: {freq:,})")
         self._freq = int(freq)
+        self._synchronize = bool(synchronize)
+        self._cuda_available = torch.cuda.is_available()
+        # The total memory of the device is computed on the first call to ``monitor`` and
+        # is computed again only if the current device changes.
+        self._device: Optional[int] = None
+        self._total_memory: Optional[int] = None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(freq={self._freq}, event={self._event})"
+        return (
+            f"{self.__class__.__qualname__}(freq={self._freq}, event={self._event}, "
+            f"synchronize={self._synchronize})"
+        )
 
     def attach(self, engine: BaseEngine) -> None:
+        if not self._cuda_available:
+            logger.info(f"CUDA is not available so {self} is not attached to the engine")
+            return
         add_unique_event_handler(
             engine=engine,
             event=self._event,
@@ -55,15 +85,19 @@ class EpochCudaMemoryMonitor(BaseHandler):
         ----
             engine (``BaseEngine``): Specifies the engine.
         """
-        if torch.cuda.is_available():
-            torch.cuda.synchronize()
-            log_max_cuda_memory_allocated()
+        if self._cuda_available:
+            if self._synchronize:
+                torch.cuda.synchronize()
+            device = torch.cuda.current_device()
+            if device != self._device:
+                self._device = device
+                self._total_memory = _get_total_cuda_memory(device)
             allocated_memory = torch.cuda.max_memory_allocated()
-            total_memory = torch.cuda.mem_get_info()[1]
+            log_max_cuda_memory_allocated(self._total_memory)
             engine.log_metrics(
                 {
-                    "epoch/max_cuda_memory_allocated": allocated_memory,
-                    "epoch/max_cuda_memory_allocated_pct": float(allocated_memory / total_memory),
+                    _EPOCH_MAX_ALLOCATED: allocated_memory,
+                    _EPOCH_MAX_ALLOCATED_PCT: float(allocated_memory / self._total_memory),
                 },
                 step=EpochStep(engine.epoch),
             )
@@ -80,18 +114,40 @@ class IterationCudaMemoryMonitor(BaseHandler):
             Default: ``'epoch_completed'``
         freq (int, optional): Specifies the iteration frequency used
             to monitor the CUDA memory usage. Default: ``1``
+        synchronize (bool, optional): If ``True``, the CUDA device
+            is synchronized before to read the max memory allocated.
+            It is not needed to get the max memory allocated because
+            the memory is allocated when the kernels are launched,
+            but it stalls the CUDA stream. Default: ``False``
     """
 
-    def __init__(self, event: str = EngineEvents.TRAIN_ITERATION_COMPLETED, freq: int = 1) -> None:
+    def __init__(
+        self,
+        event: str = EngineEvents.TRAIN_ITERATION_COMPLETED,
+        freq: int = 1,
+        synchronize: bool = False,
+    ) -> None:
         self._event = str(event)
         if freq < 1:
             raise ValueError(f"freq has to be greater than 0 (received: {freq:,})")
         self._freq = int(freq)
+        self._synchronize = bool(synchronize)
+        self._cuda_available = torch.cuda.is_available()
+        # The total memory of the device is computed on the first call to ``monitor`` and
+        # is computed again only if the current device changes.
+        self._device: Optional[int] = None
+        self._total_memory: Optional[int] = None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(freq={self._freq}, event={self._event})"
+        return (
+            f"{self.__class__.__qualname__}(freq={self._freq}, event={self._event}, "
+            f"synchronize={self._synchronize})"
+        )
 
     def attach(self, engine: BaseEngine) -> None:
+        if not self._cuda_available:
+            logger.info(f"CUDA is not available so {self} is not attached to the engine")
+            return
         add_unique_event_handler(
             engine=engine,
             event=self._event,
@@ -109,17 +165,36 @@ class IterationCudaMemoryMonitor(BaseHandler):
         ----
             engine (``BaseEngine``): Specifies the engine.
         """
-        if torch.cuda.is_available():
-            torch.cuda.synchronize()
-            log_max_cuda_memory_allocated()
+        if self._cuda_available:
+            if self._synchronize:
+                torch.cuda.synchronize()
+            device = torch.cuda.current_device()
+            if device != self._device:
+                self._device = device
+                self._total_memory = _get_total_cuda_memory(device)
             allocated_memory = torch.cuda.max_memory_allocated()
-            total_memory = torch.cuda.mem_get_info()[1]
+            log_max_cuda_memory_allocated(self._total_memory)
             engine.log_metrics(
                 {
-                    "iteration/max_cuda_memory_allocated": allocated_memory,
-                    "iteration/max_cuda_memory_allocated_pct": float(
-                        allocated_memory / total_memory
-                    ),
+                    _ITERATION_MAX_ALLOCATED: allocated_memory,
+                    _ITERATION_MAX_ALLOCATED_PCT: float(allocated_memory / self._total_memory),
                 },
                 step=IterationStep(engine.iteration),
             )
+
+
+def _get_total_cuda_memory(device: int) -> int:
+    r"""Gets the total memory of a CUDA device.
+
+    Unlike ``torch.cuda.mem_get_info``, this function does not query
+    the CUDA driver for the free memory.
+
+    Args:
+    ----
+        device (int): Specifies the index of the CUDA device.
+
+    Returns:
+    -------
+        int: The total memory of the CUDA device in bytes.
+    """
+    return torch.cuda.get_device_properties(device).total_memory
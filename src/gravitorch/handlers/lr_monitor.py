@@ -1,12 +1,14 @@
 __all__ = ["EpochLRMonitor", "IterationLRMonitor"]
 
+import functools
 import logging
 
+from torch.optim import Optimizer
+
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
 from gravitorch.handlers.base import BaseHandler
 from gravitorch.handlers.utils import add_unique_event_handler
-from gravitorch.optimizers.utils import get_learning_rate_per_group
 from gravitorch.utils.events import (
     ConditionalEventHandler,
     EpochPeriodicCondition,
@@ -61,9 +63,8 @@ class EpochLRMonitor(BaseHandler):
             engine (``BaseEngine``): Specifies the engine.
         """
         if engine.optimizer:
-            lrs = get_learning_rate_per_group(engine.optimizer)
             engine.log_metrics(
-                {f"epoch/optimizer.group{i}.lr": lr for i, lr in lrs.items()},
+                _get_lr_metrics(engine.optimizer, prefix="epoch"),
                 step=EpochStep(engine.epoch),
             )
         else:
@@ -117,9 +118,8 @@ class IterationLRMonitor(BaseHandler):
             engine (``BaseEngine``): Specifies the engine.
         """
         if engine.optimizer:
-            lrs = get_learning_rate_per_group(engine.optimizer)
             engine.log_metrics(
-                {f"iteration/optimizer.group{i}.lr": lr for i, lr in lrs.items()},
+                _get_lr_metrics(engine.optimizer, prefix="iteration"),
                 step=IterationStep(engine.iteration),
             )
         else:
@@ -127,3 +127,49 @@ class IterationLRMonitor(BaseHandler):
                 "It is not possible to monitor the learning rate parameters because "
                 "there is no optimizer"
             )
+
+
+def _get_lr_metrics(optimizer: Optimizer, prefix: str) -> dict[str, float]:
+    r"""Gets the learning rate of each parameter group of an optimizer.
+
+    The metrics are computed in a single pass over the parameter
+    groups. The parameter groups without learning rate are ignored.
+
+    Args:
+    ----
+        optimizer (``torch.optim.Optimizer``): Specifies the
+            optimizer.
+        prefix (str): Specifies the prefix of the metric names
+            e.g. ``'epoch'`` or ``'iteration'``.
+
+    Returns:
+    -------
+        dict: The learning rate of each parameter group. The keys
+            are the metric names.
+    """
+    return {
+        _get_lr_metric_name(prefix, i): group["lr"]
+        for i, group in enumerate(optimizer.param_groups)
+        if "lr" in group
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lr_metric_name(prefix: str, group: int) -> str:
+    r"""Gets the name of the metric used to log the learning rate of a
+    parameter group.
+
+    The names are cached because they are the same for every call
+    of the monitors.
+
+    Args:
+    ----
+        prefix (str): Specifies the prefix of the metric name
+            e.g. ``'epoch'`` or ``'iteration'``.
+        group (int): Specifies the index of the parameter group.
+
+    Returns:
+    -------
+        str: The metric name.
+    """
+    return f"{prefix}/optimizer.group{group}.lr"
@@ -1,5 +1,6 @@
 __all__ = ["add_unique_event_handler", "setup_handler", "setup_and_attach_handlers", "to_events"]
 
+import functools
 import logging
 from typing import Union
 
@@ -45,10 +46,14 @@ def add_unique_event_handler(
         >>> from gravitorch.handlers import add_unique_event_handler
         >>> add_unique_event_handler(engine, 'my_event', event_handler)
     """
+    # The messages are only built if they are logged because the string
+    # representation of some event handlers is expensive to compute.
     if engine.has_event_handler(event_handler, event):
-        logger.info(f"{event_handler} is already added to the engine for '{event}' event")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{event_handler} is already added to the engine for '{event}' event")
     else:
-        logger.info(f"Adding {event_handler} to '{event}' event")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Adding {event_handler} to '{event}' event")
         engine.add_event_handler(event, event_handler)
 
 
@@ -126,5 +131,25 @@ def to_events(events: Union[str, tuple[str, ...], list[str]]) -> tuple[str, ...]
         ('my_event', 'my_other_event')
     """
     if isinstance(events, str):
-        return (events,)
+        return _to_single_event(events)
+    if isinstance(events, tuple):
+        return events
     return tuple(events)
+
+
+@functools.lru_cache(maxsize=256)
+def _to_single_event(event: str) -> tuple[str]:
+    r"""Converts a single event to a tuple of events.
+
+    The tuples are cached so the handlers created with the same
+    event share the same tuple.
+
+    Args:
+    ----
+        event (str): Specifies the event.
+
+    Returns:
+    -------
+        tuple: The tuple with the event.
+    """
+    return (event,)
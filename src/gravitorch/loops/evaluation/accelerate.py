@@ -12,7 +12,6 @@ import torch
 from torch.nn import Module
 from tqdm import tqdm
 
-from gravitorch.distributed import comm as dist
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
 from gravitorch.loops.evaluation.basic import BaseBasicEvaluationLoop
@@ -59,6 +58,14 @@ class AccelerateEvaluationLoop(BaseBasicEvaluationLoop):
         profiler (``BaseProfiler`` or dict or None, optional):
             Specifies the profiler or its configuration. If ``None``,
             the ``NoOpProfiler`` is instantiated. Default: ``None``
+        metric_sync_every (int, optional): Specifies the number of
+            iterations between two conversions of the scalar metric
+            tensors to Python numbers. The tensors are buffered on
+            their device between two conversions, which avoids a
+            host-device synchronization at each iteration. If ``0``,
+            the tensors are converted once at the end of the epoch,
+            so the buffers grow with the epoch length.
+            Default: ``50``
     """
 
     def __init__(
@@ -69,11 +76,18 @@ class AccelerateEvaluationLoop(BaseBasicEvaluationLoop):
         condition: Union[BaseEvalCondition, dict, None] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
+        metric_sync_every: int = 50,
     ) -> None:
         check_accelerate()
         self._accelerator = self._setup_accelerator(accelerator or {})
         logger.info(f"accelerator state:\n{self._accelerator.state}")
-        super().__init__(tag=tag, condition=condition, observer=observer, profiler=profiler)
+        super().__init__(
+            tag=tag,
+            condition=condition,
+            observer=observer,
+            profiler=profiler,
+            metric_sync_every=metric_sync_every,
+        )
         self._grad_enabled = grad_enabled
 
     def __repr__(self) -> str:
@@ -84,6 +98,7 @@ class AccelerateEvaluationLoop(BaseBasicEvaluationLoop):
             f"  condition={self._condition},\n"
             f"  observer={self._observer},\n"
             f"  profiler={self._profiler},\n"
+            f"  metric_sync_every={self._metric_sync_every},\n"
             ")"
         )
 
@@ -103,12 +118,14 @@ class AccelerateEvaluationLoop(BaseBasicEvaluationLoop):
             ]
         )
 
-        prefix = f"({dist.get_rank()}/{dist.get_world_size()}) " if dist.is_distributed() else ""
+        # The progress bar is only shown on the main process and it is refreshed at most
+        # once per second to limit the writes to the standard output.
         data_loader = tqdm(
             data_loader,
-            desc=f"{prefix}Evaluation [{engine.epoch}]",
-            position=dist.get_rank(),
+            desc=f"Evaluation [{engine.epoch}]",
             file=sys.stdout,
+            mininterval=1.0,
+            disable=self._rank != 0,
         )
         logger.info("Evaluation data loader has been created")
         return model, data_loader
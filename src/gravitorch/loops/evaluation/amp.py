@@ -34,6 +34,16 @@ class AMPEvaluationLoop(VanillaEvaluationLoop):
         amp_enabled (bool, optional): If ``True``, automatic mixed
             precision (AMP) is enabled, otherwise it is disabled.
             Default: ``True``
+        amp_dtype (``torch.dtype`` or str, optional): Specifies the
+            data type used by the autocast regions. The valid values
+            are ``torch.float16`` and ``torch.bfloat16`` or their
+            names. Default: ``torch.float16``
+        prefetch_batches (bool, optional): If ``True``, the next batch
+            is sent to the target device on a dedicated CUDA stream
+            while the current batch is processed. The host to device
+            copies overlap with the computation only if the batch
+            device placement uses non-blocking copies and the batches
+            are in pinned memory. Default: ``False``
         tag (str, optional): Specifies the tag which is used to log
             metrics. Default: ``"eval"``
         condition (``BaseEvalCondition`` or dict or None): Specifies
@@ -47,6 +57,23 @@ class AMPEvaluationLoop(VanillaEvaluationLoop):
         profiler (``BaseProfiler`` or dict or None, optional):
             Specifies the profiler or its configuration. If ``None``,
             the ``NoOpProfiler`` is instantiated. Default: ``None``
+        metric_sync_every (int, optional): Specifies the number of
+            iterations between two conversions of the scalar metric
+            tensors to Python numbers. The tensors are buffered on
+            their device between two conversions, which avoids a
+            host-device synchronization at each iteration. If ``0``,
+            the tensors are converted once at the end of the epoch,
+            so the buffers grow with the epoch length.
+            Default: ``50``
+        inference_mode (bool, optional): If ``True`` and the gradient
+            is not computed, the forward pass runs in
+            ``torch.inference_mode``, otherwise it runs in
+            ``torch.no_grad``. The tensors created in inference mode
+            cannot be saved for backward or modified in-place outside
+            inference mode, so the inference mode should be disabled
+            if the model or the metrics create tensors during the
+            evaluation that are reused later in the training
+            (e.g. lazily created buffers). Default: ``True``
     """
 
     def __init__(
@@ -54,37 +81,56 @@ class AMPEvaluationLoop(VanillaEvaluationLoop):
         tag: str = "eval",
         grad_enabled: bool = False,
         amp_enabled: bool = True,
+        amp_dtype: Union[torch.dtype, str] = torch.float16,
         batch_device_placement: Union[BaseDevicePlacement, dict, None] = None,
+        prefetch_batches: bool = False,
         condition: Union[BaseEvalCondition, dict, None] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
+        metric_sync_every: int = 50,
+        inference_mode: bool = True,
     ) -> None:
         super().__init__(
             tag=tag,
             grad_enabled=grad_enabled,
             batch_device_placement=batch_device_placement,
+            prefetch_batches=prefetch_batches,
             condition=condition,
             observer=observer,
             profiler=profiler,
+            metric_sync_every=metric_sync_every,
+            inference_mode=inference_mode,
         )
         self._amp_enabled = bool(amp_enabled)
+        self._amp_dtype = (
+            getattr(torch, amp_dtype, None) if isinstance(amp_dtype, str) else amp_dtype
+        )
+        if self._amp_dtype not in (torch.float16, torch.bfloat16):
+            raise ValueError(
+                f"Incorrect amp_dtype ({amp_dtype}). The valid values are ``torch.float16`` "
+                "and ``torch.bfloat16``"
+            )
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  tag={self._tag},\n"
             f"  batch_device_placement={self._batch_device_placement},\n"
+            f"  prefetch_batches={self._prefetch_batches},\n"
             f"  grad_enabled={self._grad_enabled},\n"
             f"  amp_enabled={self._amp_enabled},\n"
+            f"  amp_dtype={self._amp_dtype},\n"
             f"  condition={self._condition},\n"
             f"  observer={self._observer},\n"
             f"  profiler={self._profiler},\n"
+            f"  metric_sync_every={self._metric_sync_every},\n"
+            f"  inference_mode={self._inference_mode},\n"
             ")"
         )
 
     def _eval_one_batch(self, engine: BaseEngine, model: Module, batch: Any) -> dict:
         engine.fire_event(EngineEvents.EVAL_ITERATION_STARTED)
-        with torch.set_grad_enabled(self._grad_enabled), autocast(enabled=self._amp_enabled):
-            output = model(self._batch_device_placement.send(batch))
+        with self._grad_context(), autocast(enabled=self._amp_enabled, dtype=self._amp_dtype):
+            output = model(self._send_batch_to_device(batch))
         engine.fire_event(EngineEvents.EVAL_ITERATION_COMPLETED)
         return output
@@ -19,10 +19,14 @@ from gravitorch.loops.evaluation.conditions import (
     BaseEvalCondition,
     EveryEpochEvalCondition,
 )
-from gravitorch.loops.observers import BaseLoopObserver, setup_loop_observer
+from gravitorch.loops.observers import (
+    BaseLoopObserver,
+    NoOpLoopObserver,
+    setup_loop_observer,
+)
 from gravitorch.utils.history import MinScalarHistory
 from gravitorch.utils.metric_tracker import ScalarMetricTracker
-from gravitorch.utils.profilers import BaseProfiler, setup_profiler
+from gravitorch.utils.profilers import BaseProfiler, NoOpProfiler, setup_profiler
 from gravitorch.utils.seed import manual_seed
 from gravitorch.utils.timing import BatchLoadingTimer
 
@@ -48,6 +52,14 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
         profiler (``BaseProfiler`` or dict or None, optional):
             Specifies the profiler or its configuration. If ``None``,
             the ``NoOpProfiler`` is instantiated. Default: ``None``
+        metric_sync_every (int, optional): Specifies the number of
+            iterations between two conversions of the scalar metric
+            tensors to Python numbers. The tensors are buffered on
+            their device between two conversions, which avoids a
+            host-device synchronization at each iteration. If ``0``,
+            the tensors are converted once at the end of the epoch,
+            so the buffers grow with the epoch length.
+            Default: ``50``
     """
 
     def __init__(
@@ -56,6 +68,7 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
         condition: Union[BaseEvalCondition, dict, None] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
+        metric_sync_every: int = 50,
     ) -> None:
         self._tag = str(tag)
         self._condition = self._setup_condition(condition)
@@ -64,6 +77,10 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
         logger.info(f"observer:\n{self._observer}")
         self._profiler = setup_profiler(profiler)
         logger.info(f"profiler:\n{self._profiler}")
+        self._metric_sync_every = int(metric_sync_every)
+        # The distributed configuration is updated at the beginning of each evaluation.
+        self._is_distributed = False
+        self._rank = 0
 
     def eval(self, engine: BaseEngine) -> None:
         r"""Evaluates the model on the evaluation dataset.
@@ -72,7 +89,9 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
         ----
             engine (``BaseEngine``): Specifies the engine.
         """
-        dist.barrier()
+        self._is_distributed = dist.is_distributed()
+        self._rank = dist.get_rank()
+        self._barrier()
         if not engine.data_source.has_data_loader(self._tag) or not self._condition(engine):
             return
         logger.info(f"Evaluating model for epoch {engine.epoch}")
@@ -83,28 +102,36 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
         model, data_loader = self._prepare_model_data_loader(engine)
 
         # Evaluate the model on each mini-match in the dataset.
-        metrics = ScalarMetricTracker()
+        metrics = ScalarMetricTracker(sync_every=self._metric_sync_every)
         data_loader = BatchLoadingTimer(data_loader, epoch=engine.epoch, prefix=f"{self._tag}/")
         self._observer.start(engine)
-        dist.barrier()
 
+        # The methods called for each batch are looked up once before the loop. The no-op
+        # observer and profiler methods are not called.
+        eval_one_batch = self._eval_one_batch
+        update_metrics = metrics.update
+        update_observer = (
+            None if isinstance(self._observer, NoOpLoopObserver) else self._observer.update
+        )
         with self._profiler as profiler:
+            profiler_step = None if isinstance(profiler, NoOpProfiler) else profiler.step
             for batch in data_loader:
                 # Run forward on the given batch.
-                output = self._eval_one_batch(engine, model, batch)
-                metrics.update(output)
-                self._observer.update(engine=engine, model_input=batch, model_output=output)
-                profiler.step()
+                output = eval_one_batch(engine, model, batch)
+                update_metrics(output)
+                if update_observer is not None:
+                    update_observer(engine=engine, model_input=batch, model_output=output)
+                if profiler_step is not None:
+                    profiler_step()
 
         # To be sure the progress bar is displayed before the following lines
         sys.stdout.flush()
-        dist.barrier()
         self._observer.end(engine)
 
         # Log some evaluation metrics to the engine.
         data_loader.log_stats(engine=engine)
         metrics.log_average_value(engine=engine, prefix=f"{self._tag}/")
-        dist.barrier()
+        self._barrier()
 
         engine.fire_event(EngineEvents.EVAL_EPOCH_COMPLETED)
 
@@ -114,6 +141,15 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
     def state_dict(self) -> dict[str, Any]:
         return {}
 
+    def _barrier(self) -> None:
+        r"""Synchronizes all the processes.
+
+        The synchronization is skipped if the current process is not
+        part of a distributed group.
+        """
+        if self._is_distributed:
+            dist.barrier()
+
     def _prepare_evaluation(self, engine: BaseEngine) -> None:
         r"""Prepares the evaluation.
 
@@ -122,7 +158,7 @@ class BaseBasicEvaluationLoop(BaseEvaluationLoop):
             engine (``BaseEngine``): Specifies the engine.
         """
         # Fix the random seed for reproducibility purpose.
-        manual_seed(engine.random_seed + engine.epoch + engine.max_epochs * dist.get_rank())
+        manual_seed(engine.random_seed + engine.epoch + engine.max_epochs * self._rank)
         engine.model.eval()
 
         if not engine.has_history(f"{self._tag}/{ct.LOSS}"):
@@ -11,7 +11,6 @@ import torch
 from torch.nn import Module
 from tqdm import tqdm
 
-from gravitorch.distributed import comm as dist
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
 from gravitorch.loops.evaluation.basic import BaseBasicEvaluationLoop
@@ -20,6 +19,7 @@ from gravitorch.loops.observers import BaseLoopObserver
 from gravitorch.utils.device_placement import (
     AutoDevicePlacement,
     BaseDevicePlacement,
+    CudaStreamPrefetcher,
     setup_device_placement,
 )
 from gravitorch.utils.profilers import BaseProfiler
@@ -43,6 +43,12 @@ class VanillaEvaluationLoop(BaseBasicEvaluationLoop):
             The target device should be compatible with the model.
             If ``None``, an ``AutoDevicePlacement`` object is
             instantiated. Default: ``None``
+        prefetch_batches (bool, optional): If ``True``, the next batch
+            is sent to the target device on a dedicated CUDA stream
+            while the current batch is processed. The host to device
+            copies overlap with the computation only if the batch
+            device placement uses non-blocking copies and the batches
+            are in pinned memory. Default: ``False``
         tag (str, optional): Specifies the tag which is used to log
             metrics. Default: ``"eval"``
         condition (``BaseEvalCondition`` or dict or None): Specifies
@@ -56,51 +62,124 @@ class VanillaEvaluationLoop(BaseBasicEvaluationLoop):
         profiler (``BaseProfiler`` or dict or None, optional):
             Specifies the profiler or its configuration. If ``None``,
             the ``NoOpProfiler`` is instantiated. Default: ``None``
+        metric_sync_every (int, optional): Specifies the number of
+            iterations between two conversions of the scalar metric
+            tensors to Python numbers. The tensors are buffered on
+            their device between two conversions, which avoids a
+            host-device synchronization at each iteration. If ``0``,
+            the tensors are converted once at the end of the epoch,
+            so the buffers grow with the epoch length.
+            Default: ``50``
+        inference_mode (bool, optional): If ``True`` and the gradient
+            is not computed, the forward pass runs in
+            ``torch.inference_mode``, otherwise it runs in
+            ``torch.no_grad``. The tensors created in inference mode
+            cannot be saved for backward or modified in-place outside
+            inference mode, so the inference mode should be disabled
+            if the model or the metrics create tensors during the
+            evaluation that are reused later in the training
+            (e.g. lazily created buffers). Default: ``True``
     """
 
     def __init__(
         self,
         grad_enabled: bool = False,
         batch_device_placement: Union[BaseDevicePlacement, dict, None] = None,
+        prefetch_batches: bool = False,
         tag: str = "eval",
         condition: Union[BaseEvalCondition, dict, None] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
+        metric_sync_every: int = 50,
+        inference_mode: bool = True,
     ) -> None:
-        super().__init__(tag=tag, condition=condition, observer=observer, profiler=profiler)
+        super().__init__(
+            tag=tag,
+            condition=condition,
+            observer=observer,
+            profiler=profiler,
+            metric_sync_every=metric_sync_every,
+        )
         self._grad_enabled = bool(grad_enabled)
         self._batch_device_placement = setup_device_placement(
             batch_device_placement or AutoDevicePlacement()
         )
+        self._prefetch_batches = bool(prefetch_batches)
+        self._inference_mode = bool(inference_mode)
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  tag={self._tag},\n"
             f"  batch_device_placement={self._batch_device_placement},\n"
+            f"  prefetch_batches={self._prefetch_batches},\n"
             f"  grad_enabled={self._grad_enabled},\n"
             f"  condition={self._condition},\n"
             f"  observer={self._observer},\n"
             f"  profiler={self._profiler},\n"
+            f"  metric_sync_every={self._metric_sync_every},\n"
+            f"  inference_mode={self._inference_mode},\n"
             ")"
         )
 
     def _eval_one_batch(self, engine: BaseEngine, model: Module, batch: Any) -> dict:
         engine.fire_event(EngineEvents.EVAL_ITERATION_STARTED)
-        with torch.set_grad_enabled(self._grad_enabled):
-            output = model(self._batch_device_placement.send(batch))
+        with self._grad_context():
+            output = model(self._send_batch_to_device(batch))
         engine.fire_event(EngineEvents.EVAL_ITERATION_COMPLETED)
         return output
 
+    def _grad_context(
+        self,
+    ) -> Union[torch.inference_mode, torch.no_grad, torch.set_grad_enabled]:
+        r"""Gets the context manager used to run the forward pass.
+
+        ``torch.inference_mode`` is used by default when the gradient
+        is not computed because it is cheaper than disabling the
+        gradient: it also disables the view tracking and the version
+        counter updates of the tensors.
+
+        Returns:
+        -------
+            The context manager.
+        """
+        if self._grad_enabled:
+            return torch.set_grad_enabled(True)
+        if self._inference_mode:
+            return torch.inference_mode()
+        return torch.no_grad()
+
+    def _send_batch_to_device(self, batch: Any) -> Any:
+        r"""Sends a batch on the target device.
+
+        The batch is returned unchanged if the batches are prefetched
+        because they are already on the target device.
+
+        Args:
+        ----
+            batch: Specifies the batch of data.
+
+        Returns:
+        -------
+            The batch on the target device.
+        """
+        if self._prefetch_batches:
+            return batch
+        return self._batch_device_placement.send(batch)
+
     def _prepare_model_data_loader(self, engine: BaseEngine) -> tuple[Module, Iterable]:
         logger.info("Preparing the model and data loader...")
         data_loader = engine.data_source.get_data_loader(loader_id=self._tag, engine=engine)
-        prefix = f"({dist.get_rank()}/{dist.get_world_size()}) " if dist.is_distributed() else ""
+        if self._prefetch_batches:
+            data_loader = CudaStreamPrefetcher(data_loader, self._batch_device_placement)
+        # The progress bar is only shown on the main process and it is refreshed at most
+        # once per second to limit the writes to the standard output.
         data_loader = tqdm(
             data_loader,
-            desc=f"{prefix}Evaluation [{engine.epoch}]",
-            position=dist.get_rank(),
+            desc=f"Evaluation [{engine.epoch}]",
             file=sys.stdout,
+            mininterval=1.0,
+            disable=self._rank != 0,
         )
         logger.info("Evaluation data loader has been created")
         return engine.model, data_loader
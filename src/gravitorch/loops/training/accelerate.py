@@ -4,17 +4,16 @@ r"""This module implements a training loop using the Accelerate library
 __all__ = ["AccelerateTrainingLoop"]
 
 import logging
+import math
 import sys
 from collections.abc import Callable, Iterable
 from typing import Any, Optional, Union
 
-import torch
 from torch.nn import Module
 from torch.optim import Optimizer
 from tqdm import tqdm
 
 from gravitorch import constants as ct
-from gravitorch.distributed import comm as dist
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
 from gravitorch.loops.observers import BaseLoopObserver
@@ -48,7 +47,7 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
             gradients to ``None``, otherwise set the gradients to
             zero. Setting the gradients to ``None`` will in general
             have lower memory footprint, and can modestly improve
-            performance. Default: ``False``
+            performance. Default: ``True``
         tag (str, optional): Specifies the tag which is used to log
             metrics. Default: ``"train"``
         clip_grad (dict or None, optional): Specifies the
@@ -67,7 +66,7 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
     def __init__(
         self,
         accelerator: Union[Accelerator, dict, None] = None,
-        set_grad_to_none: bool = False,
+        set_grad_to_none: bool = True,
         tag: str = "train",
         clip_grad: Optional[dict] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
@@ -76,7 +75,12 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
         check_accelerate()
         self._accelerator = self._setup_accelerator(accelerator or {})
         logger.info(f"accelerator state:\n{self._accelerator.state}")
-        super().__init__(tag=tag, clip_grad=clip_grad, observer=observer, profiler=profiler)
+        super().__init__(
+            tag=tag,
+            clip_grad=clip_grad,
+            observer=observer,
+            profiler=profiler,
+        )
         self._set_grad_to_none = bool(set_grad_to_none)
 
     def __repr__(self) -> str:
@@ -115,12 +119,14 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
                 engine.data_source.get_data_loader(loader_id=self._tag, engine=engine),
             ],
         )
-        prefix = f"({dist.get_rank()}/{dist.get_world_size()}) " if dist.is_distributed() else ""
+        # The progress bar is only shown on the main process and it is refreshed at most
+        # once per second to limit the writes to the standard output.
         data_loader = tqdm(
             data_loader,
-            desc=f"{prefix}Training [{engine.epoch}/{engine.max_epochs}]",
-            position=dist.get_rank(),
+            desc=f"Training [{engine.epoch}/{engine.max_epochs}]",
             file=sys.stdout,
+            mininterval=1.0,
+            disable=self._rank != 0,
         )
         logger.info("Training data loader has been created")
         return model, optimizer, data_loader
@@ -128,12 +134,13 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
     def _train_one_batch(
         self, engine: BaseEngine, model: Module, optimizer: Optimizer, batch: Any
     ) -> dict:
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
+        fire_event = engine.fire_event
+        fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
         optimizer.zero_grad(self._set_grad_to_none)
         output = model(batch)
-        engine.fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
+        fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
 
-        if not torch.isnan(output[ct.LOSS]):
+        if not math.isnan(output[ct.LOSS].item()):
             self._accelerator.backward(output[ct.LOSS])
         else:
             logger.warning(
@@ -142,11 +149,11 @@ class AccelerateTrainingLoop(BaseBasicTrainingLoop):
             )
 
         if self._clip_grad_fn:
-            self._clip_grad_fn(model.parameters(), *self._clip_grad_args)
-        engine.fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
+            self._clip_grad_fn(self._get_parameters(model), *self._clip_grad_args)
+        fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
 
         optimizer.step()
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
+        fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
 
         return output
 
@@ -4,6 +4,7 @@ r"""This module implements a training loop using automatic mixed precision
 __all__ = ["AMPTrainingLoop"]
 
 import logging
+import math
 from typing import Any, Optional, Union
 
 import torch
@@ -32,15 +33,43 @@ class AMPTrainingLoop(VanillaTrainingLoop):
             gradients to ``None``, otherwise set the gradients to
             zero. Setting the gradients to ``None`` will in general
             have lower memory footprint, and can modestly improve
-            performance. Default: ``False``
+            performance. Default: ``True``
         amp_enabled (bool, optional): If ``True``, automatic mixed
             precision (AMP) is enabled, otherwise it is disabled.
             Default: ``True``
+        amp_dtype (``torch.dtype`` or str, optional): Specifies the
+            data type used by the autocast regions. The valid values
+            are ``torch.float16`` and ``torch.bfloat16`` or their
+            names. The gradient scaler is only used with
+            ``torch.float16``. Default: ``torch.float16``
         batch_device_placement (bool, optional): Specifies the batch
             device placement module. This module moves the batch on
             a target device. The target device should be compatible
             with the model. If ``None``, an ``AutoDevicePlacement``
             object is instantiated. Default: ``None``
+        prefetch_batches (bool, optional): If ``True``, the next batch
+            is sent to the target device on a dedicated CUDA stream
+            while the current batch is processed. The host to device
+            copies overlap with the computation only if the batch
+            device placement uses non-blocking copies and the batches
+            are in pinned memory. Default: ``False``
+        grad_accum_steps (int, optional): Specifies the number of
+            batches used to accumulate the gradients before updating
+            the model parameters. The loss of each batch is divided by
+            this number. For a ``DistributedDataParallel`` model, the
+            gradients are only synchronized on the batches that update
+            the parameters. The gradients of the last batches of an
+            epoch are not used if the number of batches is not a
+            multiple of this number. Default: ``1``
+        channels_last (bool, optional): If ``True``, the model and the
+            4D tensors of the batches use the channels last memory
+            format. This memory format can speed up the convolutional
+            models on the GPUs with tensor cores. The model is
+            converted once, before the first epoch. A
+            ``DistributedDataParallel`` model is not converted, so it
+            has to be converted before it is wrapped (e.g. with the
+            ``channels_last`` option of ``VanillaModelCreator``).
+            Default: ``False``
         tag (str, optional): Specifies the tag which is used to log
             metrics. Default: ``"train"``
         clip_grad (dict or None, optional): Specifies the
@@ -59,9 +88,13 @@ class AMPTrainingLoop(VanillaTrainingLoop):
     def __init__(
         self,
         clip_grad: Optional[dict] = None,
-        set_grad_to_none: bool = False,
+        set_grad_to_none: bool = True,
         amp_enabled: bool = True,
+        amp_dtype: Union[torch.dtype, str] = torch.float16,
         batch_device_placement: Union[BaseDevicePlacement, dict, None] = None,
+        prefetch_batches: bool = False,
+        grad_accum_steps: int = 1,
+        channels_last: bool = False,
         tag: str = "train",
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
@@ -70,20 +103,36 @@ class AMPTrainingLoop(VanillaTrainingLoop):
             clip_grad=clip_grad,
             set_grad_to_none=set_grad_to_none,
             batch_device_placement=batch_device_placement,
+            prefetch_batches=prefetch_batches,
+            grad_accum_steps=grad_accum_steps,
+            channels_last=channels_last,
             tag=tag,
             observer=observer,
             profiler=profiler,
         )
         self._amp_enabled = bool(amp_enabled)
-        self._scaler = GradScaler(enabled=self._amp_enabled)
+        self._amp_dtype = (
+            getattr(torch, amp_dtype, None) if isinstance(amp_dtype, str) else amp_dtype
+        )
+        if self._amp_dtype not in (torch.float16, torch.bfloat16):
+            raise ValueError(
+                f"Incorrect amp_dtype ({amp_dtype}). The valid values are ``torch.float16`` "
+                "and ``torch.bfloat16``"
+            )
+        # The gradient scaler is not needed with bfloat16 because it has the same range as float32.
+        self._scaler = GradScaler(enabled=self._amp_enabled and self._amp_dtype == torch.float16)
 
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__qualname__}(\n"
             f"  set_grad_to_none={self._set_grad_to_none},\n"
             f"  amp_enabled={self._amp_enabled},\n"
+            f"  amp_dtype={self._amp_dtype},\n"
             f"  tag={self._tag},\n"
             f"  batch_device_placement={self._batch_device_placement},\n"
+            f"  prefetch_batches={self._prefetch_batches},\n"
+            f"  grad_accum_steps={self._grad_accum_steps},\n"
+            f"  channels_last={self._channels_last},\n"
             f"  clip_grad_fn={self._clip_grad_fn},\n"
             f"  clip_grad_args={self._clip_grad_args},\n"
             f"  observer={self._observer},\n"
@@ -100,29 +149,32 @@ class AMPTrainingLoop(VanillaTrainingLoop):
     def _train_one_batch(
         self, engine: BaseEngine, model: Module, optimizer: Optimizer, batch: Any
     ) -> dict:
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
-        optimizer.zero_grad(self._set_grad_to_none)
-        with autocast(enabled=self._amp_enabled):
-            output = model(self._batch_device_placement.send(batch))
-        engine.fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
-
-        loss = self._scaler.scale(output[ct.LOSS])
-        if torch.isnan(loss):
+        fire_event = engine.fire_event
+        fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
+        is_update_step = self._next_accumulation_step(optimizer)
+        with autocast(enabled=self._amp_enabled, dtype=self._amp_dtype):
+            output = model(self._send_batch_to_device(batch))
+        fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
+
+        loss = self._scaler.scale(self._scale_loss(output[ct.LOSS]))
+        if math.isnan(loss.item()):
             logger.warning(
                 "NaN detected. The gradient is not computed for this batch "
                 f"(iteration: {engine.iteration})"
             )
-            engine.fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
+            fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
             return output
 
-        loss.backward()
-        if self._clip_grad_fn:
+        with self._backward_context(model, is_update_step):
+            loss.backward()
+        if is_update_step and self._clip_grad_fn:
             self._scaler.unscale_(optimizer)
-            self._clip_grad_fn(model.parameters(), *self._clip_grad_args)
-        engine.fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
+            self._clip_grad_fn(self._get_parameters(model), *self._clip_grad_args)
+        fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
 
-        self._scaler.step(optimizer)
-        self._scaler.update()
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
+        if is_update_step:
+            self._scaler.step(optimizer)
+            self._scaler.update()
+        fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
 
         return output
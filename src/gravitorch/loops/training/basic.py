@@ -8,23 +8,30 @@ from abc import abstractmethod
 from collections.abc import Callable, Iterable
 from typing import Any, Optional, Union
 
+from torch import Tensor
 from torch.nn import Module
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import Optimizer
 
 from gravitorch import constants as ct
 from gravitorch.distributed import comm as dist
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
-from gravitorch.loops.observers import BaseLoopObserver, setup_loop_observer
+from gravitorch.loops.observers import (
+    BaseLoopObserver,
+    NoOpLoopObserver,
+    setup_loop_observer,
+)
 from gravitorch.loops.training.base import BaseTrainingLoop
 from gravitorch.optimizers.utils import (
+    enable_foreach_implementation,
     log_optimizer_parameters_per_group,
     show_optimizer_parameters_per_group,
 )
 from gravitorch.utils.exp_trackers import EpochStep
 from gravitorch.utils.history import MinScalarHistory
 from gravitorch.utils.metric_tracker import ScalarMetricTracker
-from gravitorch.utils.profilers import BaseProfiler, setup_profiler
+from gravitorch.utils.profilers import BaseProfiler, NoOpProfiler, setup_profiler
 from gravitorch.utils.seed import get_random_seed, manual_seed
 from gravitorch.utils.timing import BatchLoadingTimer
 
@@ -73,9 +80,21 @@ class BaseBasicTrainingLoop(BaseTrainingLoop):
         self._observer = setup_loop_observer(observer)
         self._profiler = setup_profiler(profiler)
         logger.info(f"profiler:\n{self._profiler}")
+        # Used to check the DistributedDataParallel configuration only once.
+        self._is_ddp_model_checked = False
+        # Used to get the parameters of the model without creating a new list at each step.
+        self._parameters: list[Tensor] = []
+        self._parameters_model: Optional[Module] = None
+        # Used to show the optimizer parameters only when the parameter groups change.
+        self._num_optimizer_groups = 0
+        # The distributed configuration is updated at the beginning of each epoch.
+        self._is_distributed = False
+        self._rank = 0
 
     def train(self, engine: BaseEngine) -> None:
-        dist.barrier()
+        self._is_distributed = dist.is_distributed()
+        self._rank = dist.get_rank()
+        self._barrier()
         self._prepare_training(engine)
         engine.fire_event(EngineEvents.TRAIN_EPOCH_STARTED)
 
@@ -85,29 +104,37 @@ class BaseBasicTrainingLoop(BaseTrainingLoop):
         metrics = ScalarMetricTracker()
         data_loader = BatchLoadingTimer(data_loader, epoch=engine.epoch, prefix=f"{self._tag}/")
         self._observer.start(engine)
-        dist.barrier()
 
+        # The methods called for each batch are looked up once before the loop. The no-op
+        # observer and profiler methods are not called.
+        increment_iteration = engine.increment_iteration
+        train_one_batch = self._train_one_batch
+        update_metrics = metrics.update
+        update_observer = (
+            None if isinstance(self._observer, NoOpLoopObserver) else self._observer.update
+        )
         with self._profiler as profiler:
+            profiler_step = None if isinstance(profiler, NoOpProfiler) else profiler.step
             for batch in data_loader:
-                engine.increment_iteration()
+                increment_iteration()
                 # Run forward/backward on the given batch.
-                output = self._train_one_batch(engine, model, optimizer, batch)
-                metrics.update(output)
-                self._observer.update(engine=engine, model_input=batch, model_output=output)
-                profiler.step()
+                output = train_one_batch(engine, model, optimizer, batch)
+                update_metrics(output)
+                if update_observer is not None:
+                    update_observer(engine=engine, model_input=batch, model_output=output)
+                if profiler_step is not None:
+                    profiler_step()
 
         # To be sure the progress bar is displayed before the following lines
         sys.stdout.flush()
-        dist.barrier()
         self._observer.end(engine)
 
         # Log some training metrics to the engine.
         data_loader.log_stats(engine=engine)
         metrics.log_average_value(engine=engine, prefix=f"{self._tag}/")
-        dist.barrier()
 
         engine.fire_event(EngineEvents.TRAIN_EPOCH_COMPLETED)
-        dist.barrier()
+        self._barrier()
 
     def load_state_dict(self, state_dict: dict[str, Any]) -> None:
         pass
@@ -124,18 +151,26 @@ class BaseBasicTrainingLoop(BaseTrainingLoop):
         """
         logger.info(f"Preparing training for epoch {engine.epoch}...")
         manual_seed(
-            get_random_seed(
-                get_random_seed(
-                    engine.random_seed + engine.epoch + engine.max_epochs * dist.get_rank()
-                )
-            )
+            get_random_seed(engine.random_seed + engine.epoch + engine.max_epochs * self._rank)
         )
         engine.model.train()
+        if not self._is_ddp_model_checked:
+            _check_ddp_model(engine.model)
+            self._is_ddp_model_checked = True
+
+        # The model may have new parameters between two epochs.
+        self._parameters_model = None
 
         if not engine.has_history(f"{self._tag}/{ct.LOSS}"):
             engine.add_history(MinScalarHistory(f"{self._tag}/{ct.LOSS}"))
 
-        show_optimizer_parameters_per_group(engine.optimizer)  # TODO: move to handler
+        enable_foreach_implementation(engine.optimizer)
+        # The optimizer parameters are logged at each epoch but they are only shown when the
+        # number of parameter groups changes to avoid printing the same table at each epoch.
+        num_optimizer_groups = len(engine.optimizer.param_groups)
+        if num_optimizer_groups != self._num_optimizer_groups:
+            show_optimizer_parameters_per_group(engine.optimizer)  # TODO: move to handler
+            self._num_optimizer_groups = num_optimizer_groups
         log_optimizer_parameters_per_group(
             optimizer=engine.optimizer,
             engine=engine,
@@ -143,6 +178,33 @@ class BaseBasicTrainingLoop(BaseTrainingLoop):
             prefix=f"{self._tag}/",
         )
 
+    def _barrier(self) -> None:
+        r"""Synchronizes all the processes.
+
+        The synchronization is skipped if the current process is not
+        part of a distributed group.
+        """
+        if self._is_distributed:
+            dist.barrier()
+
+    def _get_parameters(self, model: Module) -> list[Tensor]:
+        r"""Gets the parameters of a model.
+
+        The list of parameters is computed once per epoch and model.
+
+        Args:
+        ----
+            model (``torch.nn.Module``): Specifies the model.
+
+        Returns:
+        -------
+            list: The parameters of the model.
+        """
+        if model is not self._parameters_model:
+            self._parameters = list(model.parameters())
+            self._parameters_model = model
+        return self._parameters
+
     @abstractmethod
     def _prepare_model_optimizer_data_loader(
         self, engine: BaseEngine
@@ -196,3 +258,25 @@ class BaseBasicTrainingLoop(BaseTrainingLoop):
             dict: Some results (including the loss value) about the
                 batch.
         """
+
+
+def _check_ddp_model(model: Module) -> None:
+    r"""Checks the configuration of a ``DistributedDataParallel`` model.
+
+    A warning is logged if the gradients are not views of the
+    allreduce communication buckets. In this case, the gradients are
+    copied to the buckets before the allreduce and copied back after,
+    which increases the memory usage and the time of each step. The
+    option cannot be changed after the ``DistributedDataParallel``
+    module is created.
+
+    Args:
+    ----
+        model (``torch.nn.Module``): Specifies the model to check.
+    """
+    if isinstance(model, DistributedDataParallel) and not model.gradient_as_bucket_view:
+        logger.warning(
+            "The DistributedDataParallel model was created with gradient_as_bucket_view=False "
+            "so the gradients are copied to and from the allreduce buckets at each step. "
+            "You can create it with gradient_as_bucket_view=True to avoid these copies"
+        )
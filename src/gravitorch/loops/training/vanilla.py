@@ -3,17 +3,19 @@ r"""This module implements a simple training loop."""
 __all__ = ["VanillaTrainingLoop"]
 
 import logging
+import math
 import sys
 from collections.abc import Callable, Iterable
-from typing import Any, Optional, Union
+from contextlib import nullcontext
+from typing import Any, ContextManager, Optional, Union
 
 import torch
 from torch.nn import Module
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import Optimizer
 from tqdm import tqdm
 
 from gravitorch import constants as ct
-from gravitorch.distributed import comm as dist
 from gravitorch.engines.base import BaseEngine
 from gravitorch.engines.events import EngineEvents
 from gravitorch.loops.observers import BaseLoopObserver
@@ -21,9 +23,11 @@ from gravitorch.loops.training.basic import BaseBasicTrainingLoop
 from gravitorch.utils.device_placement import (
     AutoDevicePlacement,
     BaseDevicePlacement,
+    CudaStreamPrefetcher,
     setup_device_placement,
 )
 from gravitorch.utils.profilers import BaseProfiler
+from gravitorch.utils.tensor import recursive_apply
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +41,36 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
             gradients to ``None``, otherwise set the gradients to
             zero. Setting the gradients to ``None`` will in general
             have lower memory footprint, and can modestly improve
-            performance. Default: ``False``
+            performance. Default: ``True``
         batch_device_placement (``BaseDevicePlacement`` or dict or
             ``None``, optional): Specifies the batch device placement
             module. This module moves the batch on a target device.
             The target device should be compatible with the model.
             If ``None``, an ``AutoDevicePlacement`` object is
             instantiated. Default: ``None``
+        prefetch_batches (bool, optional): If ``True``, the next batch
+            is sent to the target device on a dedicated CUDA stream
+            while the current batch is processed. The host to device
+            copies overlap with the computation only if the batch
+            device placement uses non-blocking copies and the batches
+            are in pinned memory. Default: ``False``
+        grad_accum_steps (int, optional): Specifies the number of
+            batches used to accumulate the gradients before updating
+            the model parameters. The loss of each batch is divided by
+            this number. For a ``DistributedDataParallel`` model, the
+            gradients are only synchronized on the batches that update
+            the parameters. The gradients of the last batches of an
+            epoch are not used if the number of batches is not a
+            multiple of this number. Default: ``1``
+        channels_last (bool, optional): If ``True``, the model and the
+            4D tensors of the batches use the channels last memory
+            format. This memory format can speed up the convolutional
+            models on the GPUs with tensor cores. The model is
+            converted once, before the first epoch. A
+            ``DistributedDataParallel`` model is not converted, so it
+            has to be converted before it is wrapped (e.g. with the
+            ``channels_last`` option of ``VanillaModelCreator``).
+            Default: ``False``
         tag (str, optional): Specifies the tag which is used to log
             metrics. Default: ``"train"``
         clip_grad (dict or None, optional): Specifies the
@@ -61,18 +88,37 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
 
     def __init__(
         self,
-        set_grad_to_none: bool = False,
+        set_grad_to_none: bool = True,
         batch_device_placement: Union[BaseDevicePlacement, dict, None] = None,
+        prefetch_batches: bool = False,
+        grad_accum_steps: int = 1,
+        channels_last: bool = False,
         tag: str = ct.TRAIN,
         clip_grad: Optional[dict] = None,
         observer: Union[BaseLoopObserver, dict, None] = None,
         profiler: Union[BaseProfiler, dict, None] = None,
     ) -> None:
-        super().__init__(tag=tag, clip_grad=clip_grad, observer=observer, profiler=profiler)
+        super().__init__(
+            tag=tag,
+            clip_grad=clip_grad,
+            observer=observer,
+            profiler=profiler,
+        )
         self._set_grad_to_none = bool(set_grad_to_none)
         self._batch_device_placement = setup_device_placement(
             batch_device_placement or AutoDevicePlacement()
         )
+        self._prefetch_batches = bool(prefetch_batches)
+        if grad_accum_steps < 1:
+            raise ValueError(
+                f"grad_accum_steps has to be greater or equal to 1 (received: {grad_accum_steps})"
+            )
+        self._grad_accum_steps = int(grad_accum_steps)
+        # Index of the current batch in the gradient accumulation cycle.
+        self._accum_step = 0
+        self._channels_last = bool(channels_last)
+        # Used to convert the model to the channels last memory format only once.
+        self._is_model_channels_last = False
 
     def __repr__(self) -> str:
         return (
@@ -80,6 +126,9 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
             f"  tag={self._tag},\n"
             f"  set_grad_to_none={self._set_grad_to_none},\n"
             f"  batch_device_placement={self._batch_device_placement},\n"
+            f"  prefetch_batches={self._prefetch_batches},\n"
+            f"  grad_accum_steps={self._grad_accum_steps},\n"
+            f"  channels_last={self._channels_last},\n"
             f"  clip_grad_fn={self._clip_grad_fn},\n"
             f"  clip_grad_args={self._clip_grad_args},\n"
             f"  observer={self._observer},\n"
@@ -91,13 +140,21 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
         self, engine: BaseEngine
     ) -> tuple[Module, Optimizer, Iterable]:
         logger.info("Preparing the model, optimizer, and data loader...")
+        self._accum_step = 0
+        if self._channels_last and not self._is_model_channels_last:
+            _model_to_channels_last(engine.model)
+            self._is_model_channels_last = True
         data_loader = engine.data_source.get_data_loader(loader_id=self._tag, engine=engine)
-        prefix = f"({dist.get_rank()}/{dist.get_world_size()}) " if dist.is_distributed() else ""
+        if self._prefetch_batches:
+            data_loader = CudaStreamPrefetcher(data_loader, self._batch_device_placement)
+        # The progress bar is only shown on the main process and it is refreshed at most
+        # once per second to limit the writes to the standard output.
         data_loader = tqdm(
             data_loader,
-            desc=f"{prefix}Training [{engine.epoch}/{engine.max_epochs}]",
-            position=dist.get_rank(),
+            desc=f"Training [{engine.epoch}/{engine.max_epochs}]",
             file=sys.stdout,
+            mininterval=1.0,
+            disable=self._rank != 0,
         )
         logger.info("Training data loader has been created")
         return engine.model, engine.optimizer, data_loader
@@ -105,30 +162,111 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
     def _train_one_batch(
         self, engine: BaseEngine, model: Module, optimizer: Optimizer, batch: Any
     ) -> dict:
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
-        optimizer.zero_grad(self._set_grad_to_none)
-        output = model(self._batch_device_placement.send(batch))
-        engine.fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
+        fire_event = engine.fire_event
+        fire_event(EngineEvents.TRAIN_ITERATION_STARTED)
+        is_update_step = self._next_accumulation_step(optimizer)
+        output = model(self._send_batch_to_device(batch))
+        fire_event(EngineEvents.TRAIN_FORWARD_COMPLETED)
 
         loss = output[ct.LOSS]
-        if torch.isnan(loss):
+        if math.isnan(loss.item()):
             logger.warning(
                 "NaN detected. The gradient is not computed for this batch "
                 f"(iteration: {engine.iteration})"
             )
-            engine.fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
+            fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
             return output
 
-        loss.backward()
-        if self._clip_grad_fn:
-            self._clip_grad_fn(model.parameters(), *self._clip_grad_args)
-        engine.fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
+        with self._backward_context(model, is_update_step):
+            self._scale_loss(loss).backward()
+        if is_update_step and self._clip_grad_fn:
+            self._clip_grad_fn(self._get_parameters(model), *self._clip_grad_args)
+        fire_event(EngineEvents.TRAIN_BACKWARD_COMPLETED)
 
-        optimizer.step()
-        engine.fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
+        if is_update_step:
+            optimizer.step()
+        fire_event(EngineEvents.TRAIN_ITERATION_COMPLETED)
 
         return output
 
+    def _next_accumulation_step(self, optimizer: Optimizer) -> bool:
+        r"""Moves to the next batch of the gradient accumulation cycle.
+
+        The gradients are reset on the first batch of each cycle.
+
+        Args:
+        ----
+            optimizer (``torch.optim.Optimizer``): Specifies the
+                optimizer used to train the model.
+
+        Returns:
+        -------
+            bool: ``True`` if the model parameters have to be updated
+                after this batch, otherwise ``False``.
+        """
+        if self._accum_step == 0:
+            optimizer.zero_grad(self._set_grad_to_none)
+        self._accum_step = (self._accum_step + 1) % self._grad_accum_steps
+        return self._accum_step == 0
+
+    def _scale_loss(self, loss: torch.Tensor) -> torch.Tensor:
+        r"""Scales the loss by the number of gradient accumulation
+        steps.
+
+        Args:
+        ----
+            loss (``torch.Tensor``): Specifies the loss of the batch.
+
+        Returns:
+        -------
+            ``torch.Tensor``: The scaled loss.
+        """
+        if self._grad_accum_steps == 1:
+            return loss
+        return loss / self._grad_accum_steps
+
+    def _backward_context(self, model: Module, is_update_step: bool) -> ContextManager:
+        r"""Gets the context manager used to run the backward pass.
+
+        The gradients of a ``DistributedDataParallel`` model are only
+        synchronized on the batches that update the model parameters.
+
+        Args:
+        ----
+            model (``torch.nn.Module``): Specifies the model to train.
+            is_update_step (bool): Specifies if the model parameters
+                are updated after this batch.
+
+        Returns:
+        -------
+            The context manager.
+        """
+        if not is_update_step and isinstance(model, DistributedDataParallel):
+            return model.no_sync()
+        return nullcontext()
+
+    def _send_batch_to_device(self, batch: Any) -> Any:
+        r"""Sends a batch on the target device.
+
+        The batch is not sent if the batches are prefetched because
+        they are already on the target device. The 4D tensors are
+        converted to the channels last memory format if this option
+        is enabled.
+
+        Args:
+        ----
+            batch: Specifies the batch of data.
+
+        Returns:
+        -------
+            The batch on the target device.
+        """
+        if not self._prefetch_batches:
+            batch = self._batch_device_placement.send(batch)
+        if self._channels_last:
+            batch = recursive_apply(batch, _to_channels_last)
+        return batch
+
     def _setup_clip_grad(self, clip_grad: dict) -> tuple[Optional[Callable], tuple]:
         if not clip_grad:
             return None, ()
@@ -151,3 +289,41 @@ class VanillaTrainingLoop(BaseBasicTrainingLoop):
             f"Incorrect clip grad name ({name}). The valid values are ``clip_grad_value`` "
             "and ``clip_grad_norm``"
         )
+
+
+def _model_to_channels_last(model: Module) -> None:
+    r"""Converts a model to the channels last memory format.
+
+    Only the 4D parameters and buffers are converted. A
+    ``DistributedDataParallel`` model is not converted because the
+    parameters cannot be changed after the wrapping.
+
+    Args:
+    ----
+        model (``torch.nn.Module``): Specifies the model to convert.
+    """
+    if isinstance(model, DistributedDataParallel):
+        logger.warning(
+            "The DistributedDataParallel model is not converted to the channels last memory "
+            "format. The model has to be converted before it is wrapped (e.g. with "
+            "VanillaModelCreator(channels_last=True))"
+        )
+        return
+    model.to(memory_format=torch.channels_last)
+
+
+def _to_channels_last(tensor: torch.Tensor) -> torch.Tensor:
+    r"""Converts a 4D tensor to the channels last memory format.
+
+    Args:
+    ----
+        tensor (``torch.Tensor``): Specifies the tensor to convert.
+
+    Returns:
+    -------
+        ``torch.Tensor``: The tensor in the channels last memory format
+            if it is a 4D tensor, otherwise the input tensor.
+    """
+    if tensor.dim() == 4:
+        return tensor.contiguous(memory_format=torch.channels_last)
+    return tensor
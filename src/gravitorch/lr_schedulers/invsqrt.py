@@ -49,3 +49,9 @@ class InverseSquareRootLR(LambdaLR):
             last_epoch=last_epoch,
             verbose=verbose,
         )
+
+    def get_lr(self) -> list[float]:
+        # The factor does not depend on the parameter group so it is computed once for all the
+        # parameter groups instead of calling ``lr_lambda`` for each parameter group.
+        factor = inverse_square_root(self.last_epoch)
+        return [base_lr * factor for base_lr in self.base_lrs]
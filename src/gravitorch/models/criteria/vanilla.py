@@ -78,34 +78,4 @@ class VanillaLoss(Module):
         -------
             dict: a dict with the loss value.
         """
-        prediction = self._get_prediction_from_net_out(net_out)
-        target = self._get_target_from_batch(batch)
-        return {ct.LOSS: self.criterion(prediction, target)}
-
-    def _get_prediction_from_net_out(self, net_out: dict) -> Tensor:
-        r"""Gets the prediction from the network output.
-
-        Args:
-        ----
-            net_out (dict): Specifies the network output
-                which contains the prediction.
-
-        Returns:
-        -------
-            ``torch.Tensor``: The prediction
-        """
-        return net_out[self._prediction_key]
-
-    def _get_target_from_batch(self, batch: dict) -> Tensor:
-        r"""Gets the target from the batch. The target is the tensor with the
-        key 'target'.
-
-        Args:
-        ----
-            batch (dict): Specifies the batch which contains the target.
-
-        Returns:
-        -------
-            ``torch.Tensor``: The target
-        """
-        return batch[self._target_key]
+        return {ct.LOSS: self.criterion(net_out[self._prediction_key], batch[self._target_key])}
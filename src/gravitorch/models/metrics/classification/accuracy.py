@@ -178,9 +178,14 @@ class TopKAccuracy(BaseEpochMetric):
                 ``{0, 1, ..., num_classes-1}``.
         """
         _, pred = prediction.topk(self._maxk, -1, True, True)
-        correct = pred.eq(target.view(*pred.shape[:-1], 1).expand_as(pred)).float()
+        # The targets are broadcasted along the last dimension. ``view`` is used instead of
+        # ``unsqueeze`` because the targets can already have a trailing dimension of size 1.
+        correct = pred.eq(target.view(*pred.shape[:-1], 1)).float()
+        # The number of correct predictions in the top-k predictions is computed for all the
+        # k values with a single cumulative sum. ``cum_correct[..., k - 1]`` is a view.
+        cum_correct = correct.cumsum(dim=-1)
         for k, state in self._states.items():
-            state.update(correct[..., :k].sum(dim=-1))
+            state.update(cum_correct[..., k - 1])
 
     def reset(self) -> None:
         r"""Resets the metric."""
@@ -5,8 +5,8 @@ __all__ = ["RootMeanSquaredError", "SquaredError"]
 import logging
 from typing import Union
 
+import torch
 from torch import Tensor
-from torch.nn.functional import mse_loss
 
 from gravitorch.models.metrics.base_epoch import BaseStateEpochMetric
 from gravitorch.models.metrics.state import BaseState, ErrorState, RootMeanErrorState
@@ -79,7 +79,12 @@ class SquaredError(BaseStateEpochMetric):
                 ``(d0, d1, ..., dn)`` and type float or long):
                 Specifies the target tensor.
         """
-        self._state.update(mse_loss(prediction.float(), target.float(), reduction="none"))
+        # The integer, boolean and reduced precision inputs are upcast to avoid overflows.
+        if prediction.dtype not in (torch.float32, torch.float64):
+            prediction = prediction.float()
+        if target.dtype not in (torch.float32, torch.float64):
+            target = target.float()
+        self._state.update(prediction.sub(target).square())
 
 
 class RootMeanSquaredError(SquaredError):
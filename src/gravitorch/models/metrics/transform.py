@@ -64,7 +64,12 @@ class TransformedPredictionTarget(BaseMetric):
         -------
             dict or ``None``: The output of the metrics.
         """
-        return self.metric(self.prediction_transform(prediction), self.target_transform(target))
+        # The identity transformations are skipped to avoid the module call overhead.
+        if not isinstance(self.prediction_transform, Identity):
+            prediction = self.prediction_transform(prediction)
+        if not isinstance(self.target_transform, Identity):
+            target = self.target_transform(target)
+        return self.metric(prediction, target)
 
     def reset(self) -> None:
         r"""Resets all the metrics."""
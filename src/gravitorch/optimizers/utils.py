@@ -3,6 +3,7 @@ r"""This module implements some utility functions for the optimizers."""
 from __future__ import annotations
 
 __all__ = [
+    "enable_foreach_implementation",
     "get_learning_rate_per_group",
     "get_weight_decay_per_group",
     "log_optimizer_parameters_per_group",
@@ -24,6 +25,44 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def enable_foreach_implementation(optimizer: Optimizer) -> None:
+    r"""Enables the foreach implementation of the optimizer for the
+    parameter groups that do not specify the implementation.
+
+    The foreach implementation updates all the parameters of a group
+    with a few fused kernels instead of launching some kernels for each
+    parameter. It is only enabled for the parameter groups with a
+    ``foreach`` option set to ``None`` and where all the parameters
+    are CUDA tensors. The parameter groups with ``foreach=False`` or
+    without ``foreach`` option are not modified.
+
+    Args:
+    ----
+        optimizer (``torch.optim.Optimizer``): Specifies the
+            optimizer.
+
+    Example usage:
+
+    .. code-block:: python
+
+        >>> from torch import nn
+        >>> from torch.optim import Adam
+        >>> from gravitorch.optimizers.utils import enable_foreach_implementation
+        >>> optimizer = Adam(nn.Linear(4, 6).cuda().parameters())
+        >>> enable_foreach_implementation(optimizer)
+        >>> optimizer.param_groups[0]["foreach"]
+        True
+    """
+    for group in optimizer.param_groups:
+        if (
+            "foreach" in group
+            and group["foreach"] is None
+            and group["params"]
+            and all(param.is_cuda for param in group["params"])
+        ):
+            group["foreach"] = True
+
+
 def get_learning_rate_per_group(optimizer: Optimizer) -> dict[int, float]:
     r"""Gets the learning rates to an optimizer.
 
@@ -104,6 +143,8 @@ def show_optimizer_parameters_per_group(optimizer: Optimizer, tablefmt: str = "f
             at https://pypi.org/project/tabulate/.
             Default: ``'fancy_grid'``
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
     lines = []
     for i, group in enumerate(optimizer.param_groups):
         line_group = [f"Group {i}"]
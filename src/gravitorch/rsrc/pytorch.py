@@ -19,6 +19,56 @@ from gravitorch.utils.format import to_pretty_dict_str
 
 logger = logging.getLogger(__name__)
 
+# Functions to set the value of each option of the PyTorch CUDA backend. The options are
+# set in this order.
+_CUDA_SETTERS = {
+    "allow_tf32": lambda value: setattr(cuda.matmul, "allow_tf32", value),
+    "allow_fp16_reduced_precision_reduction": lambda value: setattr(
+        cuda.matmul, "allow_fp16_reduced_precision_reduction", value
+    ),
+    "flash_sdp_enabled": lambda value: cuda.enable_flash_sdp(value),
+    "math_sdp_enabled": lambda value: cuda.enable_math_sdp(value),
+    "preferred_linalg_backend": lambda value: _set_preferred_linalg_backend(value),
+}
+# Functions to get the current value of the options of the PyTorch CUDA backend. The preferred
+# linalg backend does not have a getter because it can be set with a string but it is read as
+# an enum value. Its setter compares the value only if it is an enum value.
+_CUDA_GETTERS = {
+    "allow_tf32": lambda: cuda.matmul.allow_tf32,
+    "allow_fp16_reduced_precision_reduction": lambda: (
+        cuda.matmul.allow_fp16_reduced_precision_reduction
+    ),
+    "flash_sdp_enabled": lambda: cuda.flash_sdp_enabled(),
+    "math_sdp_enabled": lambda: cuda.math_sdp_enabled(),
+}
+
+# Names and getters of the information shown by ``PyTorchCudaBackend``. The names are sorted
+# in alphabetical order.
+_CUDA_INFO_GETTERS = (
+    ("torch.backends.cuda.flash_sdp_enabled", lambda: cuda.flash_sdp_enabled()),
+    ("torch.backends.cuda.is_built", lambda: cuda.is_built()),
+    ("torch.backends.cuda.math_sdp_enabled", lambda: cuda.math_sdp_enabled()),
+    (
+        "torch.backends.cuda.matmul.allow_fp16_reduced_precision_reduction",
+        lambda: cuda.matmul.allow_fp16_reduced_precision_reduction,
+    ),
+    ("torch.backends.cuda.matmul.allow_tf32", lambda: cuda.matmul.allow_tf32),
+    ("torch.backends.cuda.preferred_linalg_library", lambda: cuda.preferred_linalg_library()),
+    ("torch.version.cuda", lambda: torch.version.cuda),
+)
+
+# Names and getters of the information shown by ``PyTorchCudnnBackend``. The names are sorted
+# in alphabetical order.
+_CUDNN_INFO_GETTERS = (
+    ("torch.backends.cudnn.allow_tf32", lambda: cudnn.allow_tf32),
+    ("torch.backends.cudnn.benchmark", lambda: cudnn.benchmark),
+    ("torch.backends.cudnn.benchmark_limit", lambda: cudnn.benchmark_limit),
+    ("torch.backends.cudnn.deterministic", lambda: cudnn.deterministic),
+    ("torch.backends.cudnn.enabled", lambda: cudnn.enabled),
+    ("torch.backends.cudnn.is_available", lambda: cudnn.is_available()),
+    ("torch.backends.cudnn.version", lambda: cudnn.version()),
+)
+
 
 class PyTorchConfig(BaseResource):
     r"""Implements a context manager to show the PyTorch configuration."""
@@ -47,8 +97,35 @@ class PyTorchConfig(BaseResource):
         return f"{self.__class__.__qualname__}()"
 
 
-@dataclass
-class PyTorchCudaBackendState:
+class _FrozenSlotsPickleMixin:
+    r"""Implements the pickle protocol for frozen dataclasses with slots.
+
+    The default protocol restores the state of a slotted object with
+    ``setattr``, which raises a ``FrozenInstanceError`` for frozen
+    dataclasses. The values are set with ``object.__setattr__``
+    instead, so the objects can be pickled and deep-copied.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class PyTorchCudaBackendState(_FrozenSlotsPickleMixin):
+    __slots__ = (
+        "allow_tf32",
+        "allow_fp16_reduced_precision_reduction",
+        "flash_sdp_enabled",
+        "math_sdp_enabled",
+        "preferred_linalg_backend",
+    )
+
     allow_tf32: bool
     allow_fp16_reduced_precision_reduction: bool
     flash_sdp_enabled: bool
@@ -58,13 +135,8 @@ class PyTorchCudaBackendState:
     def restore(self) -> None:
         r"""Restores the PyTorch CUDA backend configuration by using the values
         in the state."""
-        cuda.matmul.allow_tf32 = self.allow_tf32
-        cuda.matmul.allow_fp16_reduced_precision_reduction = (
-            self.allow_fp16_reduced_precision_reduction
-        )
-        cuda.enable_math_sdp(self.math_sdp_enabled)
-        cuda.enable_flash_sdp(self.flash_sdp_enabled)
-        cuda.preferred_linalg_library(self.preferred_linalg_backend)
+        for name in _CUDA_SETTERS:
+            _set_cuda_option(name, getattr(self, name))
 
     @classmethod
     def create(cls) -> "PyTorchCudaBackendState":
@@ -125,13 +197,30 @@ class PyTorchCudaBackend(BaseResource):
         self._flash_sdp_enabled = flash_sdp_enabled
         self._math_sdp_enabled = math_sdp_enabled
         self._preferred_linalg_backend = preferred_linalg_backend
+        # The options to set are computed once because the configuration does not change.
+        self._settings = tuple(
+            (name, value)
+            for name, value in (
+                ("allow_tf32", allow_tf32),
+                ("allow_fp16_reduced_precision_reduction", allow_fp16_reduced_precision_reduction),
+                ("flash_sdp_enabled", flash_sdp_enabled),
+                ("math_sdp_enabled", math_sdp_enabled),
+                ("preferred_linalg_backend", preferred_linalg_backend),
+            )
+            if value is not None
+        )
 
         self._log_info = bool(log_info)
-        self._state: list[PyTorchCudaBackendState] = []
+        # The state of the innermost context is stored in a single slot. The states of the
+        # outer contexts are only stored when the context manager is re-entered.
+        self._state: Optional[PyTorchCudaBackendState] = None
+        self._outer_states: list[PyTorchCudaBackendState] = []
 
     def __enter__(self) -> "PyTorchCudaBackend":
         logger.info("Configuring CUDA backend...")
-        self._state.append(PyTorchCudaBackendState.create())
+        if self._state is not None:
+            self._outer_states.append(self._state)
+        self._state = PyTorchCudaBackendState.create()
         self._configure()
         if self._log_info:
             self._show()
@@ -144,7 +233,8 @@ class PyTorchCudaBackend(BaseResource):
         exc_tb: Optional[TracebackType],
     ) -> None:
         logger.info("Restoring CUDA backend configuration...")
-        self._state.pop().restore()
+        self._state.restore()
+        self._state = self._outer_states.pop() if self._outer_states else None
 
     def __repr__(self) -> str:
         return (
@@ -158,37 +248,19 @@ class PyTorchCudaBackend(BaseResource):
         )
 
     def _configure(self) -> None:
-        if self._allow_tf32 is not None:
-            cuda.matmul.allow_tf32 = self._allow_tf32
-        if self._allow_fp16_reduced_precision_reduction is not None:
-            cuda.matmul.allow_fp16_reduced_precision_reduction = (
-                self._allow_fp16_reduced_precision_reduction
-            )
-        if self._flash_sdp_enabled is not None:
-            cuda.enable_flash_sdp(self._flash_sdp_enabled)
-        if self._math_sdp_enabled is not None:
-            cuda.enable_math_sdp(self._math_sdp_enabled)
-        if self._preferred_linalg_backend is not None:
-            cuda.preferred_linalg_library(self._preferred_linalg_backend)
+        for name, value in self._settings:
+            _set_cuda_option(name, value)
 
     def _show(self) -> None:
-        prefix = "torch.backends.cuda"
-        info = {
-            f"{prefix}.matmul.allow_fp16_reduced_precision_reduction": (
-                cuda.matmul.allow_fp16_reduced_precision_reduction
-            ),
-            f"{prefix}.matmul.allow_tf32": cuda.matmul.allow_tf32,
-            f"{prefix}.is_built": cuda.is_built(),
-            f"{prefix}.flash_sdp_enabled": cuda.flash_sdp_enabled(),
-            f"{prefix}.math_sdp_enabled": cuda.math_sdp_enabled(),
-            f"{prefix}.preferred_linalg_library": cuda.preferred_linalg_library(),
-            "torch.version.cuda": torch.version.cuda,
-        }
-        logger.info(f"CUDA backend:\n{to_pretty_dict_str(info, sorted_keys=True, indent=2)}\n")
-
-
-@dataclass
-class PyTorchCudnnBackendState:
+        if logger.isEnabledFor(logging.INFO):
+            info = {key: getter() for key, getter in _CUDA_INFO_GETTERS}
+            logger.info(f"CUDA backend:\n{to_pretty_dict_str(info, indent=2)}\n")
+
+
+@dataclass(frozen=True)
+class PyTorchCudnnBackendState(_FrozenSlotsPickleMixin):
+    __slots__ = ("allow_tf32", "benchmark", "benchmark_limit", "deterministic", "enabled")
+
     allow_tf32: bool
     benchmark: bool
     benchmark_limit: Optional[int]
@@ -198,11 +270,8 @@ class PyTorchCudnnBackendState:
     def restore(self) -> None:
         r"""Restores the PyTorch CUDNN backend configuration by using the
         values in the state."""
-        cudnn.allow_tf32 = self.allow_tf32
-        cudnn.benchmark = self.benchmark
-        cudnn.benchmark_limit = self.benchmark_limit
-        cudnn.deterministic = self.deterministic
-        cudnn.enabled = self.enabled
+        for name in self.__slots__:
+            _set_cudnn_option(name, getattr(self, name))
 
     @classmethod
     def create(cls) -> "PyTorchCudnnBackendState":
@@ -259,13 +328,30 @@ class PyTorchCudnnBackend(BaseResource):
         self._benchmark_limit = benchmark_limit
         self._deterministic = deterministic
         self._enabled = enabled
+        # The options to set are computed once because the configuration does not change.
+        self._settings = tuple(
+            (name, value)
+            for name, value in (
+                ("allow_tf32", allow_tf32),
+                ("benchmark", benchmark),
+                ("benchmark_limit", benchmark_limit),
+                ("deterministic", deterministic),
+                ("enabled", enabled),
+            )
+            if value is not None
+        )
 
         self._log_info = bool(log_info)
-        self._state: list[PyTorchCudnnBackendState] = []
+        # The state of the innermost context is stored in a single slot. The states of the
+        # outer contexts are only stored when the context manager is re-entered.
+        self._state: Optional[PyTorchCudnnBackendState] = None
+        self._outer_states: list[PyTorchCudnnBackendState] = []
 
     def __enter__(self) -> "PyTorchCudnnBackend":
         logger.info("Configuring CUDNN backend...")
-        self._state.append(PyTorchCudnnBackendState.create())
+        if self._state is not None:
+            self._outer_states.append(self._state)
+        self._state = PyTorchCudnnBackendState.create()
         self._configure()
         if self._log_info:
             self._show()
@@ -278,7 +364,8 @@ class PyTorchCudnnBackend(BaseResource):
         exc_tb: Optional[TracebackType],
     ) -> None:
         logger.info("Restoring CUDNN backend configuration...")
-        self._state.pop().restore()
+        self._state.restore()
+        self._state = self._outer_states.pop() if self._outer_states else None
 
     def __repr__(self) -> str:
         return (
@@ -289,26 +376,56 @@ class PyTorchCudnnBackend(BaseResource):
         )
 
     def _configure(self) -> None:
-        if self._allow_tf32 is not None:
-            cudnn.allow_tf32 = self._allow_tf32
-        if self._benchmark is not None:
-            cudnn.benchmark = self._benchmark
-        if self._benchmark_limit is not None:
-            cudnn.benchmark_limit = self._benchmark_limit
-        if self._deterministic is not None:
-            cudnn.deterministic = self._deterministic
-        if self._enabled is not None:
-            cudnn.enabled = self._enabled
+        for name, value in self._settings:
+            _set_cudnn_option(name, value)
 
     def _show(self) -> None:
-        prefix = "torch.backends.cudnn"
-        info = {
-            f"{prefix}.allow_tf32": cudnn.allow_tf32,
-            f"{prefix}.benchmark": cudnn.benchmark,
-            f"{prefix}.benchmark_limit": cudnn.benchmark_limit,
-            f"{prefix}.deterministic": cudnn.deterministic,
-            f"{prefix}.enabled": cudnn.enabled,
-            f"{prefix}.is_available": cudnn.is_available(),
-            f"{prefix}.version": cudnn.version(),
-        }
-        logger.info(f"CUDNN backend:\n{to_pretty_dict_str(info, sorted_keys=True, indent=2)}\n")
+        if logger.isEnabledFor(logging.INFO):
+            info = {key: getter() for key, getter in _CUDNN_INFO_GETTERS}
+            logger.info(f"CUDNN backend:\n{to_pretty_dict_str(info, indent=2)}\n")
+
+
+def _set_cuda_option(name: str, value: Any) -> None:
+    r"""Sets the value of an option of the PyTorch CUDA backend.
+
+    The option is not set if it already has the given value.
+
+    Args:
+    ----
+        name (str): Specifies the name of the option.
+        value: Specifies the value of the option.
+    """
+    getter = _CUDA_GETTERS.get(name)
+    if getter is None or getter() != value:
+        _CUDA_SETTERS[name](value)
+
+
+def _set_preferred_linalg_backend(value: Any) -> None:
+    r"""Sets the preferred linalg backend of the PyTorch CUDA backend.
+
+    The backend is not set if the value is an enum value equal to the
+    current backend e.g. when a state is restored. A string value is
+    always set because the current backend is read as an enum value.
+
+    Args:
+    ----
+        value: Specifies the preferred linalg backend e.g.
+            ``'cusolver'`` or ``torch._C._LinalgBackend.Cusolver``.
+    """
+    if isinstance(value, str) or cuda.preferred_linalg_library() != value:
+        cuda.preferred_linalg_library(value)
+
+
+def _set_cudnn_option(name: str, value: Any) -> None:
+    r"""Sets the value of an option of the PyTorch CUDNN backend.
+
+    The option is not set if it already has the given value.
+
+    Args:
+    ----
+        name (str): Specifies the name of the option e.g.
+            ``'benchmark'``.
+        value: Specifies the value of the option.
+    """
+    if getattr(cudnn, name) != value:
+        setattr(cudnn, name, value)
@@ -1,6 +1,7 @@
 __all__ = ["log_cuda_memory_summary", "log_max_cuda_memory_allocated"]
 
 import logging
+from typing import Optional
 
 import torch
 
@@ -78,11 +79,18 @@ def log_cuda_memory_summary() -> None:
         logger.info(f"\n{torch.cuda.memory_summary()}")
 
 
-def log_max_cuda_memory_allocated() -> None:
+def log_max_cuda_memory_allocated(total_memory: Optional[int] = None) -> None:
     r"""Logs the max CUDA memory allocated.
 
     This function does nothing if CUDA is not available.
 
+    Args:
+    ----
+        total_memory (int or ``None``, optional): Specifies the total
+            memory of the current CUDA device in bytes. If ``None``,
+            the total memory is queried with
+            ``torch.cuda.mem_get_info``. Default: ``None``
+
     Example usage:
 
     .. code-block:: python
@@ -98,9 +106,10 @@ def log_max_cuda_memory_allocated() -> None:
         >>> log_max_cuda_memory_allocated()
         INFO:gravitorch.utils.cuda_memory:Max CUDA memory allocated: 3.50 KB / 10.92 GB (0.00%)
     """
-    if torch.cuda.is_available():
+    if torch.cuda.is_available() and logger.isEnabledFor(logging.INFO):
         allocated_memory = torch.cuda.max_memory_allocated()
-        total_memory = torch.cuda.mem_get_info()[1]
+        if total_memory is None:
+            total_memory = torch.cuda.mem_get_info()[1]
         logger.info(
             f"Max CUDA memory allocated: {human_byte_size(allocated_memory)} / "
             f"{human_byte_size(total_memory)} "
@@ -3,6 +3,7 @@ __all__ = [
     "BaseDevicePlacement",
     "CpuDevicePlacement",
     "CudaDevicePlacement",
+    "CudaStreamPrefetcher",
     "ManualDevicePlacement",
     "MpsDevicePlacement",
     "NoOpDevicePlacement",
@@ -18,4 +19,5 @@ from gravitorch.utils.device_placement.manual import (
     MpsDevicePlacement,
 )
 from gravitorch.utils.device_placement.noop import NoOpDevicePlacement
+from gravitorch.utils.device_placement.prefetcher import CudaStreamPrefetcher
 from gravitorch.utils.device_placement.utils import setup_device_placement
@@ -10,7 +10,14 @@ class AutoDevicePlacement(ManualDevicePlacement):
 
     It uses a cuda device if cuda is available, otherwise it uses a cpu
     device.
+
+    Args:
+    ----
+        non_blocking (bool, optional): If ``True``, the host to
+            device copies are asynchronous with respect to the host
+            when the source tensors are in pinned memory.
+            Default: ``False``
     """
 
-    def __init__(self) -> None:
-        super().__init__(dist.device())
+    def __init__(self, non_blocking: bool = False) -> None:
+        super().__init__(dist.device(), non_blocking=non_blocking)
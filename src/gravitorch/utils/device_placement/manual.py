@@ -17,15 +17,27 @@ class ManualDevicePlacement(BaseDevicePlacement):
     r"""Implements a device placement class to send objects on a given device.
 
     The user is responsible to choose the target device.
+
+    Args:
+    ----
+        device (``torch.device`` or str): Specifies the target device.
+        non_blocking (bool, optional): If ``True``, the host to
+            device copies are asynchronous with respect to the host
+            when the source tensors are in pinned memory.
+            Default: ``False``
     """
 
-    def __init__(self, device: Union[torch.device, str]) -> None:
+    def __init__(self, device: Union[torch.device, str], non_blocking: bool = False) -> None:
         if isinstance(device, str):
             device = torch.device(device)
         self.device = device
+        self._non_blocking = bool(non_blocking)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(device={self.device})"
+        return (
+            f"{self.__class__.__qualname__}(device={self.device}, "
+            f"non_blocking={self._non_blocking})"
+        )
 
     def send(self, obj: Any) -> Any:
         r"""Sends the object on a target device.
@@ -38,7 +50,7 @@ class ManualDevicePlacement(BaseDevicePlacement):
         -------
             The object on the target device.
         """
-        return move_to_device(obj, self.device)
+        return move_to_device(obj, self.device, non_blocking=self._non_blocking)
 
 
 class CpuDevicePlacement(ManualDevicePlacement):
@@ -55,10 +67,14 @@ class CudaDevicePlacement(ManualDevicePlacement):
     ----
         index (int, optional): Specifies the index of the cuda device.
             Default: ``0``
+        non_blocking (bool, optional): If ``True``, the host to
+            device copies are asynchronous with respect to the host
+            when the source tensors are in pinned memory.
+            Default: ``False``
     """
 
-    def __init__(self, index: int = 0) -> None:
-        super().__init__(torch.device(type="cuda", index=index))
+    def __init__(self, index: int = 0, non_blocking: bool = False) -> None:
+        super().__init__(torch.device(type="cuda", index=index), non_blocking=non_blocking)
 
 
 class MpsDevicePlacement(ManualDevicePlacement):
@@ -0,0 +1,159 @@
+__all__ = ["CudaStreamPrefetcher"]
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeVar
+
+import torch
+
+from gravitorch.utils.device_placement.base import BaseDevicePlacement
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CudaStreamPrefetcher(Iterable[T]):
+    r"""Implements an iterable that sends the next batch on the target
+    device while the current batch is processed.
+
+    The next batch is sent to the target device on a dedicated CUDA
+    stream, so the host to device copy of the next batch overlaps
+    with the computation on the current batch. The copies are only
+    asynchronous if the device placement uses non-blocking copies
+    (e.g. ``AutoDevicePlacement(non_blocking=True)``) and the batches
+    are in pinned memory. If CUDA is not available, each batch is
+    sent to the target device when it is requested.
+
+    Args:
+    ----
+        batch_loader (``Iterable``): Specifies the batch loader.
+        device_placement (``BaseDevicePlacement``): Specifies the
+            device placement module used to send the batches on the
+            target device.
+
+    Example usage:
+
+    .. code-block:: python
+
+        >>> import torch
+        >>> from gravitorch.utils.device_placement import (
+        ...     AutoDevicePlacement,
+        ...     CudaStreamPrefetcher,
+        ... )
+        >>> prefetcher = CudaStreamPrefetcher(
+        ...     [torch.ones(2, 3), torch.zeros(2, 3)], AutoDevicePlacement(non_blocking=True)
+        ... )
+        >>> for batch in prefetcher:
+        ...     pass  # do something
+    """
+
+    def __init__(self, batch_loader: Iterable[T], device_placement: BaseDevicePlacement) -> None:
+        self._batch_loader = batch_loader
+        self._device_placement = device_placement
+
+    def __iter__(self) -> Iterator[T]:
+        if not torch.cuda.is_available():
+            for batch in self._batch_loader:
+                yield self._device_placement.send(batch)
+            return
+
+        stream = torch.cuda.Stream()
+        iterator = iter(self._batch_loader)
+        batch = self._preload(iterator, stream, check_pinned=True)
+        while batch is not _END:
+            current_stream = torch.cuda.current_stream()
+            current_stream.wait_stream(stream)
+            # The memory of the batch was allocated on the prefetching stream so it has to be
+            # marked as used by the current stream before the next batch is preloaded.
+            _record_stream(batch, current_stream)
+            next_batch = self._preload(iterator, stream)
+            yield batch
+            batch = next_batch
+
+    def __len__(self) -> int:
+        return len(self._batch_loader)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(batch_loader={self._batch_loader}, "
+            f"device_placement={self._device_placement})"
+        )
+
+    def _preload(
+        self, iterator: Iterator[T], stream: torch.cuda.Stream, check_pinned: bool = False
+    ) -> Any:
+        r"""Sends the next batch on the target device by using the
+        prefetching stream.
+
+        Args:
+        ----
+            iterator (``Iterator``): Specifies the batch iterator.
+            stream (``torch.cuda.Stream``): Specifies the prefetching
+                stream.
+            check_pinned (bool, optional): If ``True``, a warning is
+                logged if the batch has some CPU tensors that are not
+                in pinned memory. Default: ``False``
+
+        Returns:
+        -------
+            The batch on the target device or a sentinel object if
+                there is no more batch.
+        """
+        batch = next(iterator, _END)
+        if batch is _END:
+            return _END
+        if check_pinned and _has_unpinned_cpu_tensor(batch):
+            logger.warning(
+                "The batches are not in pinned memory so the host to device copies cannot "
+                "overlap with the computation. You can set pin_memory=True in the data loader"
+            )
+        with torch.cuda.stream(stream):
+            return self._device_placement.send(batch)
+
+
+# Sentinel used to indicate there is no more batch.
+_END = object()
+
+
+def _has_unpinned_cpu_tensor(data: Any) -> bool:
+    r"""Indicates if the data has at least a CPU tensor that is not in
+    pinned memory.
+
+    Args:
+    ----
+        data: Specifies the data. The tensors are found recursively
+            in lists, tuples, sets and dictionaries.
+
+    Returns:
+    -------
+        bool: ``True`` if the data has at least a CPU tensor that is
+            not in pinned memory, otherwise ``False``.
+    """
+    if torch.is_tensor(data):
+        return data.device.type == "cpu" and not data.is_pinned()
+    if isinstance(data, (list, tuple, set)):
+        return any(_has_unpinned_cpu_tensor(item) for item in data)
+    if isinstance(data, dict):
+        return any(_has_unpinned_cpu_tensor(value) for value in data.values())
+    return False
+
+
+def _record_stream(data: Any, stream: torch.cuda.Stream) -> None:
+    r"""Marks the CUDA tensors of the data as used by a stream.
+
+    Args:
+    ----
+        data: Specifies the data. The tensors are found recursively
+            in lists, tuples, sets and dictionaries.
+        stream (``torch.cuda.Stream``): Specifies the stream.
+    """
+    if torch.is_tensor(data):
+        if data.is_cuda:
+            data.record_stream(stream)
+    elif isinstance(data, (list, tuple, set)):
+        for item in data:
+            _record_stream(item, stream)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _record_stream(value, stream)
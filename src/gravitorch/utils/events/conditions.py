@@ -20,6 +20,8 @@ class PeriodicCondition:
         freq (int): Specifies the frequency.
     """
 
+    __slots__ = ("_freq", "_step")
+
     def __init__(self, freq: int) -> None:
         self._freq = int(freq)
         self._step = 0
@@ -61,6 +63,8 @@ class EpochPeriodicCondition:
         freq (int): Specifies the frequency.
     """
 
+    __slots__ = ("_engine", "_freq")
+
     def __init__(self, engine: BaseEngine, freq: int) -> None:
         self._engine = engine
         self._freq = int(freq)
@@ -100,6 +104,8 @@ class IterationPeriodicCondition:
         freq (int): Specifies the frequency.
     """
 
+    __slots__ = ("_engine", "_freq")
+
     def __init__(self, engine: BaseEngine, freq: int) -> None:
         self._engine = engine
         self._freq = int(freq)
@@ -7,7 +7,7 @@ import torch
 from coola import objects_are_equal
 from torch import Tensor
 
-from gravitorch.distributed.ddp import MAX, MIN, SUM, sync_reduce
+from gravitorch.distributed.ddp import MAX, SUM, sync_reduce
 from gravitorch.utils.format import to_pretty_dict_str
 from gravitorch.utils.meters.exceptions import EmptyMeterError
 from gravitorch.utils.tensor import scalable_quantile
@@ -76,7 +76,7 @@ class MeanTensorMeter:
             tensor (``torch.Tensor``): Specifies the new tensor to add
                 to the meter.
         """
-        self._total += tensor.sum().item()
+        self._total += _sum(tensor)
         self._count += tensor.numel()
 
     def average(self) -> float:
@@ -148,9 +148,10 @@ class MeanTensorMeter:
             >>> meter.update(torch.arange(6))
             >>> reduced_meter = meter.all_reduce()
         """
-        return MeanTensorMeter(
-            count=sync_reduce(self._count, SUM), total=sync_reduce(self._total, SUM)
-        )
+        count, total = _sync_reduce_values([self._count, self._total], SUM)
+        if isinstance(self._total, int) and total.is_integer():
+            total = int(total)
+        return MeanTensorMeter(count=int(count), total=total)
 
     def clone(self) -> "MeanTensorMeter":
         r"""Creates a copy of the current meter.
@@ -354,10 +355,9 @@ class ExtremaTensorMeter:
             >>> meter.update(torch.arange(6))
             >>> reduced_meter = meter.all_reduce()
         """
+        neg_min_value, max_value = _sync_reduce_values([-self._min_value, self._max_value], MAX)
         return ExtremaTensorMeter(
-            count=sync_reduce(self._count, SUM),
-            min_value=sync_reduce(self._min_value, MIN),
-            max_value=sync_reduce(self._max_value, MAX),
+            count=sync_reduce(self._count, SUM), min_value=-neg_min_value, max_value=max_value
         )
 
     def clone(self) -> "ExtremaTensorMeter":
@@ -454,8 +454,8 @@ class TensorMeter:
     ----
         count (int, optional): Specifies the initial count value.
             Default: ``0``
-        total (float, optional): Specifies the initial sum value.
-            Default: ``0.0``
+        total (int or float, optional): Specifies the initial sum
+            value. Default: ``0.0``
         min_value (int, optional): Specifies the initial minimum
             value. Default: ``inf``
         max_value (int, optional): Specifies the initial maximum
@@ -485,12 +485,12 @@ class TensorMeter:
     def __init__(
         self,
         count: int = 0,
-        total: float = 0.0,
+        total: Union[int, float] = 0.0,
         min_value: float = float("inf"),
         max_value: float = float("-inf"),
     ) -> None:
         self._count = int(count)
-        self._total = float(total)
+        self._total = total
         self._min_value = float(min_value)
         self._max_value = float(max_value)
 
@@ -551,11 +551,12 @@ class TensorMeter:
             >>> meter.update(torch.arange(6))
             >>> reduced_meter = meter.all_reduce()
         """
+        count, total = _sync_reduce_values([self._count, self._total], SUM)
+        if isinstance(self._total, int) and total.is_integer():
+            total = int(total)
+        neg_min_value, max_value = _sync_reduce_values([-self._min_value, self._max_value], MAX)
         return TensorMeter(
-            count=sync_reduce(self._count, SUM),
-            total=sync_reduce(self._total, SUM),
-            min_value=sync_reduce(self._min_value, MIN),
-            max_value=sync_reduce(self._max_value, MAX),
+            count=int(count), total=total, min_value=-neg_min_value, max_value=max_value
         )
 
     def clone(self) -> "TensorMeter":
@@ -671,7 +672,7 @@ class TensorMeter:
         min_value, max_value = torch.aminmax(tensor)
         self._max_value = max(self._max_value, max_value.item())
         self._min_value = min(self._min_value, min_value.item())
-        self._total += tensor.sum().item()
+        self._total += _sum(tensor)
         self._count += tensor.numel()
 
     def average(self) -> float:
@@ -1040,3 +1041,47 @@ class TensorMeter2:
             dict: The state values in a dict.
         """
         return {"values": self._values.values()}
+
+
+def _sum(tensor: Tensor) -> Union[int, float]:
+    r"""Computes the sum of the values of a tensor.
+
+    The floating point values are summed in float64 to limit the
+    precision loss and the overflows when the tensor has a lot of
+    values or a reduced precision (e.g. float16). The values are
+    summed in float32 on the MPS devices because they do not support
+    float64.
+
+    Args:
+    ----
+        tensor (``torch.Tensor``): Specifies the tensor.
+
+    Returns:
+    -------
+        int or float: The sum of the values.
+    """
+    if tensor.is_floating_point():
+        if tensor.device.type == "mps":
+            return tensor.sum(dtype=torch.float32).item()
+        return tensor.sum(dtype=torch.float64).item()
+    return tensor.sum().item()
+
+
+def _sync_reduce_values(values: list[Union[int, float]], op: str) -> list[float]:
+    r"""Reduces several scalar values across all the processes with a
+    single collective operation.
+
+    The values are packed in a float64 tensor, so the integer values
+    are exact up to ``2**53``. The minimum of some values can be
+    reduced with the ``MAX`` operation by negating them.
+
+    Args:
+    ----
+        values (list): Specifies the values to reduce.
+        op (str): Specifies the reduction operation.
+
+    Returns:
+    -------
+        list: The reduced values.
+    """
+    return sync_reduce(torch.tensor(values, dtype=torch.float64), op).tolist()
@@ -7,7 +7,7 @@ __all__ = ["ScalarMetricTracker"]
 import logging
 import math
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import torch
 
@@ -27,6 +27,19 @@ class ScalarMetricTracker:
     This tracker use the ``ScalarMeter`` to track some values of each
     metric.
 
+    Converting a CUDA tensor to a Python number synchronizes the host
+    with the device. To avoid a synchronization at each update, the
+    single-element tensors can be buffered on their device and
+    converted together every ``sync_every`` updates.
+
+    Args:
+    ----
+        sync_every (int, optional): Specifies the number of updates
+            between two conversions of the buffered tensors. If ``1``,
+            the tensors are converted at each update. If ``0``, the
+            tensors are only converted when the average values are
+            logged. Default: ``1``
+
     Example usage:
 
     .. code-block:: python
@@ -41,8 +54,16 @@ class ScalarMetricTracker:
         INFO:gravitorch.utils.metric_tracker:metric2: 12.0000
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sync_every: int = 1) -> None:
+        if sync_every < 0:
+            raise ValueError(f"sync_every has to be greater or equal to 0 (received: {sync_every})")
+        self._sync_every = int(sync_every)
         self._metrics = defaultdict(ScalarMeter)
+        self._buffers = defaultdict(list)
+        self._num_updates = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(sync_every={self._sync_every})"
 
     def update(self, data: dict) -> None:
         r"""Tracks the values that can be convert in int or float.
@@ -65,9 +86,54 @@ class ScalarMetricTracker:
         """
         for key, value in data.items():
             if torch.is_tensor(value) and value.numel() == 1:
+                if self._sync_every != 1:
+                    self._buffers[key].append(value.detach().reshape(()))
+                    continue
                 value = value.item()  # get number from a torch scalar
-            if isinstance(value, (int, float)) and not math.isnan(value):
-                self._metrics[key].update(value)
+            self._update_meter(key, value)
+
+        if self._buffers and self._sync_every > 1:
+            self._num_updates += 1
+            if self._num_updates % self._sync_every == 0:
+                self.sync()
+
+    def sync(self) -> None:
+        r"""Converts the buffered tensors to Python numbers and tracks
+        them.
+
+        The tensors of each metric are converted with a single copy to
+        the host if they have the same device and data type, otherwise
+        they are converted one by one.
+
+        Example usage:
+
+        .. code-block:: python
+
+            >>> import torch
+            >>> from gravitorch.utils.metric_tracker import ScalarMetricTracker
+            >>> tracker = ScalarMetricTracker(sync_every=0)
+            >>> tracker.update({'metric1': torch.tensor(1.0)})
+            >>> tracker.sync()
+        """
+        for key, values in self._buffers.items():
+            if len({(value.device, value.dtype) for value in values}) == 1:
+                values = torch.stack(values).tolist()
+            else:
+                values = [value.item() for value in values]
+            for value in values:
+                self._update_meter(key, value)
+        self._buffers.clear()
+
+    def _update_meter(self, key: str, value: Any) -> None:
+        r"""Updates the meter of a metric if the value is a number.
+
+        Args:
+        ----
+            key (str): Specifies the metric name.
+            value: Specifies the metric value.
+        """
+        if isinstance(value, (int, float)) and not math.isnan(value):
+            self._metrics[key].update(value)
 
     def log_average_value(self, engine: BaseEngine | None = None, prefix: str = "") -> None:
         r"""Logs the average value of the metrics to the engine.
@@ -93,6 +159,7 @@ class ScalarMetricTracker:
             INFO:gravitorch.utils.metric_tracker:train/metric1: 1.000000
             INFO:gravitorch.utils.metric_tracker:train/metric2: 2.000000
         """
+        self.sync()
         metrics = {f"{prefix}{key}": value.average() for key, value in self._metrics.items()}
         if engine:
             engine.log_metrics(metrics, step=EpochStep(engine.epoch))
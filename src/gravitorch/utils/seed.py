@@ -145,9 +145,9 @@ class TorchRandomSeedSetter(BaseRandomSeedSetter):
         return f"{self.__class__.__qualname__}()"
 
     def manual_seed(self, seed: int) -> None:
+        # ``torch.manual_seed`` also seeds all the CUDA devices. The CUDA seeding is delayed
+        # until CUDA is initialized so it does not initialize CUDA.
         torch.manual_seed(seed)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed_all(seed)
 
 
 class RandomSeedSetter(BaseRandomSeedSetter):
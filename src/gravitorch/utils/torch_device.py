@@ -30,7 +30,7 @@ def get_available_devices() -> tuple[str, ...]:
     return ("cpu",)
 
 
-def move_to_device(data: T, device: torch.device) -> T:
+def move_to_device(data: T, device: torch.device, non_blocking: bool = False) -> T:
     r"""Moves an object to a given device.
 
     If the object is a nested object (e.g. list, tuple, dictionary,
@@ -55,6 +55,10 @@ def move_to_device(data: T, device: torch.device) -> T:
             device.
         device (``torch.device``): Specifies the device to send the
             data to.
+        non_blocking (bool, optional): If ``True``, the host to
+            device copies are asynchronous with respect to the host
+            when the source tensors are in pinned memory.
+            Default: ``False``
 
     Returns:
     -------
@@ -75,11 +79,13 @@ def move_to_device(data: T, device: torch.device) -> T:
          'tensor2': tensor([0., 0., 0., 0.], device='cuda:0')}
     """
     if isinstance(data, PackedSequence):
-        return data.to(device)
+        return data.to(device, non_blocking=non_blocking)
     if isinstance(data, (list, tuple, set)):
-        return type(data)(move_to_device(t, device) for t in data)
+        return type(data)(move_to_device(t, device, non_blocking) for t in data)
     if isinstance(data, dict):
-        return type(data)({k: move_to_device(v, device) for k, v in data.items()})
+        return type(data)({k: move_to_device(v, device, non_blocking) for k, v in data.items()})
     if not hasattr(data, "to"):
         return data
+    if non_blocking:
+        return data.to(device, non_blocking=True)
     return data.to(device)
@@ -3,6 +3,7 @@ from objectory import OBJECT_TARGET
 from gravitorch.creators.dataloader import (
     AutoDataLoaderCreator,
     VanillaDataLoaderCreator,
+    WarmupDataLoaderCreator,
     setup_data_loader_creator,
 )
 
@@ -21,3 +22,10 @@ def test_setup_data_loader_creator_config() -> None:
 def test_setup_data_loader_creator_object() -> None:
     data_loader_creator = setup_data_loader_creator(VanillaDataLoaderCreator())
     assert isinstance(data_loader_creator, VanillaDataLoaderCreator)
+
+
+def test_setup_data_loader_creator_prefetch_init() -> None:
+    creator = VanillaDataLoaderCreator()
+    data_loader_creator = setup_data_loader_creator(creator, prefetch_init=True)
+    assert isinstance(data_loader_creator, WarmupDataLoaderCreator)
+    assert data_loader_creator._data_loader_creator is creator
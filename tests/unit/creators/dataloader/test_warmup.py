@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, Mock
+
+import torch
+from objectory import OBJECT_TARGET
+from torch import Tensor
+from torch.utils.data import DataLoader, Dataset
+
+from gravitorch.creators.dataloader import (
+    BaseDataLoaderCreator,
+    VanillaDataLoaderCreator,
+    WarmupDataLoaderCreator,
+)
+from gravitorch.creators.dataloader.warmup import _WarmDataLoader
+from gravitorch.engines import BaseEngine
+
+
+class FakeDataset(Dataset):
+    def __len__(self) -> int:
+        return 20
+
+    def __getitem__(self, item: int) -> Tensor:
+        return item * torch.ones(5)
+
+
+#############################################
+#     Tests for WarmupDataLoaderCreator     #
+#############################################
+
+
+def test_warmup_data_loader_creator_str() -> None:
+    assert str(WarmupDataLoaderCreator(VanillaDataLoaderCreator())).startswith(
+        "WarmupDataLoaderCreator("
+    )
+
+
+def test_warmup_data_loader_creator_data_loader_creator_config() -> None:
+    assert isinstance(
+        WarmupDataLoaderCreator(
+            {OBJECT_TARGET: "gravitorch.creators.dataloader.VanillaDataLoaderCreator"}
+        )._data_loader_creator,
+        VanillaDataLoaderCreator,
+    )
+
+
+def test_warmup_data_loader_creator_create() -> None:
+    dataset = FakeDataset()
+    engine = Mock(spec=BaseEngine)
+    data_loader = MagicMock(spec=DataLoader, num_workers=2)
+    creator = Mock(spec=BaseDataLoaderCreator, create=Mock(return_value=data_loader))
+    warm_data_loader = WarmupDataLoaderCreator(creator).create(dataset, engine)
+    assert isinstance(warm_data_loader, _WarmDataLoader)
+    assert warm_data_loader._data_loader is data_loader
+    data_loader.__iter__.assert_called_once_with()
+    creator.create.assert_called_once_with(dataset=dataset, engine=engine)
+
+
+def test_warmup_data_loader_creator_create_no_workers() -> None:
+    data_loader = WarmupDataLoaderCreator(VanillaDataLoaderCreator(batch_size=4)).create(
+        FakeDataset()
+    )
+    assert isinstance(data_loader, DataLoader)
+    assert len(list(data_loader)) == 5
+
+
+def test_warmup_data_loader_creator_create_not_data_loader() -> None:
+    data_loader = [1, 2, 3]
+    creator = Mock(spec=BaseDataLoaderCreator, create=Mock(return_value=data_loader))
+    assert WarmupDataLoaderCreator(creator).create(FakeDataset()) is data_loader
+
+
+def test_warmup_data_loader_creator_create_same_batches() -> None:
+    creator = VanillaDataLoaderCreator(batch_size=4, shuffle=True, num_workers=2)
+    data_loader = WarmupDataLoaderCreator(creator).create(FakeDataset())
+    assert isinstance(data_loader, _WarmDataLoader)
+    batches = list(data_loader)
+    expected = list(creator.create(FakeDataset()))
+    assert len(batches) == len(expected) == 5
+    assert all(batch.equal(expected_batch) for batch, expected_batch in zip(batches, expected))
+
+
+#####################################
+#     Tests for _WarmDataLoader     #
+#####################################
+
+
+def test_warm_data_loader_str() -> None:
+    assert str(_WarmDataLoader(MagicMock(spec=DataLoader))).startswith("_WarmDataLoader(")
+
+
+def test_warm_data_loader_iter() -> None:
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.__iter__.side_effect = [iter([1, 2]), iter([3, 4]), iter([5, 6])]
+    warm_data_loader = _WarmDataLoader(data_loader)
+    assert data_loader.__iter__.call_count == 1
+    assert list(warm_data_loader) == [1, 2]
+    assert data_loader.__iter__.call_count == 1
+    assert list(warm_data_loader) == [3, 4]
+    assert list(warm_data_loader) == [5, 6]
+    assert data_loader.__iter__.call_count == 3
+
+
+def test_warm_data_loader_len() -> None:
+    data_loader = MagicMock(spec=DataLoader)
+    data_loader.__len__.return_value = 5
+    assert len(_WarmDataLoader(data_loader)) == 5
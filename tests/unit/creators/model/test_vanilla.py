@@ -57,6 +57,10 @@ def test_vanilla_model_creator_device_placement_cpu() -> None:
     )
 
 
+def test_vanilla_model_creator_channels_last_default() -> None:
+    assert not VanillaModelCreator(model_config={})._channels_last
+
+
 def test_vanilla_model_creator_create_attach_model_to_engine_true() -> None:
     creator = VanillaModelCreator(
         model_config={OBJECT_TARGET: "torch.nn.Linear", "in_features": 8, "out_features": 2}
@@ -114,3 +118,18 @@ def test_vanilla_model_creator_create_device_placement_cuda() -> None:
     model = creator.create(engine=Mock())
     assert isinstance(model, nn.Linear)
     assert get_module_device(model) == torch.device("cuda:0")
+
+
+def test_vanilla_model_creator_create_channels_last() -> None:
+    creator = VanillaModelCreator(
+        model_config={
+            OBJECT_TARGET: "torch.nn.Conv2d",
+            "in_channels": 3,
+            "out_channels": 4,
+            "kernel_size": 3,
+        },
+        device_placement=CpuDevicePlacement(),
+        channels_last=True,
+    )
+    model = creator.create(engine=Mock())
+    assert model.weight.is_contiguous(memory_format=torch.channels_last)
@@ -1,9 +1,12 @@
 from unittest.mock import Mock, patch
 
+import numpy as np
 import torch
+from coola import objects_are_equal
 from pytest import mark
 
 from gravitorch.data.datacreators import BaseDataCreator, OneCacheDataCreator
+from gravitorch.data.datacreators.caching import _fast_deepcopy, _freeze
 from gravitorch.engines import BaseEngine
 
 #########################################
@@ -15,6 +18,10 @@ def test_one_cache_data_creator_str() -> None:
     assert str(OneCacheDataCreator(Mock(spec=BaseDataCreator))).startswith("OneCacheDataCreator(")
 
 
+def test_one_cache_data_creator_no_dict() -> None:
+    assert not hasattr(OneCacheDataCreator(Mock(spec=BaseDataCreator)), "__dict__")
+
+
 def test_one_cache_data_creator_data_creator() -> None:
     creator = Mock(spec=BaseDataCreator)
     assert OneCacheDataCreator(creator).data_creator is creator
@@ -25,6 +32,11 @@ def test_one_cache_data_creator_deepcopy(deepcopy: bool) -> None:
     assert OneCacheDataCreator(Mock(spec=BaseDataCreator), deepcopy=deepcopy).deepcopy == deepcopy
 
 
+@mark.parametrize("readonly", (True, False))
+def test_one_cache_data_creator_readonly(readonly: bool) -> None:
+    assert OneCacheDataCreator(Mock(spec=BaseDataCreator), readonly=readonly).readonly == readonly
+
+
 def test_one_cache_data_creator_create_no_engine() -> None:
     creator = Mock(spec=BaseDataCreator, create=Mock(return_value=torch.ones(2, 3)))
     data_creator = OneCacheDataCreator(creator)
@@ -67,9 +79,120 @@ def test_one_cache_data_creator_create_repeat_deepcopy_true() -> None:
 def test_one_cache_data_creator_create_repeat_deepcopy_true_incorrect_type() -> None:
     creator = Mock(spec=BaseDataCreator, create=Mock(return_value=torch.ones(2, 3)))
     data_creator = OneCacheDataCreator(creator, deepcopy=True)
-    with patch("gravitorch.data.datacreators.caching.copy.deepcopy", Mock(side_effect=TypeError)):
+    with patch("gravitorch.data.datacreators.caching._fast_deepcopy", Mock(side_effect=TypeError)):
         data1 = data_creator.create()
         data2 = data_creator.create()
         assert data1 is data2
         assert data1.equal(data2)
         creator.create.assert_called_once_with(None)
+
+
+def test_one_cache_data_creator_create_repeat_deepcopy_true_nested() -> None:
+    creator = Mock(
+        spec=BaseDataCreator,
+        create=Mock(return_value={"key1": [torch.ones(2, 3), np.ones(4)], "key2": ("abc", 1)}),
+    )
+    data_creator = OneCacheDataCreator(creator, deepcopy=True)
+    data1 = data_creator.create()
+    data2 = data_creator.create()
+    assert data1 is not data2
+    assert data1["key1"][0] is not data2["key1"][0]
+    assert data1["key1"][1] is not data2["key1"][1]
+    assert objects_are_equal(data1, data2)
+
+
+def test_one_cache_data_creator_create_repeat_readonly_true() -> None:
+    creator = Mock(
+        spec=BaseDataCreator,
+        create=Mock(
+            return_value={"key1": torch.ones(2, 3, requires_grad=True), "key2": np.ones(4)}
+        ),
+    )
+    data_creator = OneCacheDataCreator(creator, readonly=True)
+    data1 = data_creator.create()
+    data2 = data_creator.create()
+    assert data1 is data2
+    assert not data1["key1"].requires_grad
+    assert not data1["key2"].flags.writeable
+    creator.create.assert_called_once_with(None)
+
+
+def test_one_cache_data_creator_create_repeat_readonly_true_deepcopy_true() -> None:
+    creator = Mock(spec=BaseDataCreator, create=Mock(return_value={"key": np.ones(4)}))
+    data_creator = OneCacheDataCreator(creator, deepcopy=True, readonly=True)
+    data1 = data_creator.create()
+    data2 = data_creator.create()
+    assert data1 is not data2
+    assert data1["key"] is not data2["key"]
+    assert np.array_equal(data1["key"], data2["key"])
+    assert not data_creator._cached_data["key"].flags.writeable
+
+
+####################################
+#     Tests for _fast_deepcopy     #
+####################################
+
+
+def test_fast_deepcopy_tensor() -> None:
+    tensor = torch.ones(2, 3)
+    copy = _fast_deepcopy(tensor)
+    assert copy is not tensor
+    assert copy.equal(tensor)
+    assert copy.data_ptr() != tensor.data_ptr()
+
+
+def test_fast_deepcopy_tensor_requires_grad() -> None:
+    tensor = torch.ones(2, 3, requires_grad=True)
+    copy = _fast_deepcopy(tensor)
+    assert copy.requires_grad
+    assert copy.is_leaf
+
+
+def test_fast_deepcopy_ndarray() -> None:
+    array = np.ones((2, 3))
+    copy = _fast_deepcopy(array)
+    assert copy is not array
+    assert np.array_equal(copy, array)
+    assert not np.shares_memory(copy, array)
+
+
+def test_fast_deepcopy_nested() -> None:
+    data = {"key1": [torch.ones(2, 3), np.ones(4)], "key2": ("abc", {"key3": 1})}
+    copy = _fast_deepcopy(data)
+    assert copy is not data
+    assert copy["key1"] is not data["key1"]
+    assert copy["key2"][1] is not data["key2"][1]
+    assert objects_are_equal(copy, data)
+
+
+def test_fast_deepcopy_not_picklable() -> None:
+    data = [lambda x: x]
+    copy = _fast_deepcopy(data)
+    assert copy is not data
+    assert copy[0] is data[0]
+
+
+#############################
+#     Tests for _freeze     #
+#############################
+
+
+def test_freeze_tensor() -> None:
+    tensor = torch.ones(2, 3, requires_grad=True)
+    frozen = _freeze(tensor)
+    assert not frozen.requires_grad
+    assert frozen.data_ptr() == tensor.data_ptr()
+
+
+def test_freeze_ndarray() -> None:
+    array = np.ones((2, 3))
+    assert _freeze(array) is array
+    assert not array.flags.writeable
+
+
+def test_freeze_nested() -> None:
+    data = {"key1": [torch.ones(2, 3, requires_grad=True), np.ones(4)], "key2": ("abc", 1)}
+    frozen = _freeze(data)
+    assert not frozen["key1"][0].requires_grad
+    assert not frozen["key1"][1].flags.writeable
+    assert frozen["key2"] == ("abc", 1)
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import torch
 from pytest import fixture, mark, raises
-from torch.utils.data import BatchSampler, SequentialSampler
+from torch.utils.data import BatchSampler, RandomSampler, SequentialSampler
 
 from gravitorch.data.dataloaders.samplers import (
     PartialRandomSampler,
@@ -46,6 +46,63 @@ def test_reproducible_batch_sampler_start_iteration(
     assert list(rbs) == batch_indices
 
 
+@mark.parametrize(
+    "start_iteration,batch_indices",
+    (
+        (0, [[0, 1, 2], [3, 4, 5], [6, 7, 8]]),
+        (1, [[3, 4, 5], [6, 7, 8]]),
+        (3, []),
+        (4, []),
+    ),
+)
+def test_reproducible_batch_sampler_start_iteration_drop_last(
+    start_iteration: int, batch_indices: list[int]
+) -> None:
+    rbs = ReproducibleBatchSampler(
+        BatchSampler(SequentialSampler(range(10)), batch_size=3, drop_last=True),
+        start_iteration=start_iteration,
+    )
+    assert list(rbs) == batch_indices
+
+
+@mark.parametrize(
+    "start_iteration,batch_indices",
+    ((0, [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]), (2, [[6, 7, 8], [9]]), (4, [])),
+)
+def test_reproducible_batch_sampler_start_iteration_custom_batch_sampler(
+    start_iteration: int, batch_indices: list[int]
+) -> None:
+    class MyBatchSampler(BatchSampler):
+        pass
+
+    rbs = ReproducibleBatchSampler(
+        MyBatchSampler(SequentialSampler(range(10)), batch_size=3, drop_last=False),
+        start_iteration=start_iteration,
+    )
+    assert list(rbs) == batch_indices
+
+
+def test_reproducible_batch_sampler_start_iteration_random_sampler() -> None:
+    batch_sampler = BatchSampler(
+        RandomSampler(range(10), generator=torch.Generator().manual_seed(42)),
+        batch_size=3,
+        drop_last=False,
+    )
+    batches = list(batch_sampler)
+    batch_sampler.sampler.generator.manual_seed(42)
+    assert list(ReproducibleBatchSampler(batch_sampler, start_iteration=2)) == batches[2:]
+
+
+@mark.parametrize(
+    "start_iteration,length",
+    ((0, 4), (1, 3), (2, 2), (3, 1), (4, 0), (5, 0)),
+)
+def test_reproducible_batch_sampler_len(
+    batch_sampler: BatchSampler, start_iteration: int, length: int
+) -> None:
+    assert len(ReproducibleBatchSampler(batch_sampler, start_iteration=start_iteration)) == length
+
+
 def test_reproducible_batch_sampler_incorrect() -> None:
     with raises(
         TypeError, match="Argument batch_sampler should be torch.utils.data.sampler.BatchSampler"
@@ -97,6 +154,11 @@ def test_partial_sequential_sampler_num_samples_20_but_only_10_examples() -> Non
     ]
 
 
+@mark.parametrize("num_samples,length", ((5, 5), (10, 10), (20, 10)))
+def test_partial_sequential_sampler_len(num_samples: int, length: int) -> None:
+    assert len(PartialSequentialSampler(range(10), num_samples=num_samples)) == length
+
+
 def test_partial_sequential_sampler_incorrect() -> None:
     with raises(ValueError, match="num_samples should be a positive integer value, but got"):
         PartialSequentialSampler(range(10), num_samples=0)
@@ -122,6 +184,27 @@ def test_partial_random_sampler_num_samples_20_but_only_10_examples() -> None:
     assert list(PartialRandomSampler(range(10), num_samples=20)) == [6, 5, 4, 0, 8, 9, 2, 1, 3, 7]
 
 
+def test_partial_random_sampler_num_samples_5_with_1000_examples() -> None:
+    indices = list(PartialRandomSampler(range(1000), num_samples=5))
+    assert len(indices) == 5
+    assert len(set(indices)) == 5
+    assert all(0 <= index < 1000 for index in indices)
+
+
+def test_partial_random_sampler_num_samples_5_with_1000_examples_same_random_seed() -> None:
+    sampler = PartialRandomSampler(range(1000), num_samples=5)
+    torch.manual_seed(1)
+    indices1 = list(sampler)
+    torch.manual_seed(1)
+    indices2 = list(sampler)
+    assert indices1 == indices2
+
+
+def test_partial_random_sampler_num_samples_5_with_1000_examples_multiple_epochs() -> None:
+    sampler = PartialRandomSampler(range(1000), num_samples=5)
+    assert list(sampler) != list(sampler)
+
+
 def test_partial_random_sampler_incorrect() -> None:
     with raises(ValueError, match="num_samples should be a positive integer value, but got"):
         PartialRandomSampler(range(10), num_samples=0)
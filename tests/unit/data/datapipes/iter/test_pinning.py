@@ -0,0 +1,45 @@
+from unittest.mock import Mock, patch
+
+import torch
+from pytest import raises
+
+from gravitorch.data.datapipes.iter import PinMemory, SourceWrapper
+from gravitorch.testing import cuda_available
+
+###############################
+#     Tests for PinMemory     #
+###############################
+
+
+def test_pin_memory_str() -> None:
+    assert str(PinMemory(SourceWrapper([]))).startswith("PinMemoryIterDataPipe(")
+
+
+def test_pin_memory_iter_no_cuda() -> None:
+    with patch("torch.cuda.is_available", lambda *args, **kwargs: False):
+        datapipe = PinMemory(SourceWrapper([torch.ones(2), {"key": torch.zeros(3)}]))
+        items = list(datapipe)
+    assert items[0].equal(torch.ones(2))
+    assert items[1]["key"].equal(torch.zeros(3))
+
+
+def test_pin_memory_iter_empty() -> None:
+    assert list(PinMemory(SourceWrapper([]))) == []
+
+
+@cuda_available
+def test_pin_memory_iter_cuda() -> None:
+    items = list(PinMemory(SourceWrapper([torch.ones(2), {"key": torch.zeros(3)}])))
+    assert items[0].equal(torch.ones(2))
+    assert items[0].is_pinned()
+    assert items[1]["key"].equal(torch.zeros(3))
+    assert items[1]["key"].is_pinned()
+
+
+def test_pin_memory_len() -> None:
+    assert len(PinMemory(Mock(__len__=Mock(return_value=5)))) == 5
+
+
+def test_pin_memory_no_len() -> None:
+    with raises(TypeError):
+        len(PinMemory(Mock()))
@@ -0,0 +1,99 @@
+import queue
+import threading
+from collections.abc import Iterator
+from unittest.mock import Mock
+
+from pytest import mark, raises
+from torch.utils.data import IterDataPipe
+
+from gravitorch.data.datapipes.iter import Prefetcher, SourceWrapper
+from gravitorch.data.datapipes.iter.prefetching import _END
+
+
+class FailingIterDataPipe(IterDataPipe):
+    def __iter__(self) -> Iterator:
+        yield 1
+        raise RuntimeError("datapipe error")
+
+
+class InterruptedIterDataPipe(IterDataPipe):
+    def __iter__(self) -> Iterator:
+        yield 1
+        raise KeyboardInterrupt
+
+
+################################
+#     Tests for Prefetcher     #
+################################
+
+
+def test_prefetcher_str() -> None:
+    assert str(Prefetcher(SourceWrapper([]))).startswith("PrefetcherIterDataPipe(")
+
+
+@mark.parametrize("buffer_size", (1, 2, 10))
+def test_prefetcher_iter(buffer_size: int) -> None:
+    assert list(Prefetcher(SourceWrapper([1, 2, 3, 4, 5]), buffer_size=buffer_size)) == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+
+def test_prefetcher_iter_empty() -> None:
+    assert list(Prefetcher(SourceWrapper([]))) == []
+
+
+def test_prefetcher_iter_multiple_times() -> None:
+    datapipe = Prefetcher(SourceWrapper([1, 2, 3]))
+    assert list(datapipe) == [1, 2, 3]
+    assert list(datapipe) == [1, 2, 3]
+
+
+def test_prefetcher_iter_break() -> None:
+    datapipe = Prefetcher(SourceWrapper(list(range(100))), buffer_size=2)
+    items = []
+    for item in datapipe:
+        items.append(item)
+        if item == 2:
+            break
+    assert items == [0, 1, 2]
+
+
+def test_prefetcher_iter_error() -> None:
+    iterator = iter(Prefetcher(FailingIterDataPipe()))
+    assert next(iterator) == 1
+    with raises(RuntimeError, match="datapipe error"):
+        next(iterator)
+
+
+def test_prefetcher_iter_base_exception() -> None:
+    iterator = iter(Prefetcher(InterruptedIterDataPipe()))
+    assert next(iterator) == 1
+    with raises(KeyboardInterrupt):
+        next(iterator)
+
+
+def test_prefetcher_prefetch_end_after_base_exception() -> None:
+    buffer = queue.Queue()
+    Prefetcher(InterruptedIterDataPipe())._prefetch(buffer, threading.Event())
+    assert buffer.get_nowait() == 1
+    assert isinstance(buffer.get_nowait().exception, KeyboardInterrupt)
+    assert buffer.get_nowait() is _END
+    assert buffer.empty()
+
+
+def test_prefetcher_incorrect_buffer_size() -> None:
+    with raises(ValueError, match="Incorrect buffer_size: 0"):
+        Prefetcher(SourceWrapper([1, 2, 3]), buffer_size=0)
+
+
+def test_prefetcher_len() -> None:
+    assert len(Prefetcher(Mock(__len__=Mock(return_value=5)))) == 5
+
+
+def test_prefetcher_no_len() -> None:
+    with raises(TypeError):
+        len(Prefetcher(Mock()))
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import torch
 from pytest import mark, raises
 
 from gravitorch.data.datapipes.iter import SourceWrapper
@@ -26,20 +27,101 @@ def test_source_wrapper_iter_deepcopy_true() -> None:
     assert list(datapipe) == [[0, 1], [0, 2], [0, 3]]
 
 
-def test_source_wrapper_iter_deepcopy_false() -> None:
-    datapipe = SourceWrapper([[0, i] for i in range(1, 4)])
+@mark.parametrize("deepcopy", (False, "never"))
+def test_source_wrapper_iter_deepcopy_false(deepcopy: bool) -> None:
+    datapipe = SourceWrapper([[0, i] for i in range(1, 4)], deepcopy=deepcopy)
     for item in datapipe:
         item.append(2)
     assert list(datapipe) == [[0, 1, 2], [0, 2, 2], [0, 3, 2]]
 
 
-@mark.parametrize("deepcopy", (True, False))
+def test_source_wrapper_iter_deepcopy_always() -> None:
+    datapipe = SourceWrapper([[0, i] for i in range(1, 4)], deepcopy="always")
+    for item in datapipe:
+        item.append(2)
+    assert list(datapipe) == [[0, 1], [0, 2], [0, 3]]
+
+
+def test_source_wrapper_iter_deepcopy_once() -> None:
+    source = [[0, i] for i in range(1, 4)]
+    datapipe = SourceWrapper(source, deepcopy="once")
+    for item in datapipe:
+        item.append(2)
+    assert list(datapipe) == [[0, 1, 2], [0, 2, 2], [0, 3, 2]]
+    assert source == [[0, 1], [0, 2], [0, 3]]
+
+
+@mark.parametrize("deepcopy", (True, "once", "always"))
+def test_source_wrapper_iter_deepcopy_tensor(deepcopy: bool) -> None:
+    source = torch.ones(3, 2)
+    datapipe = SourceWrapper(source, deepcopy=deepcopy)
+    for item in datapipe:
+        item.add_(1)
+    assert source.equal(torch.ones(3, 2))
+
+
+def test_source_wrapper_iter_deepcopy_not_picklable() -> None:
+    source = [[0, lambda x: x]]
+    datapipe = SourceWrapper(source, deepcopy=True)
+    for item in datapipe:
+        item.append(2)
+    assert len(source[0]) == 2
+
+
+def test_source_wrapper_incorrect_deepcopy() -> None:
+    with raises(ValueError, match="Incorrect deepcopy value:"):
+        SourceWrapper([1, 2, 3], deepcopy="incorrect")
+
+
+@mark.parametrize("deepcopy", (True, False, "never", "once", "always"))
 def test_source_wrapper_iter_impossible_deepcopy(deepcopy: bool) -> None:
     datapipe = SourceWrapper(([0, i] for i in range(1, 4)), deepcopy=deepcopy)
     assert list(datapipe) == [[0, 1], [0, 2], [0, 3]]
     assert list(datapipe) == []
 
 
+@mark.parametrize("source", ([1, 2, 3, 4, 5], (1, 2, 3, 4, 5), range(1, 6)))
+@mark.parametrize("deepcopy", (False, True))
+def test_source_wrapper_iter_shard_by_worker(source: Iterable, deepcopy: bool) -> None:
+    datapipe = SourceWrapper(source, deepcopy=deepcopy, shard_by_worker=True)
+    with patch(
+        "gravitorch.data.datapipes.iter.source.get_worker_info",
+        lambda: Mock(id=1, num_workers=2),
+    ):
+        assert list(datapipe) == [2, 4]
+
+
+def test_source_wrapper_iter_shard_by_worker_generator() -> None:
+    datapipe = SourceWrapper((i for i in range(1, 6)), shard_by_worker=True)
+    with patch(
+        "gravitorch.data.datapipes.iter.source.get_worker_info",
+        lambda: Mock(id=1, num_workers=2),
+    ):
+        assert list(datapipe) == [2, 4]
+
+
+def test_source_wrapper_iter_shard_by_worker_tensor() -> None:
+    datapipe = SourceWrapper(torch.arange(5), shard_by_worker=True)
+    with patch(
+        "gravitorch.data.datapipes.iter.source.get_worker_info",
+        lambda: Mock(id=0, num_workers=2),
+    ):
+        assert [item.item() for item in datapipe] == [0, 2, 4]
+
+
+def test_source_wrapper_iter_shard_by_worker_main_process() -> None:
+    assert list(SourceWrapper([1, 2, 3, 4, 5], shard_by_worker=True)) == [1, 2, 3, 4, 5]
+
+
+def test_source_wrapper_iter_shard_by_worker_false() -> None:
+    datapipe = SourceWrapper([1, 2, 3, 4, 5])
+    with patch(
+        "gravitorch.data.datapipes.iter.source.get_worker_info",
+        lambda: Mock(id=1, num_workers=2),
+    ):
+        assert list(datapipe) == [1, 2, 3, 4, 5]
+
+
 def test_source_wrapper_len() -> None:
     assert len(SourceWrapper(Mock(__len__=Mock(return_value=5)))) == 5
 
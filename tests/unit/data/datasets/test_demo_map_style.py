@@ -74,6 +74,21 @@ def test_demo_multiclass_cls_dataset_getitem() -> None:
     assert example[ct.NAME] == "0"
 
 
+def test_demo_multiclass_cls_dataset_getitem_name() -> None:
+    dataset = DemoMultiClassClsDataset(num_examples=10)
+    assert [dataset[i][ct.NAME] for i in range(10)] == [str(i) for i in range(10)]
+
+
+def test_demo_multiclass_cls_dataset_getitems() -> None:
+    dataset = DemoMultiClassClsDataset(num_examples=10)
+    examples = dataset.__getitems__([3, 0, 7])
+    assert len(examples) == 3
+    for item, example in zip([3, 0, 7], examples):
+        assert example[ct.INPUT].equal(dataset[item][ct.INPUT])
+        assert example[ct.TARGET].equal(dataset[item][ct.TARGET])
+        assert example[ct.NAME] == str(item)
+
+
 @mark.parametrize("num_examples", (1, 4, 8))
 def test_demo_multiclass_cls_dataset_len(num_examples: int) -> None:
     dataset = DemoMultiClassClsDataset(num_examples)
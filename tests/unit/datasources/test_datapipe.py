@@ -2,14 +2,14 @@ import logging
 from unittest.mock import Mock
 
 from objectory import OBJECT_TARGET
-from pytest import LogCaptureFixture, fixture, raises
+from pytest import LogCaptureFixture, fixture, mark, raises
 
 from gravitorch.creators.datapipe import (
     BaseIterDataPipeCreator,
     SequentialIterDataPipeCreator,
 )
 from gravitorch.data.datacreators import BaseDataCreator, HypercubeVertexDataCreator
-from gravitorch.data.datapipes.iter import SourceWrapper
+from gravitorch.data.datapipes.iter import PinMemory, Prefetcher, SourceWrapper
 from gravitorch.datasources import (
     DataCreatorIterDataPipeCreatorDataSource,
     IterDataPipeCreatorDataSource,
@@ -55,6 +55,12 @@ def test_iter_data_pipe_creator_data_source_str() -> None:
     ).startswith("IterDataPipeCreatorDataSource(")
 
 
+def test_iter_data_pipe_creator_data_source_no_dict() -> None:
+    assert not hasattr(
+        IterDataPipeCreatorDataSource({"train": Mock(spec=BaseIterDataPipeCreator)}), "__dict__"
+    )
+
+
 def test_iter_data_pipe_creator_data_source_attach(
     caplog: LogCaptureFixture, data_source: IterDataPipeCreatorDataSource
 ) -> None:
@@ -128,6 +134,128 @@ def test_iter_data_pipe_creator_data_source_get_data_loader_without_engine() ->
     datapipe_creator.create.assert_called_once_with(engine=None)
 
 
+def test_iter_data_pipe_creator_data_source_get_data_loader_cache_datapipes_false() -> None:
+    engine = Mock(spec=BaseEngine, epoch=0)
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(side_effect=lambda engine: Mock())
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator})
+    assert data_source.get_data_loader("train", engine) is not data_source.get_data_loader(
+        "train", engine
+    )
+    assert datapipe_creator.create.call_count == 2
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_cache_datapipes_same_epoch() -> None:
+    engine = Mock(spec=BaseEngine, epoch=0)
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(side_effect=lambda engine: Mock())
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator}, cache_datapipes=True)
+    assert data_source.get_data_loader("train", engine) is data_source.get_data_loader(
+        "train", engine
+    )
+    datapipe_creator.create.assert_called_once_with(engine=engine)
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_cache_datapipes_new_epoch() -> None:
+    engine = Mock(spec=BaseEngine, epoch=0)
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(side_effect=lambda engine: Mock())
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator}, cache_datapipes=True)
+    datapipe1 = data_source.get_data_loader("train", engine)
+    engine.epoch = 1
+    datapipe2 = data_source.get_data_loader("train", engine)
+    assert datapipe1 is not datapipe2
+    assert data_source.get_data_loader("train", engine) is datapipe2
+    assert datapipe_creator.create.call_count == 2
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_cache_datapipes_no_engine() -> None:
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(side_effect=lambda engine: Mock())
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator}, cache_datapipes=True)
+    assert data_source.get_data_loader("train") is data_source.get_data_loader("train")
+    datapipe_creator.create.assert_called_once_with(engine=None)
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_log_datapipe_once(
+    caplog: LogCaptureFixture,
+) -> None:
+    datapipe_creator = Mock(spec=BaseIterDataPipeCreator, create=Mock(return_value=["a", "b"]))
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator})
+    with caplog.at_level(logging.INFO):
+        data_source.get_data_loader("train")
+        assert len(caplog.messages) == 1
+        assert caplog.messages[0].startswith("Created DataPipe for loader 'train'")
+        data_source.get_data_loader("train")
+        assert len(caplog.messages) == 1
+    assert data_source._logged_loader_ids == {"train"}
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_prefetch_buffer_0() -> None:
+    datapipe = SourceWrapper([1, 2, 3])
+    datapipe_creator = Mock(spec=BaseIterDataPipeCreator, create=Mock(return_value=datapipe))
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator})
+    assert data_source.get_data_loader("train") is datapipe
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_prefetch_buffer_2() -> None:
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(return_value=SourceWrapper([1, 2, 3]))
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator}, prefetch_buffer=2)
+    datapipe = data_source.get_data_loader("train")
+    assert isinstance(datapipe, Prefetcher)
+    assert tuple(datapipe) == (1, 2, 3)
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_prefetch_and_cache() -> None:
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator,
+        create=Mock(side_effect=lambda engine: SourceWrapper([1, 2, 3])),
+    )
+    data_source = IterDataPipeCreatorDataSource(
+        {"train": datapipe_creator}, cache_datapipes=True, prefetch_buffer=1
+    )
+    datapipe = data_source.get_data_loader("train")
+    assert isinstance(datapipe, Prefetcher)
+    assert data_source.get_data_loader("train") is datapipe
+    datapipe_creator.create.assert_called_once_with(engine=None)
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_pin_memory_false() -> None:
+    datapipe = SourceWrapper([1, 2, 3])
+    datapipe_creator = Mock(spec=BaseIterDataPipeCreator, create=Mock(return_value=datapipe))
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator})
+    assert data_source.get_data_loader("train") is datapipe
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_pin_memory_true() -> None:
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(return_value=SourceWrapper([1, 2, 3]))
+    )
+    data_source = IterDataPipeCreatorDataSource({"train": datapipe_creator}, pin_memory=True)
+    datapipe = data_source.get_data_loader("train")
+    assert isinstance(datapipe, PinMemory)
+    assert tuple(datapipe) == (1, 2, 3)
+
+
+def test_iter_data_pipe_creator_data_source_get_data_loader_pin_memory_and_prefetch() -> None:
+    datapipe_creator = Mock(
+        spec=BaseIterDataPipeCreator, create=Mock(return_value=SourceWrapper([1, 2, 3]))
+    )
+    data_source = IterDataPipeCreatorDataSource(
+        {"train": datapipe_creator}, prefetch_buffer=2, pin_memory=True
+    )
+    datapipe = data_source.get_data_loader("train")
+    assert isinstance(datapipe, Prefetcher)
+    assert isinstance(datapipe._datapipe, PinMemory)
+    assert tuple(datapipe) == (1, 2, 3)
+
+
 def test_iter_data_pipe_creator_data_source_has_data_loader_true(
     data_source: IterDataPipeCreatorDataSource,
 ) -> None:
@@ -166,6 +294,16 @@ def test_data_creator_iter_data_pipe_creator_data_source_str() -> None:
     ).startswith("DataCreatorIterDataPipeCreatorDataSource(")
 
 
+def test_data_creator_iter_data_pipe_creator_data_source_no_dict() -> None:
+    assert not hasattr(
+        DataCreatorIterDataPipeCreatorDataSource(
+            datapipe_creators={"train": Mock(spec=BaseIterDataPipeCreator)},
+            data_creators={"train": Mock(spec=BaseDataCreator, create=Mock(return_value=[1]))},
+        ),
+        "__dict__",
+    )
+
+
 def test_data_creator_iter_data_pipe_creator_data_source_data_creators() -> None:
     creator = DataCreatorIterDataPipeCreatorDataSource(
         datapipe_creators={"train": Mock(spec=BaseIterDataPipeCreator)},
@@ -183,6 +321,45 @@ def test_data_creator_iter_data_pipe_creator_data_source_data_creators() -> None
     isinstance(creator._data_creators["val"], HypercubeVertexDataCreator)
 
 
+@mark.parametrize("parallel_init", (True, False))
+def test_data_creator_iter_data_pipe_creator_data_source_parallel_init(parallel_init: bool) -> None:
+    data_creator1 = Mock(spec=BaseDataCreator, create=Mock(return_value=[1, 2, 3]))
+    data_creator2 = Mock(spec=BaseDataCreator, create=Mock(return_value=[4, 5]))
+    creator = DataCreatorIterDataPipeCreatorDataSource(
+        datapipe_creators={"train": Mock(spec=BaseIterDataPipeCreator)},
+        data_creators={"train": data_creator1, "val": data_creator2},
+        parallel_init=parallel_init,
+    )
+    assert creator._data == {"train": [1, 2, 3], "val": [4, 5]}
+    data_creator1.create.assert_called_once_with()
+    data_creator2.create.assert_called_once_with()
+
+
+def test_data_creator_iter_data_pipe_creator_data_source_source_inputs() -> None:
+    creator = DataCreatorIterDataPipeCreatorDataSource(
+        datapipe_creators={"train": Mock(spec=BaseIterDataPipeCreator)},
+        data_creators={
+            "train": Mock(spec=BaseDataCreator, create=Mock(return_value=[1, 2, 3])),
+            "val": Mock(spec=BaseDataCreator, create=Mock(return_value=None)),
+        },
+    )
+    assert creator._source_inputs == {"train": ([1, 2, 3],), "val": None}
+
+
+def test_data_creator_iter_data_pipe_creator_data_source_parallel_init_error() -> None:
+    with raises(RuntimeError, match="data error"):
+        DataCreatorIterDataPipeCreatorDataSource(
+            datapipe_creators={"train": Mock(spec=BaseIterDataPipeCreator)},
+            data_creators={
+                "train": Mock(spec=BaseDataCreator, create=Mock(return_value=[1, 2, 3])),
+                "val": Mock(
+                    spec=BaseDataCreator, create=Mock(side_effect=RuntimeError("data error"))
+                ),
+            },
+            parallel_init=True,
+        )
+
+
 def test_data_creator_iter_data_pipe_creator_data_source_create_datapipe() -> None:
     data_creator = Mock(spec=BaseDataCreator, create=Mock(return_value=[1, 2, 3]))
     datapipe_creator = Mock(spec=BaseIterDataPipeCreator, create=Mock(return_value=["a", "b", "c"]))
@@ -234,3 +411,20 @@ def test_data_creator_iter_data_pipe_creator_data_source_get_data_loader() -> No
     )
     datapipe = creator.get_data_loader("train")
     assert isinstance(datapipe, SourceWrapper)
+
+
+def test_data_creator_iter_data_pipe_creator_data_source_get_data_loader_prefetch_buffer() -> None:
+    creator = DataCreatorIterDataPipeCreatorDataSource(
+        datapipe_creators={
+            "train": SequentialIterDataPipeCreator(
+                config=[
+                    {OBJECT_TARGET: "gravitorch.data.datapipes.iter.SourceWrapper"},
+                ]
+            )
+        },
+        data_creators={"train": Mock(spec=BaseDataCreator, create=Mock(return_value=[1, 2, 3]))},
+        prefetch_buffer=2,
+    )
+    datapipe = creator.get_data_loader("train")
+    assert isinstance(datapipe, Prefetcher)
+    assert tuple(datapipe) == (1, 2, 3)
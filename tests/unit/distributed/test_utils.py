@@ -228,6 +228,12 @@ def test_show_torch_distributed_env_vars_partial(caplog: LogCaptureFixture) -> N
         assert len(caplog.messages[0]) > 0  # The message should not be empty
 
 
+def test_show_torch_distributed_env_vars_info_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        show_torch_distributed_env_vars()
+        assert not caplog.messages
+
+
 #############################################
 #     Tests for show_all_slurm_env_vars     #
 #############################################
@@ -247,6 +253,21 @@ def test_show_all_slurm_env_vars_slurm_job(caplog: LogCaptureFixture) -> None:
         assert len(caplog.messages[0]) > 0  # The message should not be empty
 
 
+@patch.dict(os.environ, {"SLURM_JOB_ID": "12345", "OTHER": "abc"}, clear=True)
+def test_show_all_slurm_env_vars_only_slurm(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO):
+        show_all_slurm_env_vars()
+        assert "SLURM_JOB_ID" in caplog.messages[0]
+        assert "OTHER" not in caplog.messages[0]
+
+
+@patch.dict(os.environ, {"SLURM_JOB_ID": "12345"}, clear=True)
+def test_show_all_slurm_env_vars_info_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        show_all_slurm_env_vars()
+        assert not caplog.messages
+
+
 #########################################
 #     Tests for show_slurm_env_vars     #
 #########################################
@@ -266,6 +287,12 @@ def test_show_slurm_env_vars_slurm_job(caplog: LogCaptureFixture) -> None:
         assert len(caplog.messages[0].split("\n")) == 7
 
 
+def test_show_slurm_env_vars_info_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        show_slurm_env_vars()
+        assert not caplog.messages
+
+
 ###################################################
 #     Tests for show_distributed_context_info     #
 ###################################################
@@ -275,3 +302,12 @@ def test_show_distributed_context_info(caplog: LogCaptureFixture) -> None:
     with caplog.at_level(logging.INFO):
         show_distributed_context_info()
         assert len(caplog.messages[0]) > 0  # The message should not be empty
+
+
+def test_show_distributed_context_info_info_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING), patch(
+        "gravitorch.distributed.utils.dist.backend"
+    ) as backend_mock:
+        show_distributed_context_info()
+        assert not caplog.messages
+        backend_mock.assert_not_called()
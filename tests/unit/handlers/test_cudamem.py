@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 from pytest import mark, raises
 
@@ -47,6 +47,22 @@ def test_epoch_cuda_memory_monitor_freq_default() -> None:
     assert EpochCudaMemoryMonitor()._freq == 1
 
 
+def test_epoch_cuda_memory_monitor_synchronize_default() -> None:
+    assert not EpochCudaMemoryMonitor()._synchronize
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+@patch("gravitorch.handlers.cudamem._get_total_cuda_memory", lambda *args: 1)
+@mark.parametrize("synchronize", (True, False))
+def test_epoch_cuda_memory_monitor_monitor_synchronize(synchronize: bool) -> None:
+    with patch("torch.cuda.synchronize") as synchronize_mock:
+        EpochCudaMemoryMonitor(synchronize=synchronize).monitor(Mock(spec=BaseEngine, epoch=4))
+        assert synchronize_mock.called == synchronize
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
 @mark.parametrize("event", EVENTS)
 @mark.parametrize("freq", (1, 2))
 def test_epoch_cuda_memory_monitor_attach(event: str, freq: int) -> None:
@@ -63,15 +79,25 @@ def test_epoch_cuda_memory_monitor_attach(event: str, freq: int) -> None:
     )
 
 
+@patch("torch.cuda.is_available", lambda *args: True)
 def test_epoch_cuda_memory_monitor_attach_duplicate() -> None:
     engine = Mock(spec=BaseEngine, epoch=-1, has_event_handler=Mock(return_value=True))
     EpochCudaMemoryMonitor().attach(engine)
     engine.add_event_handler.assert_not_called()
 
 
+@patch("torch.cuda.is_available", lambda *args: False)
+def test_epoch_cuda_memory_monitor_attach_no_cuda() -> None:
+    engine = Mock(spec=BaseEngine, epoch=-1, has_event_handler=Mock(return_value=False))
+    EpochCudaMemoryMonitor().attach(engine)
+    engine.has_event_handler.assert_not_called()
+    engine.add_event_handler.assert_not_called()
+
+
 @patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
 @patch("torch.cuda.synchronize", lambda *args: None)
-@patch("torch.cuda.mem_get_info", lambda *args: (None, 1))
+@patch("gravitorch.handlers.cudamem._get_total_cuda_memory", lambda *args: 1)
 def test_epoch_cuda_memory_monitor_monitor() -> None:
     engine = Mock(spec=BaseEngine, epoch=4)
     EpochCudaMemoryMonitor().monitor(engine)
@@ -82,6 +108,46 @@ def test_epoch_cuda_memory_monitor_monitor() -> None:
     assert engine.log_metrics.call_args.kwargs["step"] == EpochStep(4)
 
 
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
+@patch("torch.cuda.synchronize", lambda *args: None)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+def test_epoch_cuda_memory_monitor_monitor_total_memory_cached() -> None:
+    engine = Mock(spec=BaseEngine, epoch=4)
+    handler = EpochCudaMemoryMonitor()
+    with patch(
+        "gravitorch.handlers.cudamem._get_total_cuda_memory", Mock(return_value=4)
+    ) as total_memory_mock:
+        handler.monitor(engine)
+        handler.monitor(engine)
+        total_memory_mock.assert_called_once_with(0)
+    assert handler._total_memory == 4
+    assert engine.log_metrics.call_args.args[0]["epoch/max_cuda_memory_allocated_pct"] == 0.25
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+def test_epoch_cuda_memory_monitor_monitor_total_memory_device_changed() -> None:
+    engine = Mock(spec=BaseEngine, epoch=4)
+    handler = EpochCudaMemoryMonitor()
+    with patch(
+        "gravitorch.handlers.cudamem._get_total_cuda_memory", Mock(side_effect=[4, 2])
+    ) as total_memory_mock:
+        with patch("torch.cuda.current_device", lambda *args: 0):
+            handler.monitor(engine)
+        with patch("torch.cuda.current_device", lambda *args: 1):
+            handler.monitor(engine)
+        assert total_memory_mock.call_args_list == [call(0), call(1)]
+    assert handler._device == 1
+    assert handler._total_memory == 2
+    assert engine.log_metrics.call_args.args[0]["epoch/max_cuda_memory_allocated_pct"] == 0.5
+
+
+@patch("torch.cuda.is_available", lambda *args: False)
+def test_epoch_cuda_memory_monitor_cuda_available_false() -> None:
+    assert not EpochCudaMemoryMonitor()._cuda_available
+
+
 @patch("torch.cuda.is_available", lambda *args: False)
 def test_epoch_cuda_memory_monitor_monitor_no_cuda() -> None:
     engine = Mock(spec=BaseEngine)
@@ -122,6 +188,24 @@ def test_iteration_cuda_memory_monitor_freq_default() -> None:
     assert IterationCudaMemoryMonitor()._freq == 1
 
 
+def test_iteration_cuda_memory_monitor_synchronize_default() -> None:
+    assert not IterationCudaMemoryMonitor()._synchronize
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+@patch("gravitorch.handlers.cudamem._get_total_cuda_memory", lambda *args: 1)
+@mark.parametrize("synchronize", (True, False))
+def test_iteration_cuda_memory_monitor_monitor_synchronize(synchronize: bool) -> None:
+    with patch("torch.cuda.synchronize") as synchronize_mock:
+        IterationCudaMemoryMonitor(synchronize=synchronize).monitor(
+            Mock(spec=BaseEngine, iteration=4)
+        )
+        assert synchronize_mock.called == synchronize
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
 @mark.parametrize("event", EVENTS)
 @mark.parametrize("freq", (1, 2))
 def test_iteration_cuda_memory_monitor_attach(event: str, freq: int) -> None:
@@ -138,15 +222,25 @@ def test_iteration_cuda_memory_monitor_attach(event: str, freq: int) -> None:
     )
 
 
+@patch("torch.cuda.is_available", lambda *args: True)
 def test_iteration_cuda_memory_monitor_attach_duplicate() -> None:
     engine = Mock(spec=BaseEngine, iteration=-1, has_event_handler=Mock(return_value=True))
     IterationCudaMemoryMonitor().attach(engine)
     engine.add_event_handler.assert_not_called()
 
 
+@patch("torch.cuda.is_available", lambda *args: False)
+def test_iteration_cuda_memory_monitor_attach_no_cuda() -> None:
+    engine = Mock(spec=BaseEngine, iteration=-1, has_event_handler=Mock(return_value=False))
+    IterationCudaMemoryMonitor().attach(engine)
+    engine.has_event_handler.assert_not_called()
+    engine.add_event_handler.assert_not_called()
+
+
 @patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
 @patch("torch.cuda.synchronize", lambda *args: None)
-@patch("torch.cuda.mem_get_info", lambda *args: (None, 1))
+@patch("gravitorch.handlers.cudamem._get_total_cuda_memory", lambda *args: 1)
 def test_iteration_cuda_memory_monitor_monitor() -> None:
     engine = Mock(spec=BaseEngine, iteration=4)
     IterationCudaMemoryMonitor().monitor(engine)
@@ -159,6 +253,46 @@ def test_iteration_cuda_memory_monitor_monitor() -> None:
     assert engine.log_metrics.call_args.kwargs["step"] == IterationStep(4)
 
 
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.current_device", lambda *args: 0)
+@patch("torch.cuda.synchronize", lambda *args: None)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+def test_iteration_cuda_memory_monitor_monitor_total_memory_cached() -> None:
+    engine = Mock(spec=BaseEngine, iteration=4)
+    handler = IterationCudaMemoryMonitor()
+    with patch(
+        "gravitorch.handlers.cudamem._get_total_cuda_memory", Mock(return_value=4)
+    ) as total_memory_mock:
+        handler.monitor(engine)
+        handler.monitor(engine)
+        total_memory_mock.assert_called_once_with(0)
+    assert handler._total_memory == 4
+    assert engine.log_metrics.call_args.args[0]["iteration/max_cuda_memory_allocated_pct"] == 0.25
+
+
+@patch("torch.cuda.is_available", lambda *args: True)
+@patch("torch.cuda.max_memory_allocated", lambda *args: 1)
+def test_iteration_cuda_memory_monitor_monitor_total_memory_device_changed() -> None:
+    engine = Mock(spec=BaseEngine, iteration=4)
+    handler = IterationCudaMemoryMonitor()
+    with patch(
+        "gravitorch.handlers.cudamem._get_total_cuda_memory", Mock(side_effect=[4, 2])
+    ) as total_memory_mock:
+        with patch("torch.cuda.current_device", lambda *args: 0):
+            handler.monitor(engine)
+        with patch("torch.cuda.current_device", lambda *args: 1):
+            handler.monitor(engine)
+        assert total_memory_mock.call_args_list == [call(0), call(1)]
+    assert handler._device == 1
+    assert handler._total_memory == 2
+    assert engine.log_metrics.call_args.args[0]["iteration/max_cuda_memory_allocated_pct"] == 0.5
+
+
+@patch("torch.cuda.is_available", lambda *args: False)
+def test_iteration_cuda_memory_monitor_cuda_available_false() -> None:
+    assert not IterationCudaMemoryMonitor()._cuda_available
+
+
 @patch("torch.cuda.is_available", lambda *args: False)
 def test_iteration_cuda_memory_monitor_monitor_no_cuda() -> None:
     engine = Mock(spec=BaseEngine)
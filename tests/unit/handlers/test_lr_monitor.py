@@ -6,6 +6,7 @@ from torch.optim import SGD
 
 from gravitorch.engines import BaseEngine, EngineEvents
 from gravitorch.handlers import EpochLRMonitor, IterationLRMonitor
+from gravitorch.handlers.lr_monitor import _get_lr_metric_name, _get_lr_metrics
 from gravitorch.utils.events import (
     ConditionalEventHandler,
     EpochPeriodicCondition,
@@ -154,3 +155,38 @@ def test_iteration_lr_monitor_monitor_no_optimizer() -> None:
     engine = Mock(spec=BaseEngine, iteration=10, optimizer=None)
     IterationLRMonitor().monitor(engine)
     engine.log_metrics.assert_not_called()
+
+
+#####################################
+#     Tests for _get_lr_metrics     #
+#####################################
+
+
+def test_get_lr_metrics() -> None:
+    optimizer = SGD(
+        [{"params": nn.Linear(4, 6).parameters()}, {"params": nn.Linear(6, 2).parameters()}],
+        lr=0.01,
+    )
+    optimizer.param_groups[1]["lr"] = 0.1
+    assert _get_lr_metrics(optimizer, prefix="epoch") == {
+        "epoch/optimizer.group0.lr": 0.01,
+        "epoch/optimizer.group1.lr": 0.1,
+    }
+
+
+def test_get_lr_metrics_no_lr() -> None:
+    optimizer = Mock(param_groups=[{"lr": 0.01}, {"momentum": 0.9}])
+    assert _get_lr_metrics(optimizer, prefix="iteration") == {"iteration/optimizer.group0.lr": 0.01}
+
+
+#########################################
+#     Tests for _get_lr_metric_name     #
+#########################################
+
+
+def test_get_lr_metric_name_epoch() -> None:
+    assert _get_lr_metric_name("epoch", 0) == "epoch/optimizer.group0.lr"
+
+
+def test_get_lr_metric_name_iteration() -> None:
+    assert _get_lr_metric_name("iteration", 3) == "iteration/optimizer.group3.lr"
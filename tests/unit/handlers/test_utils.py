@@ -1,7 +1,8 @@
-from unittest.mock import Mock
+import logging
+from unittest.mock import MagicMock, Mock
 
 from objectory import OBJECT_TARGET
-from pytest import mark
+from pytest import LogCaptureFixture, mark
 
 from gravitorch.handlers import (
     EpochLRMonitor,
@@ -38,6 +39,30 @@ def test_add_unique_event_handler_has_event_handler_true(event: str) -> None:
     engine.add_event_handler.assert_not_called()
 
 
+@mark.parametrize("has_event_handler", (True, False))
+def test_add_unique_event_handler_log_info(
+    caplog: LogCaptureFixture, has_event_handler: bool
+) -> None:
+    engine = Mock()
+    engine.has_event_handler.return_value = has_event_handler
+    with caplog.at_level(logging.INFO):
+        add_unique_event_handler(engine, "my_event", VanillaEventHandler(Mock()))
+        assert len(caplog.messages) == 1
+
+
+@mark.parametrize("has_event_handler", (True, False))
+def test_add_unique_event_handler_log_disabled(
+    caplog: LogCaptureFixture, has_event_handler: bool
+) -> None:
+    engine = Mock()
+    engine.has_event_handler.return_value = has_event_handler
+    event_handler = MagicMock()
+    with caplog.at_level(logging.WARNING):
+        add_unique_event_handler(engine, "my_event", event_handler)
+        assert not caplog.messages
+    event_handler.__str__.assert_not_called()
+
+
 ###################################
 #     Tests for setup_handler     #
 ###################################
@@ -88,9 +113,18 @@ def test_to_events_str() -> None:
     assert to_events("my_event") == ("my_event",)
 
 
+def test_to_events_str_same_object() -> None:
+    assert to_events("my_event") is to_events("my_event")
+
+
 def test_to_events_list() -> None:
     assert to_events(["my_event", "my_other_event"]) == ("my_event", "my_other_event")
 
 
 def test_to_events_tuple() -> None:
     assert to_events(("my_event", "my_other_event")) == ("my_event", "my_other_event")
+
+
+def test_to_events_tuple_same_object() -> None:
+    events = ("my_event", "my_other_event")
+    assert to_events(events) is events
@@ -1,7 +1,8 @@
+from typing import Union
 from unittest.mock import Mock, patch
 
 import torch
-from pytest import mark
+from pytest import mark, raises
 
 from gravitorch import constants as ct
 from gravitorch.engines import BaseEngine, EngineEvents
@@ -24,6 +25,28 @@ def test_amp_evaluation_loop_amp_enabled(amp_enabled: bool) -> None:
     assert AMPEvaluationLoop(amp_enabled=amp_enabled)._amp_enabled == amp_enabled
 
 
+def test_amp_evaluation_loop_amp_dtype_default() -> None:
+    assert AMPEvaluationLoop()._amp_dtype == torch.float16
+
+
+@mark.parametrize("amp_dtype", (torch.bfloat16, "bfloat16"))
+def test_amp_evaluation_loop_amp_dtype(amp_dtype: Union[torch.dtype, str]) -> None:
+    assert AMPEvaluationLoop(amp_dtype=amp_dtype)._amp_dtype == torch.bfloat16
+
+
+@mark.parametrize("amp_dtype", (torch.float32, torch.int64, "float32", "meow"))
+def test_amp_evaluation_loop_amp_dtype_incorrect(amp_dtype: Union[torch.dtype, str]) -> None:
+    with raises(ValueError, match="Incorrect amp_dtype"):
+        AMPEvaluationLoop(amp_dtype=amp_dtype)
+
+
+@mark.parametrize("prefetch_batches", (True, False))
+def test_amp_evaluation_loop_prefetch_batches(prefetch_batches: bool) -> None:
+    assert (
+        AMPEvaluationLoop(prefetch_batches=prefetch_batches)._prefetch_batches == prefetch_batches
+    )
+
+
 @mark.parametrize("device", get_available_devices())
 def test_amp_evaluation_loop_eval_one_batch_fired_events(device: str) -> None:
     device = torch.device(device)
@@ -65,6 +65,32 @@ def test_vanilla_evaluation_loop_batch_device_placement_default() -> None:
     assert isinstance(VanillaEvaluationLoop()._batch_device_placement, AutoDevicePlacement)
 
 
+@mark.parametrize("prefetch_batches", (True, False))
+def test_vanilla_evaluation_loop_prefetch_batches(prefetch_batches: bool) -> None:
+    assert (
+        VanillaEvaluationLoop(prefetch_batches=prefetch_batches)._prefetch_batches
+        == prefetch_batches
+    )
+
+
+def test_vanilla_evaluation_loop_prefetch_batches_default() -> None:
+    assert not VanillaEvaluationLoop()._prefetch_batches
+
+
+def test_vanilla_evaluation_loop_send_batch_to_device() -> None:
+    device_placement = Mock(spec=ManualDevicePlacement, send=Mock(return_value=2))
+    loop = VanillaEvaluationLoop(batch_device_placement=device_placement)
+    assert loop._send_batch_to_device(1) == 2
+    device_placement.send.assert_called_once_with(1)
+
+
+def test_vanilla_evaluation_loop_send_batch_to_device_prefetch_batches() -> None:
+    device_placement = Mock(spec=ManualDevicePlacement)
+    loop = VanillaEvaluationLoop(batch_device_placement=device_placement, prefetch_batches=True)
+    assert loop._send_batch_to_device(1) == 1
+    device_placement.send.assert_not_called()
+
+
 def test_vanilla_evaluation_loop_condition() -> None:
     evaluation_loop = VanillaEvaluationLoop(
         condition={OBJECT_TARGET: "gravitorch.loops.evaluation.conditions.LastEpochEvalCondition"}
@@ -72,6 +98,27 @@ def test_vanilla_evaluation_loop_condition() -> None:
     assert isinstance(evaluation_loop._condition, LastEpochEvalCondition)
 
 
+@mark.parametrize("metric_sync_every", (0, 1, 5))
+def test_vanilla_evaluation_loop_metric_sync_every(metric_sync_every: int) -> None:
+    assert (
+        VanillaEvaluationLoop(metric_sync_every=metric_sync_every)._metric_sync_every
+        == metric_sync_every
+    )
+
+
+def test_vanilla_evaluation_loop_metric_sync_every_default() -> None:
+    assert VanillaEvaluationLoop()._metric_sync_every == 50
+
+
+@mark.parametrize("inference_mode", (True, False))
+def test_vanilla_evaluation_loop_inference_mode(inference_mode: bool) -> None:
+    assert VanillaEvaluationLoop(inference_mode=inference_mode)._inference_mode == inference_mode
+
+
+def test_vanilla_evaluation_loop_inference_mode_default() -> None:
+    assert VanillaEvaluationLoop()._inference_mode
+
+
 def test_vanilla_evaluation_loop_condition_default() -> None:
     assert isinstance(VanillaEvaluationLoop()._condition, EveryEpochEvalCondition)
 
@@ -112,6 +159,70 @@ def test_vanilla_evaluation_loop_eval(device: str) -> None:
     assert len(loss_history.get_recent_history()) == 1
 
 
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_evaluation_loop_eval_prefetch_batches(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    VanillaEvaluationLoop(
+        batch_device_placement=ManualDevicePlacement(device), prefetch_batches=True
+    ).eval(engine)
+    assert not engine.model.training
+    assert engine.epoch == -1
+    assert engine.iteration == -1
+    loss_history = engine.get_history(f"eval/{ct.LOSS}")
+    assert isinstance(loss_history, MinScalarHistory)
+    assert isinstance(loss_history.get_last_value(), float)
+    assert len(loss_history.get_recent_history()) == 1
+
+
+@mark.parametrize("device", get_available_devices())
+@mark.parametrize("metric_sync_every", (1, 2))
+def test_vanilla_evaluation_loop_eval_metric_sync_every(
+    device: str, metric_sync_every: int
+) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    VanillaEvaluationLoop(
+        batch_device_placement=ManualDevicePlacement(device), metric_sync_every=metric_sync_every
+    ).eval(engine)
+    assert isinstance(engine.get_history(f"eval/{ct.LOSS}").get_last_value(), float)
+
+
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_evaluation_loop_eval_not_main_process(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    with patch("gravitorch.loops.evaluation.basic.dist.get_rank", lambda *args: 1):
+        VanillaEvaluationLoop(batch_device_placement=ManualDevicePlacement(device)).eval(engine)
+    assert engine.epoch == -1
+    assert engine.iteration == -1
+    assert isinstance(engine.get_history(f"eval/{ct.LOSS}").get_last_value(), float)
+
+
+def test_vanilla_evaluation_loop_eval_barrier_not_distributed() -> None:
+    engine = create_dummy_engine()
+    with patch("gravitorch.loops.evaluation.basic.dist.barrier") as barrier_mock:
+        VanillaEvaluationLoop().eval(engine)
+        barrier_mock.assert_not_called()
+
+
+def test_vanilla_evaluation_loop_eval_barrier_distributed() -> None:
+    engine = create_dummy_engine()
+    with patch("gravitorch.loops.evaluation.basic.dist.is_distributed", lambda *args: True):
+        with patch("gravitorch.loops.evaluation.basic.dist.barrier") as barrier_mock:
+            VanillaEvaluationLoop().eval(engine)
+            assert barrier_mock.call_count == 2
+
+
+def test_vanilla_evaluation_loop_eval_noop_observer_and_profiler() -> None:
+    with patch.object(NoOpLoopObserver, "update") as update_mock, patch.object(
+        NoOpProfiler, "step"
+    ) as step_mock:
+        VanillaEvaluationLoop().eval(create_dummy_engine())
+        update_mock.assert_not_called()
+        step_mock.assert_not_called()
+
+
 @mark.parametrize("device", get_available_devices())
 def test_vanilla_evaluation_loop_eval_loss_nan(device: str) -> None:
     device = torch.device(device)
@@ -313,6 +424,54 @@ def test_vanilla_evaluation_loop_grad_enabled_true(device: str) -> None:
     assert torch.is_tensor(batch[ct.INPUT].grad)
 
 
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_evaluation_loop_grad_enabled_false_inference_mode(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    loop = VanillaEvaluationLoop(
+        grad_enabled=False, batch_device_placement=ManualDevicePlacement(device)
+    )
+    out = loop._eval_one_batch(
+        engine,
+        engine.model,
+        {ct.TARGET: torch.tensor([1, 2]), ct.INPUT: torch.ones(2, 4)},
+    )
+    assert out[ct.LOSS].is_inference()
+
+
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_evaluation_loop_grad_enabled_false_inference_mode_disabled(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    loop = VanillaEvaluationLoop(
+        grad_enabled=False,
+        batch_device_placement=ManualDevicePlacement(device),
+        inference_mode=False,
+    )
+    out = loop._eval_one_batch(
+        engine,
+        engine.model,
+        {ct.TARGET: torch.tensor([1, 2]), ct.INPUT: torch.ones(2, 4)},
+    )
+    assert not out[ct.LOSS].is_inference()
+    assert not out[ct.LOSS].requires_grad
+
+
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_evaluation_loop_grad_enabled_true_not_inference_mode(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    loop = VanillaEvaluationLoop(
+        grad_enabled=True, batch_device_placement=ManualDevicePlacement(device)
+    )
+    out = loop._eval_one_batch(
+        engine,
+        engine.model,
+        {ct.TARGET: torch.tensor([1, 2]), ct.INPUT: torch.ones(2, 4)},
+    )
+    assert not out[ct.LOSS].is_inference()
+
+
 @mark.parametrize("device", get_available_devices())
 def test_vanilla_evaluation_loop_eval_one_batch_fired_events(device: str) -> None:
     device = torch.device(device)
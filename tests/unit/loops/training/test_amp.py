@@ -1,8 +1,9 @@
 import math
+from typing import Union
 from unittest.mock import Mock, patch
 
 import torch
-from pytest import mark
+from pytest import mark, raises
 from torch import nn
 from torch.optim import SGD, Optimizer
 
@@ -29,6 +30,40 @@ def test_amp_training_loop_amp_enabled(amp_enabled: bool) -> None:
         scaler_mock.assert_called_once_with(enabled=amp_enabled)
 
 
+def test_amp_training_loop_amp_dtype_default() -> None:
+    assert AMPTrainingLoop()._amp_dtype == torch.float16
+
+
+@mark.parametrize("amp_dtype", (torch.bfloat16, "bfloat16"))
+def test_amp_training_loop_amp_dtype_bfloat16(amp_dtype: Union[torch.dtype, str]) -> None:
+    with patch("gravitorch.loops.training.amp.GradScaler") as scaler_mock:
+        assert AMPTrainingLoop(amp_dtype=amp_dtype)._amp_dtype == torch.bfloat16
+        scaler_mock.assert_called_once_with(enabled=False)
+
+
+@mark.parametrize("amp_dtype", (torch.float16, "float16"))
+def test_amp_training_loop_amp_dtype_float16(amp_dtype: Union[torch.dtype, str]) -> None:
+    with patch("gravitorch.loops.training.amp.GradScaler") as scaler_mock:
+        assert AMPTrainingLoop(amp_dtype=amp_dtype)._amp_dtype == torch.float16
+        scaler_mock.assert_called_once_with(enabled=True)
+
+
+@mark.parametrize("amp_dtype", (torch.float32, torch.int64, "float32", "meow"))
+def test_amp_training_loop_amp_dtype_incorrect(amp_dtype: Union[torch.dtype, str]) -> None:
+    with raises(ValueError, match="Incorrect amp_dtype"):
+        AMPTrainingLoop(amp_dtype=amp_dtype)
+
+
+@mark.parametrize("prefetch_batches", (True, False))
+def test_amp_training_loop_prefetch_batches(prefetch_batches: bool) -> None:
+    assert AMPTrainingLoop(prefetch_batches=prefetch_batches)._prefetch_batches == prefetch_batches
+
+
+@mark.parametrize("grad_accum_steps", (1, 2))
+def test_amp_training_loop_grad_accum_steps(grad_accum_steps: int) -> None:
+    assert AMPTrainingLoop(grad_accum_steps=grad_accum_steps)._grad_accum_steps == grad_accum_steps
+
+
 def test_amp_training_loop_load_state_dict() -> None:
     AMPTrainingLoop(amp_enabled=False).load_state_dict({ct.SCALER: {}})
 
@@ -141,6 +176,21 @@ def test_amp_training_loop_train_one_batch_clip_grad_norm(device: str) -> None:
     assert out[ct.LOSS].device == device
 
 
+def test_amp_training_loop_train_one_batch_grad_accum_steps() -> None:
+    engine = Mock(spec=BaseEngine)
+    model = DummyClassificationModel()
+    optimizer = Mock(spec=Optimizer)
+    loop = AMPTrainingLoop(amp_enabled=False, grad_accum_steps=2)
+    batch = {ct.INPUT: torch.ones(8, 4), ct.TARGET: torch.ones(8, dtype=torch.long)}
+    with patch.object(loop, "_scaler") as scaler_mock:
+        scaler_mock.scale.side_effect = lambda loss: loss
+        loop._train_one_batch(engine=engine, model=model, optimizer=optimizer, batch=batch)
+        scaler_mock.step.assert_not_called()
+        loop._train_one_batch(engine=engine, model=model, optimizer=optimizer, batch=batch)
+        scaler_mock.step.assert_called_once_with(optimizer)
+        scaler_mock.update.assert_called_once_with()
+
+
 def test_amp_training_loop_train_one_batch_loss_nan() -> None:
     engine = Mock(spec=BaseEngine)
     model = Mock(spec=nn.Module, return_value={ct.LOSS: torch.tensor(math.nan)})
@@ -1,16 +1,21 @@
+import logging
 import math
+from contextlib import nullcontext
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import torch
-from pytest import mark, raises
+from pytest import LogCaptureFixture, mark, raises
 from torch import nn
+from torch.nn.parallel import DistributedDataParallel
 from torch.optim import SGD, Optimizer
 
 from gravitorch import constants as ct
 from gravitorch.engines import BaseEngine, EngineEvents
 from gravitorch.loops.observers import NoOpLoopObserver, PyTorchBatchSaver
 from gravitorch.loops.training import VanillaTrainingLoop
+from gravitorch.loops.training.basic import _check_ddp_model
+from gravitorch.loops.training.vanilla import _model_to_channels_last
 from gravitorch.testing import (
     DummyClassificationModel,
     DummyDataset,
@@ -28,6 +33,7 @@ from gravitorch.utils.events import VanillaEventHandler
 from gravitorch.utils.exp_trackers import EpochStep
 from gravitorch.utils.history import EmptyHistoryError, MinScalarHistory
 from gravitorch.utils.profilers import NoOpProfiler, PyTorchProfiler
+from gravitorch.utils.seed import get_random_seed
 
 
 def increment_epoch_handler(engine: BaseEngine) -> None:
@@ -51,7 +57,7 @@ def test_vanilla_training_loop_set_grad_to_none(set_grad_to_none: bool) -> None:
 
 
 def test_vanilla_training_loop_set_grad_to_none_default() -> None:
-    assert not VanillaTrainingLoop()._set_grad_to_none
+    assert VanillaTrainingLoop()._set_grad_to_none
 
 
 def test_vanilla_training_loop_batch_device_placement_cpu() -> None:
@@ -65,6 +71,143 @@ def test_vanilla_training_loop_batch_device_placement_default() -> None:
     assert isinstance(VanillaTrainingLoop()._batch_device_placement, AutoDevicePlacement)
 
 
+@mark.parametrize("prefetch_batches", (True, False))
+def test_vanilla_training_loop_prefetch_batches(prefetch_batches: bool) -> None:
+    assert (
+        VanillaTrainingLoop(prefetch_batches=prefetch_batches)._prefetch_batches == prefetch_batches
+    )
+
+
+def test_vanilla_training_loop_prefetch_batches_default() -> None:
+    assert not VanillaTrainingLoop()._prefetch_batches
+
+
+@mark.parametrize("grad_accum_steps", (1, 2, 4))
+def test_vanilla_training_loop_grad_accum_steps(grad_accum_steps: int) -> None:
+    assert (
+        VanillaTrainingLoop(grad_accum_steps=grad_accum_steps)._grad_accum_steps == grad_accum_steps
+    )
+
+
+def test_vanilla_training_loop_grad_accum_steps_default() -> None:
+    assert VanillaTrainingLoop()._grad_accum_steps == 1
+
+
+def test_vanilla_training_loop_grad_accum_steps_incorrect() -> None:
+    with raises(ValueError, match="grad_accum_steps has to be greater or equal to 1"):
+        VanillaTrainingLoop(grad_accum_steps=0)
+
+
+def test_vanilla_training_loop_next_accumulation_step_1() -> None:
+    loop = VanillaTrainingLoop()
+    optimizer = Mock(spec=Optimizer)
+    assert loop._next_accumulation_step(optimizer)
+    assert loop._next_accumulation_step(optimizer)
+    assert optimizer.zero_grad.call_count == 2
+
+
+def test_vanilla_training_loop_next_accumulation_step_3() -> None:
+    loop = VanillaTrainingLoop(grad_accum_steps=3)
+    optimizer = Mock(spec=Optimizer)
+    assert [loop._next_accumulation_step(optimizer) for _ in range(6)] == [
+        False,
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+    assert optimizer.zero_grad.call_count == 2
+
+
+def test_vanilla_training_loop_scale_loss_1() -> None:
+    assert VanillaTrainingLoop()._scale_loss(torch.tensor(6.0)).equal(torch.tensor(6.0))
+
+
+def test_vanilla_training_loop_scale_loss_3() -> None:
+    assert (
+        VanillaTrainingLoop(grad_accum_steps=3)
+        ._scale_loss(torch.tensor(6.0))
+        .equal(torch.tensor(2.0))
+    )
+
+
+def test_vanilla_training_loop_backward_context_ddp_no_update() -> None:
+    model = Mock(spec=DistributedDataParallel, no_sync=Mock(return_value="no_sync"))
+    assert VanillaTrainingLoop()._backward_context(model, is_update_step=False) == "no_sync"
+
+
+def test_vanilla_training_loop_backward_context_ddp_update() -> None:
+    model = Mock(spec=DistributedDataParallel)
+    assert isinstance(
+        VanillaTrainingLoop()._backward_context(model, is_update_step=True), nullcontext
+    )
+    model.no_sync.assert_not_called()
+
+
+def test_vanilla_training_loop_backward_context_not_ddp() -> None:
+    assert isinstance(
+        VanillaTrainingLoop()._backward_context(nn.Linear(4, 6), is_update_step=False),
+        nullcontext,
+    )
+
+
+def test_vanilla_training_loop_send_batch_to_device() -> None:
+    device_placement = Mock(spec=ManualDevicePlacement, send=Mock(return_value=2))
+    assert (
+        VanillaTrainingLoop(batch_device_placement=device_placement)._send_batch_to_device(1) == 2
+    )
+    device_placement.send.assert_called_once_with(1)
+
+
+def test_vanilla_training_loop_send_batch_to_device_prefetch_batches() -> None:
+    device_placement = Mock(spec=ManualDevicePlacement)
+    loop = VanillaTrainingLoop(batch_device_placement=device_placement, prefetch_batches=True)
+    assert loop._send_batch_to_device(1) == 1
+    device_placement.send.assert_not_called()
+
+
+def test_vanilla_training_loop_channels_last_default() -> None:
+    assert not VanillaTrainingLoop()._channels_last
+
+
+def test_vanilla_training_loop_send_batch_to_device_channels_last() -> None:
+    loop = VanillaTrainingLoop(
+        batch_device_placement=ManualDevicePlacement("cpu"), channels_last=True
+    )
+    batch = loop._send_batch_to_device(
+        {ct.INPUT: torch.ones(2, 3, 4, 5), ct.TARGET: torch.ones(2, dtype=torch.long)}
+    )
+    assert batch[ct.INPUT].is_contiguous(memory_format=torch.channels_last)
+    assert batch[ct.TARGET].equal(torch.ones(2, dtype=torch.long))
+
+
+def test_vanilla_training_loop_send_batch_to_device_prefetch_batches_channels_last() -> None:
+    device_placement = Mock(spec=ManualDevicePlacement)
+    loop = VanillaTrainingLoop(
+        batch_device_placement=device_placement, prefetch_batches=True, channels_last=True
+    )
+    batch = loop._send_batch_to_device(torch.ones(2, 3, 4, 5))
+    assert batch.is_contiguous(memory_format=torch.channels_last)
+    device_placement.send.assert_not_called()
+
+
+def test_vanilla_training_loop_prepare_model_optimizer_data_loader_channels_last() -> None:
+    engine = create_dummy_engine()
+    engine.model.conv = nn.Conv2d(3, 4, kernel_size=3)
+    VanillaTrainingLoop(channels_last=True)._prepare_model_optimizer_data_loader(engine)
+    assert engine.model.conv.weight.is_contiguous(memory_format=torch.channels_last)
+
+
+def test_vanilla_training_loop_prepare_model_optimizer_data_loader_channels_last_once() -> None:
+    engine = create_dummy_engine()
+    loop = VanillaTrainingLoop(channels_last=True)
+    with patch("gravitorch.loops.training.vanilla._model_to_channels_last") as convert_mock:
+        loop._prepare_model_optimizer_data_loader(engine)
+        loop._prepare_model_optimizer_data_loader(engine)
+        convert_mock.assert_called_once_with(engine.model)
+
+
 @mark.parametrize("tag", ("pre-training", "custom name"))
 def test_vanilla_training_loop_prefix(tag: str) -> None:
     assert VanillaTrainingLoop(tag=tag)._tag == tag
@@ -140,6 +283,78 @@ def test_vanilla_training_loop_profiler_tensorboard() -> None:
     )
 
 
+def test_vanilla_training_loop_train_enable_foreach_implementation() -> None:
+    engine = create_dummy_engine()
+    with patch(
+        "gravitorch.loops.training.basic.enable_foreach_implementation"
+    ) as enable_foreach_mock:
+        VanillaTrainingLoop().train(engine)
+        enable_foreach_mock.assert_called_once_with(engine.optimizer)
+
+
+def test_vanilla_training_loop_train_barrier_not_distributed() -> None:
+    engine = create_dummy_engine()
+    with patch("gravitorch.loops.training.basic.dist.barrier") as barrier_mock:
+        VanillaTrainingLoop().train(engine)
+        barrier_mock.assert_not_called()
+
+
+def test_vanilla_training_loop_train_barrier_distributed() -> None:
+    engine = create_dummy_engine()
+    with patch("gravitorch.loops.training.basic.dist.is_distributed", lambda *args: True):
+        with patch("gravitorch.loops.training.basic.dist.barrier") as barrier_mock:
+            VanillaTrainingLoop().train(engine)
+            assert barrier_mock.call_count == 2
+
+
+def test_vanilla_training_loop_train_random_seed() -> None:
+    engine = create_dummy_engine()
+    with patch("gravitorch.loops.training.basic.manual_seed") as manual_seed_mock:
+        VanillaTrainingLoop().train(engine)
+        manual_seed_mock.assert_called_once_with(
+            get_random_seed(engine.random_seed + engine.epoch + engine.max_epochs * 0)
+        )
+
+
+def test_vanilla_training_loop_train_show_optimizer_parameters_once() -> None:
+    engine = create_dummy_engine()
+    training_loop = VanillaTrainingLoop()
+    with patch(
+        "gravitorch.loops.training.basic.show_optimizer_parameters_per_group"
+    ) as show_mock, patch(
+        "gravitorch.loops.training.basic.log_optimizer_parameters_per_group"
+    ) as log_mock:
+        training_loop.train(engine)
+        training_loop.train(engine)
+        show_mock.assert_called_once_with(engine.optimizer)
+        assert log_mock.call_count == 2
+
+
+def test_vanilla_training_loop_train_show_optimizer_parameters_new_group() -> None:
+    engine = create_dummy_engine()
+    training_loop = VanillaTrainingLoop()
+    with patch("gravitorch.loops.training.basic.show_optimizer_parameters_per_group") as show_mock:
+        training_loop.train(engine)
+        engine.optimizer.add_param_group({"params": [nn.Parameter(torch.ones(2))]})
+        training_loop.train(engine)
+        assert show_mock.call_count == 2
+
+
+def test_vanilla_training_loop_get_parameters() -> None:
+    training_loop = VanillaTrainingLoop()
+    model = nn.Linear(4, 6)
+    parameters = training_loop._get_parameters(model)
+    assert parameters == list(model.parameters())
+    assert training_loop._get_parameters(model) is parameters
+
+
+def test_vanilla_training_loop_get_parameters_new_model() -> None:
+    training_loop = VanillaTrainingLoop()
+    training_loop._get_parameters(nn.Linear(4, 6))
+    model = nn.Linear(6, 6)
+    assert training_loop._get_parameters(model) == list(model.parameters())
+
+
 @mark.parametrize("device", get_available_devices())
 def test_vanilla_training_loop_train(device: str) -> None:
     device = torch.device(device)
@@ -154,6 +369,33 @@ def test_vanilla_training_loop_train(device: str) -> None:
     assert len(loss_history.get_recent_history()) == 1
 
 
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_training_loop_train_prefetch_batches(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    VanillaTrainingLoop(
+        batch_device_placement=ManualDevicePlacement(device), prefetch_batches=True
+    ).train(engine)
+    assert engine.model.training
+    assert engine.epoch == -1
+    assert engine.iteration == 3
+    loss_history = engine.get_history(f"train/{ct.LOSS}")
+    assert isinstance(loss_history, MinScalarHistory)
+    assert isinstance(loss_history.get_last_value(), float)
+    assert len(loss_history.get_recent_history()) == 1
+
+
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_training_loop_train_not_main_process(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    with patch("gravitorch.loops.training.basic.dist.get_rank", lambda *args: 1):
+        VanillaTrainingLoop(batch_device_placement=ManualDevicePlacement(device)).train(engine)
+    assert engine.epoch == -1
+    assert engine.iteration == 3
+    assert isinstance(engine.get_history(f"train/{ct.LOSS}").get_last_value(), float)
+
+
 @mark.parametrize("device", get_available_devices())
 def test_vanilla_training_loop_train_loss_nan(device: str) -> None:
     device = torch.device(device)
@@ -340,6 +582,15 @@ def test_vanilla_training_loop_train_with_profiler(device: str) -> None:
     assert profiler.__enter__().step.call_count == 4
 
 
+def test_vanilla_training_loop_train_noop_observer_and_profiler() -> None:
+    with patch.object(NoOpLoopObserver, "update") as update_mock, patch.object(
+        NoOpProfiler, "step"
+    ) as step_mock:
+        VanillaTrainingLoop().train(create_dummy_engine())
+        update_mock.assert_not_called()
+        step_mock.assert_not_called()
+
+
 def test_vanilla_training_loop_load_state_dict() -> None:
     VanillaTrainingLoop().load_state_dict({})  # Verify it does not raise error
 
@@ -427,6 +678,30 @@ def test_vanilla_training_loop_train_one_batch_clip_grad_norm(device: str) -> No
     assert out[ct.LOSS].device == device
 
 
+def test_vanilla_training_loop_train_one_batch_grad_accum_steps() -> None:
+    engine = Mock(spec=BaseEngine)
+    model = DummyClassificationModel()
+    optimizer = Mock(spec=Optimizer)
+    loop = VanillaTrainingLoop(grad_accum_steps=2)
+    batch = {ct.INPUT: torch.ones(8, 4), ct.TARGET: torch.ones(8, dtype=torch.long)}
+    loop._train_one_batch(engine=engine, model=model, optimizer=optimizer, batch=batch)
+    optimizer.step.assert_not_called()
+    loop._train_one_batch(engine=engine, model=model, optimizer=optimizer, batch=batch)
+    optimizer.step.assert_called_once_with()
+    optimizer.zero_grad.assert_called_once()
+
+
+@mark.parametrize("device", get_available_devices())
+def test_vanilla_training_loop_train_grad_accum_steps(device: str) -> None:
+    device = torch.device(device)
+    engine = create_dummy_engine(device=device)
+    VanillaTrainingLoop(
+        batch_device_placement=ManualDevicePlacement(device), grad_accum_steps=2
+    ).train(engine)
+    assert engine.iteration == 3
+    assert isinstance(engine.get_history(f"train/{ct.LOSS}").get_last_value(), float)
+
+
 def test_vanilla_training_loop_train_one_batch_loss_nan() -> None:
     engine = Mock(spec=BaseEngine)
     model = Mock(spec=nn.Module, return_value={ct.LOSS: torch.tensor(math.nan)})
@@ -446,3 +721,66 @@ def test_vanilla_training_loop_train_one_batch_loss_nan() -> None:
         ((EngineEvents.TRAIN_FORWARD_COMPLETED,), {}),
         ((EngineEvents.TRAIN_ITERATION_COMPLETED,), {}),
     ]
+    optimizer.step.assert_not_called()
+
+
+def test_vanilla_training_loop_train_one_batch_loss_nan_check_without_kernel() -> None:
+    with patch("torch.isnan") as isnan_mock:
+        VanillaTrainingLoop()._train_one_batch(
+            engine=Mock(spec=BaseEngine),
+            model=DummyClassificationModel(),
+            optimizer=Mock(spec=Optimizer),
+            batch={ct.INPUT: torch.ones(8, 4), ct.TARGET: torch.ones(8, dtype=torch.long)},
+        )
+        isnan_mock.assert_not_called()
+
+
+def test_vanilla_training_loop_train_check_ddp_model_once() -> None:
+    engine = create_dummy_engine()
+    training_loop = VanillaTrainingLoop()
+    with patch("gravitorch.loops.training.basic._check_ddp_model") as check_mock:
+        training_loop.train(engine)
+        training_loop.train(engine)
+        check_mock.assert_called_once_with(engine.model)
+
+
+######################################
+#     Tests for _check_ddp_model     #
+######################################
+
+
+def test_check_ddp_model_gradient_as_bucket_view_false(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        _check_ddp_model(Mock(spec=DistributedDataParallel, gradient_as_bucket_view=False))
+        assert len(caplog.messages) == 1
+
+
+def test_check_ddp_model_gradient_as_bucket_view_true(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        _check_ddp_model(Mock(spec=DistributedDataParallel, gradient_as_bucket_view=True))
+        assert not caplog.messages
+
+
+def test_check_ddp_model_not_ddp(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        _check_ddp_model(nn.Linear(4, 6))
+        assert not caplog.messages
+
+
+#############################################
+#     Tests for _model_to_channels_last     #
+#############################################
+
+
+def test_model_to_channels_last() -> None:
+    model = nn.Sequential(nn.Conv2d(3, 4, kernel_size=3), nn.Linear(4, 2))
+    _model_to_channels_last(model)
+    assert model[0].weight.is_contiguous(memory_format=torch.channels_last)
+
+
+def test_model_to_channels_last_ddp(caplog: LogCaptureFixture) -> None:
+    model = Mock(spec=DistributedDataParallel)
+    with caplog.at_level(logging.WARNING):
+        _model_to_channels_last(model)
+        assert len(caplog.messages) == 1
+    model.to.assert_not_called()
@@ -1,3 +1,5 @@
+from unittest.mock import Mock, patch
+
 import torch
 from coola import objects_are_allclose
 from pytest import fixture
@@ -29,3 +31,36 @@ def test_inverse_square_root_lr(optimizer: Optimizer) -> None:
     assert objects_are_allclose(lrs[0], [0.01])
     assert objects_are_allclose(lrs[4], [0.004472135954999579])
     assert objects_are_allclose(lrs[9], [0.0031622776601683794])
+
+
+def test_inverse_square_root_lr_multiple_param_groups() -> None:
+    optimizer = torch.optim.SGD(
+        [
+            {"params": nn.Linear(4, 6).parameters()},
+            {"params": nn.Linear(6, 2).parameters(), "lr": 0.1},
+        ],
+        lr=BASE_LR,
+    )
+    scheduler = InverseSquareRootLR(optimizer)
+    lrs = []
+    for _ in range(5):
+        lrs.append(scheduler.get_last_lr())
+        optimizer.step()
+        scheduler.step()
+    assert objects_are_allclose(lrs[0], [0.01, 0.1])
+    assert objects_are_allclose(lrs[4], [0.004472135954999579, 0.04472135954999579])
+
+
+def test_inverse_square_root_lr_factor_computed_once() -> None:
+    optimizer = torch.optim.SGD(
+        [{"params": nn.Linear(4, 6).parameters()}, {"params": nn.Linear(6, 2).parameters()}],
+        lr=BASE_LR,
+    )
+    scheduler = InverseSquareRootLR(optimizer)
+    with patch(
+        "gravitorch.lr_schedulers.invsqrt.inverse_square_root", Mock(return_value=0.5)
+    ) as factor_mock:
+        optimizer.step()
+        scheduler.step()
+        factor_mock.assert_called_once_with(1)
+    assert scheduler.get_last_lr() == [0.005, 0.005]
@@ -809,6 +809,23 @@ def test_top_k_accuracy_forward_top_1_2_3_partially_correct(device: str, mode: s
     }
 
 
+@mark.parametrize("device", get_available_devices())
+@mark.parametrize("mode", MODES)
+def test_top_k_accuracy_forward_top_3_1_partially_correct(device: str, mode: str) -> None:
+    device = torch.device(device)
+    metric = TopKAccuracy(mode, topk=(3, 1)).to(device=device)
+    metric(
+        prediction=torch.tensor([[0, 2, 1, 3], [3, 2, 1, 0]], device=device),
+        target=torch.tensor([1, 2], device=device),
+    )
+    assert metric.value() == {
+        f"{mode}/acc_top_3_accuracy": 1.0,
+        f"{mode}/acc_top_3_num_predictions": 2,
+        f"{mode}/acc_top_1_accuracy": 0.0,
+        f"{mode}/acc_top_1_num_predictions": 2,
+    }
+
+
 @mark.parametrize("device", get_available_devices())
 @mark.parametrize("mode", MODES)
 def test_top_k_accuracy_forward_top_1_incorrect(device: str, mode: str) -> None:
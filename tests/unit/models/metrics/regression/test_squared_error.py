@@ -228,6 +228,60 @@ def test_squared_error_forward_dtypes(
     }
 
 
+@mark.parametrize("device", get_available_devices())
+@mark.parametrize("mode", MODES)
+def test_squared_error_forward_float16_long(device: str, mode: str) -> None:
+    device = torch.device(device)
+    metric = SquaredError(mode).to(device=device)
+    metric(
+        torch.zeros(2, 2, device=device, dtype=torch.float16),
+        torch.full((2, 2), 100000, device=device, dtype=torch.long),
+    )
+    assert metric.value() == {
+        f"{mode}/sq_err_mean": 1e10,
+        f"{mode}/sq_err_max": 1e10,
+        f"{mode}/sq_err_min": 1e10,
+        f"{mode}/sq_err_sum": 4e10,
+        f"{mode}/sq_err_num_predictions": 4,
+    }
+
+
+@mark.parametrize("device", get_available_devices())
+@mark.parametrize("mode", MODES)
+def test_squared_error_forward_bool(device: str, mode: str) -> None:
+    device = torch.device(device)
+    metric = SquaredError(mode).to(device=device)
+    metric(
+        torch.tensor([True, False], device=device),
+        torch.tensor([False, False], device=device),
+    )
+    assert metric.value() == {
+        f"{mode}/sq_err_mean": 0.5,
+        f"{mode}/sq_err_max": 1.0,
+        f"{mode}/sq_err_min": 0.0,
+        f"{mode}/sq_err_sum": 1.0,
+        f"{mode}/sq_err_num_predictions": 2,
+    }
+
+
+@mark.parametrize("device", get_available_devices())
+@mark.parametrize("mode", MODES)
+def test_squared_error_forward_float64(device: str, mode: str) -> None:
+    device = torch.device(device)
+    metric = SquaredError(mode).to(device=device)
+    metric(
+        torch.full((2, 2), 1e8 + 1, device=device, dtype=torch.float64),
+        torch.full((2, 2), 1e8, device=device, dtype=torch.float64),
+    )
+    assert metric.value() == {
+        f"{mode}/sq_err_mean": 1.0,
+        f"{mode}/sq_err_max": 1.0,
+        f"{mode}/sq_err_min": 1.0,
+        f"{mode}/sq_err_sum": 4.0,
+        f"{mode}/sq_err_num_predictions": 4,
+    }
+
+
 @mark.parametrize("device", get_available_devices())
 @mark.parametrize("mode", MODES)
 def test_squared_error_forward_state(device: str, mode: str) -> None:
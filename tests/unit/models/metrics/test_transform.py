@@ -175,6 +175,22 @@ def test_transformed_prediction_target_forward_transformations(
     }
 
 
+@mark.parametrize("device", get_available_devices())
+def test_transformed_prediction_target_forward_target_transform_only(device: str) -> None:
+    device = torch.device(device)
+    metric = TransformedPredictionTarget(AbsoluteError(ct.EVAL), target_transform=Asinh()).to(
+        device=device
+    )
+    metric(torch.ones(2, 2, device=device).asinh(), torch.ones(2, 2, device=device))
+    assert metric.value() == {
+        f"{ct.EVAL}/abs_err_mean": 0.0,
+        f"{ct.EVAL}/abs_err_max": 0.0,
+        f"{ct.EVAL}/abs_err_min": 0.0,
+        f"{ct.EVAL}/abs_err_sum": 0.0,
+        f"{ct.EVAL}/abs_err_num_predictions": 4,
+    }
+
+
 def test_transformed_prediction_target_reset_mock() -> None:
     metric = Mock(spec=BaseMetric)
     assert TransformedPredictionTarget(metric).reset() is None
@@ -1,18 +1,66 @@
 import logging
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from pytest import LogCaptureFixture, mark
 from torch import nn
-from torch.optim import SGD, Adagrad, Adam, Rprop
+from torch.optim import SGD, Adagrad, Adam, Optimizer, Rprop
 
 from gravitorch.optimizers.utils import (
+    enable_foreach_implementation,
     get_learning_rate_per_group,
     get_weight_decay_per_group,
     log_optimizer_parameters_per_group,
     show_optimizer_parameters_per_group,
 )
+from gravitorch.testing import cuda_available
 from gravitorch.utils.exp_trackers import EpochStep
 
+##################################################
+#     Tests of enable_foreach_implementation     #
+##################################################
+
+
+def test_enable_foreach_implementation_cpu() -> None:
+    optimizer = Adam(nn.Linear(4, 6).parameters())
+    enable_foreach_implementation(optimizer)
+    assert optimizer.param_groups[0]["foreach"] is None
+
+
+@cuda_available
+def test_enable_foreach_implementation_cuda() -> None:
+    optimizer = Adam(nn.Linear(4, 6).cuda().parameters())
+    enable_foreach_implementation(optimizer)
+    assert optimizer.param_groups[0]["foreach"]
+
+
+@cuda_available
+def test_enable_foreach_implementation_cuda_foreach_false() -> None:
+    optimizer = Adam(nn.Linear(4, 6).cuda().parameters(), foreach=False)
+    enable_foreach_implementation(optimizer)
+    assert not optimizer.param_groups[0]["foreach"]
+
+
+@cuda_available
+def test_enable_foreach_implementation_cuda_2_groups() -> None:
+    model = nn.Sequential(nn.Linear(4, 6), nn.Linear(6, 6).cuda())
+    optimizer = SGD(
+        [
+            {"params": model[0].parameters()},
+            {"params": model[1].parameters()},
+        ],
+        lr=0.01,
+    )
+    enable_foreach_implementation(optimizer)
+    assert optimizer.param_groups[0]["foreach"] is None
+    assert optimizer.param_groups[1]["foreach"]
+
+
+def test_enable_foreach_implementation_no_foreach_option() -> None:
+    optimizer = Optimizer(nn.Linear(4, 6).parameters(), defaults={})
+    enable_foreach_implementation(optimizer)
+    assert "foreach" not in optimizer.param_groups[0]
+
+
 ################################################
 #     Tests of get_learning_rate_per_group     #
 ################################################
@@ -84,6 +132,15 @@ def test_show_optimizer_parameters_per_group_sgd_1_group(caplog: LogCaptureFixtu
         )
 
 
+def test_show_optimizer_parameters_per_group_log_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING):
+        optimizer = SGD(nn.Linear(4, 6).parameters(), lr=0.01)
+        with patch("gravitorch.optimizers.utils.tabulate") as tabulate_mock:
+            show_optimizer_parameters_per_group(optimizer)
+            tabulate_mock.assert_not_called()
+        assert not caplog.messages
+
+
 def test_show_optimizer_parameters_per_group_sgd_2_groups(caplog: LogCaptureFixture) -> None:
     with caplog.at_level(logging.INFO):
         model = nn.Sequential(nn.Linear(4, 6), nn.Linear(6, 6))
@@ -1,12 +1,21 @@
+import copy
 import logging
+import pickle
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
 import torch
-from pytest import LogCaptureFixture, mark
+from pytest import LogCaptureFixture, mark, raises
 from torch.backends import cuda, cudnn
 
 from gravitorch.rsrc import PyTorchConfig, PyTorchCudaBackend, PyTorchCudnnBackend
-from gravitorch.rsrc.pytorch import PyTorchCudaBackendState, PyTorchCudnnBackendState
+from gravitorch.rsrc.pytorch import (
+    _CUDA_INFO_GETTERS,
+    _CUDNN_INFO_GETTERS,
+    PyTorchCudaBackendState,
+    PyTorchCudnnBackendState,
+    _set_preferred_linalg_backend,
+)
 
 ###################################
 #     Tests for PyTorchConfig     #
@@ -50,6 +59,38 @@ def test_pytorch_cuda_backend_state_create() -> None:
     assert isinstance(state.preferred_linalg_backend, torch._C._LinalgBackend)
 
 
+def test_pytorch_cuda_backend_state_frozen() -> None:
+    state = PyTorchCudaBackendState.create()
+    with raises(FrozenInstanceError):
+        state.allow_tf32 = False
+
+
+def test_pytorch_cuda_backend_state_no_dict() -> None:
+    assert not hasattr(PyTorchCudaBackendState.create(), "__dict__")
+
+
+def test_pytorch_cuda_backend_state_deepcopy() -> None:
+    state = PyTorchCudaBackendState(
+        allow_tf32=True,
+        allow_fp16_reduced_precision_reduction=False,
+        flash_sdp_enabled=True,
+        math_sdp_enabled=False,
+        preferred_linalg_backend="default",
+    )
+    assert copy.deepcopy(state) == state
+
+
+def test_pytorch_cuda_backend_state_pickle() -> None:
+    state = PyTorchCudaBackendState(
+        allow_tf32=True,
+        allow_fp16_reduced_precision_reduction=False,
+        flash_sdp_enabled=True,
+        math_sdp_enabled=False,
+        preferred_linalg_backend="default",
+    )
+    assert pickle.loads(pickle.dumps(state)) == state
+
+
 def test_pytorch_cuda_backend_state_restore() -> None:
     with PyTorchCudaBackend():
         PyTorchCudaBackendState(
@@ -66,6 +107,16 @@ def test_pytorch_cuda_backend_state_restore() -> None:
         assert isinstance(cuda.preferred_linalg_library(), torch._C._LinalgBackend)
 
 
+def test_pytorch_cuda_backend_state_restore_same_preferred_linalg_backend() -> None:
+    state = PyTorchCudaBackendState.create()
+    with patch(
+        "torch.backends.cuda.preferred_linalg_library",
+        side_effect=lambda *args: state.preferred_linalg_backend,
+    ) as mock:
+        state.restore()
+        mock.assert_called_once_with()
+
+
 ########################################
 #     Tests for PyTorchCudaBackend     #
 ########################################
@@ -75,6 +126,31 @@ def test_pytorch_cuda_backend_str() -> None:
     assert str(PyTorchCudaBackend()).startswith("PyTorchCudaBackend(")
 
 
+def test_pytorch_cuda_backend_settings_default() -> None:
+    assert PyTorchCudaBackend()._settings == ()
+
+
+def test_pytorch_cuda_backend_settings() -> None:
+    assert PyTorchCudaBackend(allow_tf32=True, math_sdp_enabled=False)._settings == (
+        ("allow_tf32", True),
+        ("math_sdp_enabled", False),
+    )
+
+
+def test_pytorch_cuda_backend_configure_same_value() -> None:
+    with patch("torch.backends.cuda.enable_flash_sdp") as mock:
+        with PyTorchCudaBackend(flash_sdp_enabled=cuda.flash_sdp_enabled()):
+            mock.assert_not_called()
+        mock.assert_not_called()
+
+
+def test_pytorch_cuda_backend_configure_different_value() -> None:
+    value = not cuda.flash_sdp_enabled()
+    with patch("torch.backends.cuda.enable_flash_sdp") as mock:
+        PyTorchCudaBackend(flash_sdp_enabled=value)._configure()
+        mock.assert_called_once_with(value)
+
+
 @mark.parametrize("allow_tf32", (True, False))
 def test_pytorch_cuda_backend_allow_tf32(allow_tf32: bool) -> None:
     default = cuda.matmul.allow_tf32
@@ -139,6 +215,11 @@ def test_pytorch_cuda_backend_log_info_true(caplog: LogCaptureFixture) -> None:
         assert len(caplog.messages) == 3
 
 
+def test_pytorch_cuda_backend_info_getters_sorted() -> None:
+    names = [name for name, _ in _CUDA_INFO_GETTERS]
+    assert names == sorted(names)
+
+
 def test_pytorch_cuda_backend_log_info_false(caplog: LogCaptureFixture) -> None:
     with caplog.at_level(logging.INFO):
         with PyTorchCudaBackend():
@@ -154,6 +235,39 @@ def test_pytorch_cuda_backend_reentrant() -> None:
     assert cuda.matmul.allow_tf32 == default
 
 
+def test_pytorch_cuda_backend_state() -> None:
+    resource = PyTorchCudaBackend()
+    assert resource._state is None
+    with resource:
+        assert isinstance(resource._state, PyTorchCudaBackendState)
+        assert resource._outer_states == []
+    assert resource._state is None
+
+
+def test_pytorch_cuda_backend_state_reentrant() -> None:
+    resource = PyTorchCudaBackend()
+    with resource:
+        state = resource._state
+        with resource:
+            assert resource._state is not state
+            assert resource._outer_states == [state]
+        assert resource._state is state
+        assert resource._outer_states == []
+    assert resource._state is None
+
+
+def test_pytorch_cuda_backend_reentrant_restore_order() -> None:
+    default = cuda.matmul.allow_tf32
+    with PyTorchCudaBackend(allow_tf32=not default):
+        resource = PyTorchCudaBackend(allow_tf32=default)
+        with resource:
+            with resource:
+                assert cuda.matmul.allow_tf32 == default
+            assert cuda.matmul.allow_tf32 == default
+        assert cuda.matmul.allow_tf32 == (not default)
+    assert cuda.matmul.allow_tf32 == default
+
+
 ##############################################
 #     Tests for PyTorchCudnnBackendState     #
 ##############################################
@@ -168,6 +282,30 @@ def test_pytorch_cudnn_backend_state_create() -> None:
     assert isinstance(state.enabled, bool)
 
 
+def test_pytorch_cudnn_backend_state_frozen() -> None:
+    state = PyTorchCudnnBackendState.create()
+    with raises(FrozenInstanceError):
+        state.allow_tf32 = False
+
+
+def test_pytorch_cudnn_backend_state_no_dict() -> None:
+    assert not hasattr(PyTorchCudnnBackendState.create(), "__dict__")
+
+
+def test_pytorch_cudnn_backend_state_deepcopy() -> None:
+    state = PyTorchCudnnBackendState(
+        allow_tf32=True, benchmark=False, benchmark_limit=10, deterministic=True, enabled=False
+    )
+    assert copy.deepcopy(state) == state
+
+
+def test_pytorch_cudnn_backend_state_pickle() -> None:
+    state = PyTorchCudnnBackendState(
+        allow_tf32=True, benchmark=False, benchmark_limit=10, deterministic=True, enabled=False
+    )
+    assert pickle.loads(pickle.dumps(state)) == state
+
+
 def test_pytorch_cudnn_backend_state_restore() -> None:
     with PyTorchCudaBackend():
         PyTorchCudnnBackendState(
@@ -193,6 +331,26 @@ def test_pytorch_cudnn_backend_str() -> None:
     assert str(PyTorchCudnnBackend()).startswith("PyTorchCudnnBackend(")
 
 
+def test_pytorch_cudnn_backend_settings_default() -> None:
+    assert PyTorchCudnnBackend()._settings == ()
+
+
+def test_pytorch_cudnn_backend_configure_same_value() -> None:
+    benchmark = cudnn.benchmark
+    with patch("gravitorch.rsrc.pytorch.setattr", create=True) as mock:
+        with PyTorchCudnnBackend(benchmark=benchmark):
+            mock.assert_not_called()
+        mock.assert_not_called()
+    assert cudnn.benchmark == benchmark
+
+
+def test_pytorch_cudnn_backend_settings() -> None:
+    assert PyTorchCudnnBackend(benchmark=True, enabled=False)._settings == (
+        ("benchmark", True),
+        ("enabled", False),
+    )
+
+
 @mark.parametrize("allow_tf32", (True, False))
 def test_pytorch_cudnn_backend_allow_tf32(allow_tf32: bool) -> None:
     default = cudnn.allow_tf32
@@ -240,6 +398,11 @@ def test_pytorch_cudnn_backend_log_info_true(caplog: LogCaptureFixture) -> None:
         assert len(caplog.messages) == 3
 
 
+def test_pytorch_cudnn_backend_info_getters_sorted() -> None:
+    names = [name for name, _ in _CUDNN_INFO_GETTERS]
+    assert names == sorted(names)
+
+
 def test_pytorch_cudnn_backend_log_info_false(caplog: LogCaptureFixture) -> None:
     with caplog.at_level(logging.INFO):
         with PyTorchCudnnBackend():
@@ -253,3 +416,63 @@ def test_pytorch_cudnn_backend_reentrant() -> None:
     with resource, resource:
         assert cudnn.allow_tf32
     assert cudnn.allow_tf32 == default
+
+
+def test_pytorch_cudnn_backend_state() -> None:
+    resource = PyTorchCudnnBackend()
+    assert resource._state is None
+    with resource:
+        assert isinstance(resource._state, PyTorchCudnnBackendState)
+        assert resource._outer_states == []
+    assert resource._state is None
+
+
+def test_pytorch_cudnn_backend_state_reentrant() -> None:
+    resource = PyTorchCudnnBackend()
+    with resource:
+        state = resource._state
+        with resource:
+            assert resource._state is not state
+            assert resource._outer_states == [state]
+        assert resource._state is state
+        assert resource._outer_states == []
+    assert resource._state is None
+
+
+def test_pytorch_cudnn_backend_reentrant_restore_order() -> None:
+    default = cudnn.allow_tf32
+    with PyTorchCudnnBackend(allow_tf32=not default):
+        resource = PyTorchCudnnBackend(allow_tf32=default)
+        with resource:
+            with resource:
+                assert cudnn.allow_tf32 == default
+            assert cudnn.allow_tf32 == default
+        assert cudnn.allow_tf32 == (not default)
+    assert cudnn.allow_tf32 == default
+
+
+###################################################
+#     Tests for _set_preferred_linalg_backend     #
+###################################################
+
+
+def test_set_preferred_linalg_backend_str() -> None:
+    with patch("torch.backends.cuda.preferred_linalg_library") as mock:
+        _set_preferred_linalg_backend("cusolver")
+        mock.assert_called_once_with("cusolver")
+
+
+def test_set_preferred_linalg_backend_same_enum() -> None:
+    value = cuda.preferred_linalg_library()
+    with patch("torch.backends.cuda.preferred_linalg_library", return_value=value) as mock:
+        _set_preferred_linalg_backend(value)
+        mock.assert_called_once_with()
+
+
+def test_set_preferred_linalg_backend_different_enum() -> None:
+    with patch(
+        "torch.backends.cuda.preferred_linalg_library",
+        return_value=torch._C._LinalgBackend.Default,
+    ) as mock:
+        _set_preferred_linalg_backend(torch._C._LinalgBackend.Cusolver)
+        mock.assert_called_with(torch._C._LinalgBackend.Cusolver)
@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import torch
+from pytest import mark
 
 from gravitorch.utils.device_placement import AutoDevicePlacement
 
@@ -23,3 +24,12 @@ def test_auto_device_placement_device_cpu() -> None:
 )
 def test_auto_device_placement_device_cuda() -> None:
     assert AutoDevicePlacement().device == torch.device("cuda:0")
+
+
+@patch(
+    "gravitorch.utils.device_placement.auto.dist.device",
+    lambda *args, **kwargs: torch.device("cpu"),
+)
+@mark.parametrize("non_blocking", (True, False))
+def test_auto_device_placement_non_blocking(non_blocking: bool) -> None:
+    assert AutoDevicePlacement(non_blocking=non_blocking)._non_blocking == non_blocking
@@ -32,6 +32,16 @@ def test_manual_device_placement_send(device: str) -> None:
     assert device_placement.send(torch.ones(2, 3)).equal(torch.ones(2, 3, device=device))
 
 
+def test_manual_device_placement_non_blocking_default() -> None:
+    assert not ManualDevicePlacement("cpu")._non_blocking
+
+
+@mark.parametrize("device", get_available_devices())
+def test_manual_device_placement_send_non_blocking(device: str) -> None:
+    device_placement = ManualDevicePlacement(torch.device(device), non_blocking=True)
+    assert device_placement.send(torch.ones(2, 3)).equal(torch.ones(2, 3, device=device))
+
+
 ########################################
 #     Tests for CpuDevicePlacement     #
 ########################################
@@ -55,6 +65,11 @@ def test_cuda_device_placement_device_index(index: int) -> None:
     assert CudaDevicePlacement(index).device == torch.device(f"cuda:{index}")
 
 
+@mark.parametrize("non_blocking", (True, False))
+def test_cuda_device_placement_non_blocking(non_blocking: bool) -> None:
+    assert CudaDevicePlacement(non_blocking=non_blocking)._non_blocking == non_blocking
+
+
 ########################################
 #     Tests for MpsDevicePlacement     #
 ########################################
@@ -0,0 +1,115 @@
+from unittest.mock import Mock, patch
+
+import torch
+from pytest import mark
+
+from gravitorch.testing import cuda_available
+from gravitorch.utils import get_available_devices
+from gravitorch.utils.device_placement import (
+    CpuDevicePlacement,
+    CudaStreamPrefetcher,
+    ManualDevicePlacement,
+    NoOpDevicePlacement,
+)
+from gravitorch.utils.device_placement.prefetcher import (
+    _has_unpinned_cpu_tensor,
+    _record_stream,
+)
+
+##########################################
+#     Tests for CudaStreamPrefetcher     #
+##########################################
+
+
+def test_cuda_stream_prefetcher_str() -> None:
+    assert str(CudaStreamPrefetcher([], NoOpDevicePlacement())).startswith("CudaStreamPrefetcher(")
+
+
+def test_cuda_stream_prefetcher_len() -> None:
+    assert len(CudaStreamPrefetcher([1, 2, 3], NoOpDevicePlacement())) == 3
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_cuda_stream_prefetcher_iter_no_cuda() -> None:
+    device_placement = Mock(spec=CpuDevicePlacement, send=Mock(side_effect=lambda x: x + 1))
+    assert list(CudaStreamPrefetcher([1, 2, 3], device_placement)) == [2, 3, 4]
+
+
+@patch("torch.cuda.is_available", lambda *args, **kwargs: False)
+def test_cuda_stream_prefetcher_iter_no_cuda_empty() -> None:
+    assert list(CudaStreamPrefetcher([], NoOpDevicePlacement())) == []
+
+
+@mark.parametrize("device", get_available_devices())
+def test_cuda_stream_prefetcher_iter(device: str) -> None:
+    device = torch.device(device)
+    batches = list(
+        CudaStreamPrefetcher(
+            [torch.ones(2, 3), {"key": torch.zeros(4)}], ManualDevicePlacement(device)
+        )
+    )
+    assert len(batches) == 2
+    assert batches[0].equal(torch.ones(2, 3, device=device))
+    assert batches[1]["key"].equal(torch.zeros(4, device=device))
+
+
+@cuda_available
+def test_cuda_stream_prefetcher_iter_pinned_memory() -> None:
+    device = torch.device("cuda:0")
+    batches = list(
+        CudaStreamPrefetcher(
+            [torch.ones(2, 3).pin_memory() for _ in range(3)],
+            ManualDevicePlacement(device, non_blocking=True),
+        )
+    )
+    assert len(batches) == 3
+    for batch in batches:
+        assert batch.equal(torch.ones(2, 3, device=device))
+
+
+@cuda_available
+def test_cuda_stream_prefetcher_iter_empty() -> None:
+    assert list(CudaStreamPrefetcher([], ManualDevicePlacement("cuda:0"))) == []
+
+
+##############################################
+#     Tests for _has_unpinned_cpu_tensor     #
+##############################################
+
+
+def test_has_unpinned_cpu_tensor_tensor() -> None:
+    assert _has_unpinned_cpu_tensor(torch.ones(2, 3))
+
+
+def test_has_unpinned_cpu_tensor_nested() -> None:
+    assert _has_unpinned_cpu_tensor({"key": [1, (torch.ones(2, 3),)]})
+
+
+def test_has_unpinned_cpu_tensor_pinned() -> None:
+    tensor = Mock(spec=torch.Tensor, device=torch.device("cpu"), is_pinned=Mock(return_value=True))
+    assert not _has_unpinned_cpu_tensor([tensor])
+
+
+@mark.parametrize("data", (1, "abc", [1, 2], {"key": 1}, None))
+def test_has_unpinned_cpu_tensor_no_tensor(data) -> None:
+    assert not _has_unpinned_cpu_tensor(data)
+
+
+####################################
+#     Tests for _record_stream     #
+####################################
+
+
+def test_record_stream_nested() -> None:
+    tensor1 = Mock(spec=torch.Tensor, is_cuda=True)
+    tensor2 = Mock(spec=torch.Tensor, is_cuda=True)
+    stream = Mock()
+    _record_stream({"key1": [tensor1, 1], "key2": (tensor2,)}, stream)
+    tensor1.record_stream.assert_called_once_with(stream)
+    tensor2.record_stream.assert_called_once_with(stream)
+
+
+def test_record_stream_cpu_tensor() -> None:
+    tensor = Mock(spec=torch.Tensor, is_cuda=False)
+    _record_stream(tensor, Mock())
+    tensor.record_stream.assert_not_called()
@@ -82,6 +82,10 @@ def test_periodic_condition_freq_3() -> None:
     ]
 
 
+def test_periodic_condition_no_dict() -> None:
+    assert not hasattr(PeriodicCondition(3), "__dict__")
+
+
 ############################################
 #     Tests for EpochPeriodicCondition     #
 ############################################
@@ -132,6 +136,10 @@ def test_epoch_periodic_condition_false() -> None:
     assert not condition()
 
 
+def test_epoch_periodic_condition_no_dict() -> None:
+    assert not hasattr(EpochPeriodicCondition(Mock(), 2), "__dict__")
+
+
 ################################################
 #     Tests for IterationPeriodicCondition     #
 ################################################
@@ -182,3 +190,7 @@ def test_iteration_periodic_condition_false() -> None:
     assert not condition()
     engine.iteration = 1
     assert not condition()
+
+
+def test_iteration_periodic_condition_no_dict() -> None:
+    assert not hasattr(IterationPeriodicCondition(Mock(), 2), "__dict__")
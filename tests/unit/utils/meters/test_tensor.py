@@ -5,7 +5,7 @@ import torch
 from coola import objects_are_equal
 from pytest import mark, raises
 
-from gravitorch.distributed.ddp import MAX, MIN, SUM
+from gravitorch.distributed.ddp import MAX, SUM
 from gravitorch.utils.meters import (
     EmptyMeterError,
     ExtremaTensorMeter,
@@ -90,6 +90,12 @@ def test_mean_tensor_meter_update_long() -> None:
     assert meter.equal(MeanTensorMeter(count=2, total=5))
 
 
+def test_mean_tensor_meter_update_float16() -> None:
+    meter = MeanTensorMeter()
+    meter.update(torch.ones(100000, dtype=torch.float16))
+    assert meter.equal(MeanTensorMeter(count=100000, total=100000.0))
+
+
 def test_mean_tensor_meter_update_nan() -> None:
     meter = MeanTensorMeter()
     meter.update(torch.tensor(float("NaN")))
@@ -164,7 +170,15 @@ def test_mean_tensor_meter_all_reduce_sum_reduce() -> None:
         meter_reduced = meter.all_reduce()
         assert meter.equal(MeanTensorMeter(count=10, total=122.0))
         assert meter_reduced.equal(MeanTensorMeter(count=11, total=123.0))
-        assert reduce_mock.call_args_list == [((10, SUM), {}), ((122.0, SUM), {})]
+        assert len(reduce_mock.call_args_list) == 1
+        assert reduce_mock.call_args.args[0].equal(torch.tensor([10.0, 122.0], dtype=torch.float64))
+        assert reduce_mock.call_args.args[1] == SUM
+
+
+def test_mean_tensor_meter_all_reduce_int() -> None:
+    total = MeanTensorMeter(count=8, total=22).all_reduce().sum()
+    assert total == 22
+    assert isinstance(total, int)
 
 
 def test_mean_tensor_meter_clone() -> None:
@@ -363,12 +377,15 @@ def test_extrema_tensor_meter_all_reduce_ops() -> None:
     with patch("gravitorch.utils.meters.tensor.sync_reduce", reduce_mock):
         meter_reduced = meter.all_reduce()
         assert meter.equal(ExtremaTensorMeter(count=6, min_value=-2.0, max_value=5.0))
-        assert meter_reduced.equal(ExtremaTensorMeter(count=7, min_value=-1.0, max_value=6.0))
-        assert reduce_mock.call_args_list == [
-            ((6, SUM), {}),
-            ((-2.0, MIN), {}),
-            ((5.0, MAX), {}),
-        ]
+        assert meter_reduced.equal(ExtremaTensorMeter(count=7, min_value=-3.0, max_value=6.0))
+        assert len(reduce_mock.call_args_list) == 2
+        assert reduce_mock.call_args_list[0].args == (6, SUM)
+        assert (
+            reduce_mock.call_args_list[1]
+            .args[0]
+            .equal(torch.tensor([2.0, 5.0], dtype=torch.float64))
+        )
+        assert reduce_mock.call_args_list[1].args[1] == MAX
 
 
 def test_extrema_tensor_meter_clone() -> None:
@@ -532,6 +549,12 @@ def test_tensor_meter_all_reduce_empty() -> None:
     assert meter_reduced.equal(TensorMeter())
 
 
+def test_tensor_meter_all_reduce_int() -> None:
+    total = TensorMeter(count=8, total=22, min_value=0.0, max_value=5.0).all_reduce().total
+    assert total == 22
+    assert isinstance(total, int)
+
+
 def test_tensor_meter_all_reduce_sum_reduce() -> None:
     meter = TensorMeter(count=10, total=122.0, min_value=-5.0, max_value=20.0)
     reduce_mock = Mock(side_effect=lambda variable, op: variable + 1)
@@ -539,14 +562,21 @@ def test_tensor_meter_all_reduce_sum_reduce() -> None:
         meter_reduced = meter.all_reduce()
         assert meter.equal(TensorMeter(count=10, total=122.0, min_value=-5.0, max_value=20.0))
         assert meter_reduced.equal(
-            TensorMeter(count=11, total=123.0, min_value=-4.0, max_value=21.0)
+            TensorMeter(count=11, total=123.0, min_value=-6.0, max_value=21.0)
         )
-        assert reduce_mock.call_args_list == [
-            ((10, SUM), {}),
-            ((122.0, SUM), {}),
-            ((-5.0, MIN), {}),
-            ((20.0, MAX), {}),
-        ]
+        assert len(reduce_mock.call_args_list) == 2
+        assert (
+            reduce_mock.call_args_list[0]
+            .args[0]
+            .equal(torch.tensor([10.0, 122.0], dtype=torch.float64))
+        )
+        assert reduce_mock.call_args_list[0].args[1] == SUM
+        assert (
+            reduce_mock.call_args_list[1]
+            .args[0]
+            .equal(torch.tensor([5.0, 20.0], dtype=torch.float64))
+        )
+        assert reduce_mock.call_args_list[1].args[1] == MAX
 
 
 def test_tensor_meter_average() -> None:
@@ -712,6 +742,25 @@ def test_tensor_meter_update() -> None:
     assert meter.equal(TensorMeter(count=8, total=20.0, min_value=0.0, max_value=5.0))
 
 
+def test_tensor_meter_update_float16() -> None:
+    meter = TensorMeter()
+    meter.update(torch.ones(100000, dtype=torch.float16))
+    assert meter.equal(TensorMeter(count=100000, total=100000.0, min_value=1.0, max_value=1.0))
+
+
+def test_tensor_meter_update_mps() -> None:
+    tensor = Mock(spec=torch.Tensor, device=torch.device("mps"))
+    tensor.is_floating_point.return_value = True
+    tensor.sum.return_value = torch.tensor(6.0)
+    tensor.numel.return_value = 4
+    with patch("gravitorch.utils.meters.tensor.torch.aminmax") as aminmax_mock:
+        aminmax_mock.return_value = (torch.tensor(0.0), torch.tensor(3.0))
+        meter = TensorMeter()
+        meter.update(tensor)
+    tensor.sum.assert_called_once_with(dtype=torch.float32)
+    assert meter.equal(TensorMeter(count=4, total=6.0, min_value=0.0, max_value=3.0))
+
+
 def test_tensor_meter_update_nan() -> None:
     meter = TensorMeter()
     meter.update(torch.tensor(float("NaN")))
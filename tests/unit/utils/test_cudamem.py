@@ -44,6 +44,27 @@ def test_log_max_cuda_memory_allocated_cuda(caplog: LogCaptureFixture) -> None:
         assert len(caplog.messages) == 1
 
 
+@patch("gravitorch.utils.cudamem.torch.cuda.is_available", lambda *args: True)
+@patch("gravitorch.utils.cudamem.torch.cuda.max_memory_allocated", lambda *args, **kwargs: 12)
+def test_log_max_cuda_memory_allocated_total_memory(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO), patch(
+        "gravitorch.utils.cudamem.torch.cuda.mem_get_info"
+    ) as mem_get_info_mock:
+        log_max_cuda_memory_allocated(total_memory=1000)
+        assert caplog.messages[0] == "Max CUDA memory allocated: 12.00 B / 1,000.00 B (1.20%)"
+        mem_get_info_mock.assert_not_called()
+
+
+@patch("gravitorch.utils.cudamem.torch.cuda.is_available", lambda *args: True)
+def test_log_max_cuda_memory_allocated_info_disabled(caplog: LogCaptureFixture) -> None:
+    with caplog.at_level(logging.WARNING), patch(
+        "gravitorch.utils.cudamem.torch.cuda.max_memory_allocated"
+    ) as max_memory_allocated_mock:
+        log_max_cuda_memory_allocated()
+        assert not caplog.messages
+        max_memory_allocated_mock.assert_not_called()
+
+
 @patch("gravitorch.utils.cudamem.torch.cuda.is_available", lambda *args: False)
 def test_log_max_cuda_memory_allocated_no_cuda(caplog: LogCaptureFixture) -> None:
     with caplog.at_level(logging.INFO):
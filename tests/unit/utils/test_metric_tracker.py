@@ -3,7 +3,7 @@ from unittest.mock import Mock
 
 import numpy as np
 import torch
-from pytest import LogCaptureFixture
+from pytest import LogCaptureFixture, mark, raises
 
 from gravitorch.utils.exp_trackers import EpochStep
 from gravitorch.utils.metric_tracker import ScalarMetricTracker
@@ -13,6 +13,20 @@ from gravitorch.utils.metric_tracker import ScalarMetricTracker
 #########################################
 
 
+def test_scalar_metric_tracker_repr() -> None:
+    assert repr(ScalarMetricTracker()) == "ScalarMetricTracker(sync_every=1)"
+
+
+@mark.parametrize("sync_every", (0, 1, 5))
+def test_scalar_metric_tracker_sync_every(sync_every: int) -> None:
+    assert ScalarMetricTracker(sync_every=sync_every)._sync_every == sync_every
+
+
+def test_scalar_metric_tracker_sync_every_incorrect() -> None:
+    with raises(ValueError, match="sync_every has to be greater or equal to 0"):
+        ScalarMetricTracker(sync_every=-1)
+
+
 def test_scalar_metric_tracker_update_multiple_values() -> None:
     tracker = ScalarMetricTracker()
     tracker.update(
@@ -76,3 +90,64 @@ def test_scalar_metric_tracker_log_average_value_with_engine_and_prefix() -> Non
     engine.log_metrics.assert_called_once_with(
         {"train/metric0": 2, "train/metric1": 11}, step=EpochStep(0)
     )
+
+
+def test_scalar_metric_tracker_update_sync_every_0() -> None:
+    tracker = ScalarMetricTracker(sync_every=0)
+    tracker.update(
+        {"int": 42, "tensor_float": torch.tensor(1.5), "tensor_dim_1": torch.tensor([3])}
+    )
+    tracker.update(
+        {"int": 40, "tensor_float": torch.tensor(2.5), "tensor_dim_1": torch.tensor([5])}
+    )
+    assert len(tracker._metrics) == 1
+    assert len(tracker._buffers["tensor_float"]) == 2
+    tracker.sync()
+    assert not tracker._buffers
+    assert tracker._metrics["int"].average() == 41
+    assert tracker._metrics["tensor_float"].average() == 2.0
+    assert tracker._metrics["tensor_dim_1"].average() == 4
+
+
+def test_scalar_metric_tracker_update_sync_every_2() -> None:
+    tracker = ScalarMetricTracker(sync_every=2)
+    tracker.update({"metric": torch.tensor(1.0)})
+    assert "metric" not in tracker._metrics
+    tracker.update({"metric": torch.tensor(3.0)})
+    assert not tracker._buffers
+    assert tracker._metrics["metric"].average() == 2.0
+    tracker.update({"metric": torch.tensor(5.0)})
+    assert tracker._metrics["metric"].count == 2
+
+
+def test_scalar_metric_tracker_update_sync_every_0_nan() -> None:
+    tracker = ScalarMetricTracker(sync_every=0)
+    tracker.update({"metric": torch.tensor(1.0)})
+    tracker.update({"metric": torch.tensor(float("nan"))})
+    tracker.sync()
+    assert tracker._metrics["metric"].count == 1
+
+
+def test_scalar_metric_tracker_update_sync_every_0_mixed_dtypes() -> None:
+    tracker = ScalarMetricTracker(sync_every=0)
+    tracker.update({"metric": torch.tensor(1.0)})
+    tracker.update({"metric": torch.tensor(3)})
+    tracker.sync()
+    assert tracker._metrics["metric"].count == 2
+    assert tracker._metrics["metric"].sum() == 4.0
+
+
+def test_scalar_metric_tracker_update_sync_every_0_detach() -> None:
+    tracker = ScalarMetricTracker(sync_every=0)
+    tracker.update({"metric": torch.ones(1, requires_grad=True).sum()})
+    assert not tracker._buffers["metric"][0].requires_grad
+
+
+def test_scalar_metric_tracker_log_average_value_sync_every_0() -> None:
+    tracker = ScalarMetricTracker(sync_every=0)
+    tracker.update({"metric0": torch.tensor(3), "metric1": 12})
+    tracker.update({"metric0": torch.tensor(1), "metric1": 10})
+    engine = Mock()
+    engine.epoch = 0
+    tracker.log_average_value(engine=engine)
+    engine.log_metrics.assert_called_once_with({"metric1": 11, "metric0": 2}, step=EpochStep(0))
@@ -117,7 +117,7 @@ def test_torch_random_seed_setter_manual_seed_with_cuda() -> None:
     seed_setter = TorchRandomSeedSetter()
     with patch("torch.cuda.manual_seed_all") as mock_manual_seed_all:
         seed_setter.manual_seed(42)
-        mock_manual_seed_all.assert_called_with(42)
+        mock_manual_seed_all.assert_called_once_with(42)
 
 
 ######################################
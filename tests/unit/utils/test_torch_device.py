@@ -1,6 +1,6 @@
 from collections import OrderedDict
 from collections.abc import Mapping
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import torch
 from coola import objects_are_equal
@@ -108,3 +108,20 @@ def test_send_to_device_dict_nested(device: str) -> None:
     assert objects_are_equal(
         obj, {"list": [1, torch.zeros(2, 3, device=device)], "tensor": torch.ones(4, device=device)}
     )
+
+
+@mark.parametrize("device", get_available_devices())
+def test_send_to_device_non_blocking(device: str) -> None:
+    device = torch.device(device)
+    obj = move_to_device(
+        {"list": [1, torch.zeros(2, 3)], "tensor": torch.ones(4)}, device, non_blocking=True
+    )
+    assert objects_are_equal(
+        obj, {"list": [1, torch.zeros(2, 3, device=device)], "tensor": torch.ones(4, device=device)}
+    )
+
+
+def test_send_to_device_non_blocking_tensor() -> None:
+    tensor = Mock(spec=torch.Tensor)
+    move_to_device(tensor, torch.device("cpu"), non_blocking=True)
+    tensor.to.assert_called_once_with(torch.device("cpu"), non_blocking=True)